@@ -0,0 +1,137 @@
+"""
+Async vs sync throughput benchmark
+Runs the same search scenarios sequentially on the sync page objects and concurrently on the async ones
+"""
+from playwright.sync_api import sync_playwright
+from typing import Dict, List
+import argparse
+import asyncio
+import json
+import time
+
+from pages.home_page import HomePage
+from utils import async_runner
+from utils.local_server import LocalSite
+
+ROUTES = [("RTM", "MAD"), ("AMS", "BCN"), ("EIN", "LHR"), ("RTM", "FCO"), ("AMS", "PRG"), ("EIN", "VIE")]
+
+
+def build_scenarios(count: int) -> List[Dict]:
+    """
+    Cycle the benchmark routes into count scenarios
+
+    Args:
+        count: Number of scenarios
+
+    Returns:
+        Scenario mappings with origin, destination and weeks
+    """
+    scenarios = []
+    for index in range(count):
+        origin, destination = ROUTES[index % len(ROUTES)]
+        scenarios.append({"origin": origin, "destination": destination, "weeks": 1 + index % 3})
+    return scenarios
+
+
+def run_sync(url: str, scenarios: List[Dict], headless: bool) -> List[Dict]:
+    """
+    Run scenarios one after another on the sync page objects
+
+    Args:
+        url: Landing page URL
+        scenarios: Scenario mappings
+        headless: Run the browser headless
+
+    Returns:
+        Results shaped like async_runner results
+    """
+    results = []
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        for scenario in scenarios:
+            started = time.perf_counter()
+            context = browser.new_context()
+            try:
+                homepage = HomePage(context.new_page(), url=url)
+                homepage.open()
+                homepage.select_trip_type("one-way")
+                homepage.set_departure_airport(scenario["origin"])
+                homepage.set_arrival_airport(scenario["destination"])
+                homepage.set_departure_date(scenario["weeks"])
+                homepage.uncheck_accommodation_option()
+                homepage.click_search_button()
+                passed = homepage.verify_redirected_to_results()
+            except Exception:
+                passed = False
+            finally:
+                context.close()
+            results.append({
+                "scenario": scenario,
+                "passed": passed,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            })
+        browser.close()
+    return results
+
+
+def summarize(label: str, results: List[Dict], elapsed: float) -> Dict:
+    """
+    Throughput figures for one run
+
+    Args:
+        label: Run name
+        results: Scenario results
+        elapsed: Wall time of the whole run in seconds
+
+    Returns:
+        Scenario count, passes, wall time and scenarios per minute
+    """
+    return {
+        "run": label,
+        "scenarios": len(results),
+        "passed": sum(1 for result in results if result["passed"]),
+        "wall_s": round(elapsed, 2),
+        "scenarios_per_min": round(len(results) / elapsed * 60, 1) if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sync and async search throughput")
+    parser.add_argument("--scenarios", type=int, default=8, help="Number of scenarios to run")
+    parser.add_argument("--concurrency", type=int, default=async_runner.DEFAULT_CONCURRENCY,
+                        help="Concurrent contexts for the async run")
+    parser.add_argument("--url", help="Landing page URL (defaults to the local stand-in)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--output", help="Write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    site = None if args.url else LocalSite()
+    url = args.url or site.start()
+    scenarios = build_scenarios(args.scenarios)
+    try:
+        started = time.perf_counter()
+        sync_results = run_sync(url, scenarios, headless=not args.headed)
+        sync_summary = summarize("sync", sync_results, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        async_results = asyncio.run(
+            async_runner.run(url, scenarios, concurrency=args.concurrency, headless=not args.headed)
+        )
+        async_summary = summarize(f"async x{args.concurrency}", async_results, time.perf_counter() - started)
+    finally:
+        if site:
+            site.stop()
+
+    summaries = [sync_summary, async_summary]
+    for summary in summaries:
+        print(f"{summary['run']:<10} {summary['passed']}/{summary['scenarios']} passed  "
+              f"{summary['wall_s']:>7.2f} s  {summary['scenarios_per_min']:>6.1f} scenarios/min")
+    if sync_summary["wall_s"]:
+        print(f"Speed-up: {sync_summary['wall_s'] / max(async_summary['wall_s'], 0.01):.2f}x")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summaries, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Page-object action benchmark
+Times each HomePage action many times against the local stand-in and compares p50/p95/p99 with a baseline
+"""
+from datetime import datetime
+from playwright.sync_api import sync_playwright
+from typing import Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from utils.local_server import LocalSite
+from utils.profiles import PROFILES
+from utils.step_timing import percentiles
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_PATH = "benchmarks/baselines/page_actions.json"
+DEFAULT_RESULTS_DIR = "reports/benchmarks"
+DEFAULT_THRESHOLD_PCT = 20.0
+DEFAULT_MIN_DELTA_MS = 5.0
+PERCENTILES = (50, 95, 99)
+
+# Run in this order on one fresh page per iteration; each action needs the ones before it
+ACTIONS: List[Tuple[str, Callable[[HomePage], None]]] = [
+    ("open", lambda homepage: homepage.open()),
+    ("select_trip_type", lambda homepage: homepage.select_trip_type("one-way")),
+    ("set_departure_airport", lambda homepage: homepage.set_departure_airport("RTM")),
+    ("set_arrival_airport", lambda homepage: homepage.set_arrival_airport("MAD")),
+    ("set_departure_date", lambda homepage: homepage.set_departure_date(1)),
+    ("uncheck_accommodation_option", lambda homepage: homepage.uncheck_accommodation_option()),
+    ("click_search_button", lambda homepage: homepage.click_search_button()),
+]
+
+
+def run_benchmark(url: str, iterations: int, warmup: int, headless: bool) -> Dict:
+    """
+    Time every action over a number of search flows
+
+    Each iteration uses a new context, so open() always pays for consent and
+    a cold page. Iterations that do not end on the results page are counted
+    as failures and left out of the samples, since HomePage actions log
+    rather than raise and a failed action would look fast.
+
+    Args:
+        url: Landing page URL
+        iterations: Measured iterations
+        warmup: Unmeasured iterations run first
+        headless: Run the browser headless
+
+    Returns:
+        Result document with settings, failures and percentiles per action
+    """
+    profile = PROFILES["benchmark"]
+    BasePage.default_timeout = profile["timeout"]
+    BasePage.typing_delay = profile["typing_delay"]
+
+    samples: Dict[str, List[float]] = {name: [] for name, _ in ACTIONS}
+    failures = 0
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=headless)
+        for iteration in range(warmup + iterations):
+            context = browser.new_context()
+            try:
+                homepage = HomePage(context.new_page(), url=url)
+                timings = {}
+                for name, action in ACTIONS:
+                    started = time.perf_counter()
+                    action(homepage)
+                    timings[name] = (time.perf_counter() - started) * 1000
+                passed = homepage.is_results_page()
+            except Exception as e:
+                logger.error(f"Iteration {iteration} failed: {e}")
+                passed = False
+            finally:
+                context.close()
+            if iteration < warmup:
+                continue
+            if not passed:
+                failures += 1
+                continue
+            for name, duration_ms in timings.items():
+                samples[name].append(duration_ms)
+        browser.close()
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "url": url,
+        "iterations": iterations,
+        "warmup": warmup,
+        "failures": failures,
+        "profile": "benchmark",
+        "actions": {
+            name: {
+                "samples": len(values),
+                "mean": round(sum(values) / len(values), 1) if values else None,
+                **percentiles(values, PERCENTILES),
+            }
+            for name, values in samples.items()
+        },
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold_pct: float = DEFAULT_THRESHOLD_PCT,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> List[str]:
+    """
+    Find percentiles that got slower than the baseline allows
+
+    A percentile regresses when it grew by more than threshold_pct percent
+    and by more than min_delta_ms, which keeps millisecond-scale actions
+    from failing on noise.
+
+    Args:
+        current: Result document of this run
+        baseline: Stored result document
+        threshold_pct: Allowed growth in percent
+        min_delta_ms: Growth in milliseconds always tolerated
+
+    Returns:
+        One message per regression; empty if there are none
+    """
+    regressions = []
+    if current["failures"] > baseline.get("failures", 0):
+        regressions.append(f"failures: {baseline.get('failures', 0)} -> {current['failures']}")
+    for name, stats in current["actions"].items():
+        base = baseline["actions"].get(name)
+        if not base:
+            continue
+        for point in PERCENTILES:
+            key = f"p{point}"
+            if stats.get(key) is None or not base.get(key):
+                continue
+            delta = stats[key] - base[key]
+            growth_pct = delta / base[key] * 100
+            if growth_pct > threshold_pct and delta > min_delta_ms:
+                regressions.append(f"{name} {key}: {base[key]:.1f} -> {stats[key]:.1f} ms (+{growth_pct:.0f}%)")
+    return regressions
+
+
+def print_table(current: Dict, baseline: Optional[Dict] = None) -> None:
+    """
+    Print percentiles per action, with the baseline p95 alongside if given
+
+    Args:
+        current: Result document of this run
+        baseline: Stored result document
+    """
+    header = f"{'action':<30}{'n':>4}{'p50':>10}{'p95':>10}{'p99':>10}"
+    print(header + (f"{'base p95':>12}" if baseline else ""))
+    for name, stats in current["actions"].items():
+        line = f"{name:<30}{stats['samples']:>4}" + "".join(
+            f"{stats.get(f'p{point}', float('nan')):>10.1f}" for point in PERCENTILES
+        )
+        if baseline:
+            base = baseline["actions"].get(name, {})
+            line += f"{base.get('p95', float('nan')):>12.1f}"
+        print(line)
+    print(f"failed iterations: {current['failures']}/{current['iterations']}")
+
+
+def write_json(document: Dict, path: str) -> None:
+    """
+    Write a result document
+
+    Args:
+        document: Result document
+        path: Target file
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HomePage actions against the local stand-in")
+    parser.add_argument("--iterations", type=int, default=30, help="Measured search flows")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured search flows run first")
+    parser.add_argument("--url", help="Landing page URL (defaults to the local stand-in)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--results", help="Compare this stored result file instead of running")
+    parser.add_argument("--output", help="Result file (defaults to reports/benchmarks/page_actions_<timestamp>.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                        help="Fail when a percentile grows by more than this many percent")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore growth below this many milliseconds")
+    args = parser.parse_args()
+
+    if args.results:
+        with open(args.results, "r", encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        site = None if args.url else LocalSite()
+        url = args.url or site.start()
+        try:
+            current = run_benchmark(url, args.iterations, args.warmup, headless=not args.headed)
+        finally:
+            if site:
+                site.stop()
+        output = args.output or os.path.join(
+            DEFAULT_RESULTS_DIR, f"page_actions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        write_json(current, output)
+        print(f"Results written to {output}")
+
+    if args.save_baseline:
+        write_json(current, args.baseline)
+        print_table(current)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_table(current, baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline} - run with --save-baseline to create one")
+        return
+
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"Regressions above {args.threshold:.0f}% against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"No regressions above {args.threshold:.0f}% against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
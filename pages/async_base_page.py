@@ -0,0 +1,454 @@
+"""
+Async Base Page Object Model
+Asyncio counterpart of BasePage for driving many pages on one event loop
+"""
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from typing import Any, List, Optional
+import asyncio
+import logging
+import time
+
+from pages.base_page import BasePage, FixedSleepError
+from utils.selector_cache import SelectorCache
+from utils.wait_stats import wait_stats
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+    """
+    Base class for async page objects
+
+    Mirrors the BasePage method surface; every method that talks to the
+    browser is a coroutine. Action tracing is not wired in because spans are
+    timed per thread, not per task.
+    """
+
+    @property
+    def strict_waits(self) -> bool:
+        """Strict waits switch, shared with the sync page objects"""
+        return BasePage.strict_waits
+
+    @property
+    def selector_cache(self) -> Optional[SelectorCache]:
+        """Learned selector cache, shared with the sync page objects"""
+        return BasePage.selector_cache
+
+    @property
+    def typing_delay(self) -> int:
+        """Per-key typing delay of the execution profile, shared with the sync page objects"""
+        return BasePage.typing_delay
+
+    def __init__(self, page: Page):
+        """
+        Initialize async base page
+
+        Args:
+            page: Playwright async page instance
+        """
+        self.page = page
+        self.timeout = BasePage.default_timeout
+
+    async def navigate_to(self, url: str) -> None:
+        """
+        Navigate to specified URL
+
+        Args:
+            url: URL to navigate to
+        """
+        logger.info(f"Navigating to: {url}")
+        await self.page.goto(url, wait_until="domcontentloaded")
+
+    async def click(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        Click element with optional custom timeout
+
+        Args:
+            selector: CSS selector or locator
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Clicking element: {selector}")
+        await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+        await self.page.click(selector)
+
+    async def fill(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
+        """
+        Fill input field with text
+
+        Args:
+            selector: CSS selector or locator
+            text: Text to fill
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Filling element {selector} with: {text}")
+        await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+        await self.page.fill(selector, text)
+
+    async def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
+        """
+        Get text content of element
+
+        Args:
+            selector: CSS selector or locator
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            Text content of element
+        """
+        timeout = timeout or self.timeout
+        await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+        return await self.page.text_content(selector)
+
+    async def is_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
+        """
+        Check if element is visible
+
+        Without a timeout this is an instant snapshot check (is_visible_now);
+        with one it waits up to that bound (wait_visible).
+
+        Args:
+            selector: CSS selector or locator
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if visible, False otherwise
+        """
+        if timeout is None:
+            return await self.is_visible_now(selector)
+        return await self.wait_visible(selector, timeout)
+
+    async def is_visible_now(self, selector: str) -> bool:
+        """
+        Snapshot check whether element is visible right now, without waiting
+
+        Args:
+            selector: CSS selector or locator
+
+        Returns:
+            True if visible, False otherwise
+        """
+        try:
+            return await self.page.locator(selector).first.is_visible()
+        except Exception:
+            return False
+
+    async def wait_visible(self, selector: str, timeout: int) -> bool:
+        """
+        Wait a bounded time for element to become visible
+
+        Args:
+            selector: CSS selector or locator
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            True if visible within timeout, False otherwise
+        """
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"visible {selector}")
+            return False
+        except Exception:
+            return False
+
+    def _record_timeout(self, started: float, description: str) -> None:
+        """
+        Add time spent in a timed-out wait to the per-test counter
+
+        Args:
+            started: time.perf_counter() value when the wait began
+            description: What was being waited for
+        """
+        wait_stats.record_timeout((time.perf_counter() - started) * 1000, description)
+
+    async def resolve_first(self, selectors: List[str], timeout: Optional[int] = None,
+                            cache_key: Optional[str] = None) -> Optional[str]:
+        """
+        Race all fallback selectors at once and return the winner
+
+        Same contract as BasePage.resolve_first, including the learned
+        selector cache. Cache reads and writes take a file lock, so they run
+        in a worker thread instead of blocking the event loop.
+
+        Args:
+            selectors: Fallback selectors in priority order
+            timeout: Custom timeout in milliseconds for the whole race
+            cache_key: Page action key for the learned selector cache
+
+        Returns:
+            Winning selector, or None if no candidate became visible
+        """
+        if not selectors:
+            return None
+        timeout = timeout or self.timeout
+        cache = self.selector_cache if cache_key else None
+        learned = None
+        if cache:
+            selectors = await asyncio.to_thread(cache.order, cache_key, selectors)
+            learned = await asyncio.to_thread(cache.get, cache_key)
+
+        candidates = [self.page.locator(f"{selector} >> visible=true") for selector in selectors]
+        winner = None
+        started = time.perf_counter()
+
+        # Fast path: learned selector is already on screen
+        if learned == selectors[0] and await candidates[0].count() > 0:
+            winner = selectors[0]
+        else:
+            combined = candidates[0]
+            for candidate in candidates[1:]:
+                combined = combined.or_(candidate)
+            try:
+                await combined.first.wait_for(state="attached", timeout=timeout)
+                for selector, candidate in zip(selectors, candidates):
+                    if await candidate.count() > 0:
+                        winner = selector
+                        break
+            except PlaywrightTimeoutError:
+                self._record_timeout(started, f"any of {selectors}")
+                logger.info(f"No candidate visible within {timeout} ms: {selectors}")
+
+        if winner:
+            logger.info(f"Resolved selector {selectors.index(winner) + 1}/{len(selectors)}: {winner}")
+        if cache:
+            await asyncio.to_thread(cache.record, cache_key, winner)
+        return winner
+
+    async def wait_for_url(self, pattern: str, timeout: Optional[int] = None) -> None:
+        """
+        Wait for URL to match pattern
+
+        Args:
+            pattern: URL pattern to wait for
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Waiting for URL pattern: {pattern}")
+        await self.page.wait_for_url(pattern, timeout=timeout)
+
+    def get_current_url(self) -> str:
+        """
+        Get current page URL
+
+        Returns:
+            Current URL
+        """
+        return self.page.url
+
+    async def wait_for_load_state(self, state: str = "load") -> None:
+        """
+        Wait for page load state
+
+        Args:
+            state: Load state to wait for (load, domcontentloaded, networkidle)
+        """
+        logger.info(f"Waiting for load state: {state}")
+        await self.page.wait_for_load_state(state)
+
+    async def screenshot(self, path: str) -> None:
+        """
+        Take screenshot of current page
+
+        Args:
+            path: Path to save screenshot
+        """
+        logger.info(f"Taking screenshot: {path}")
+        await self.page.screenshot(path=path)
+
+    async def press_key(self, selector: str, key: str) -> None:
+        """
+        Press keyboard key on element
+
+        Args:
+            selector: CSS selector or locator
+            key: Key to press
+        """
+        logger.info(f"Pressing key {key} on element: {selector}")
+        await self.page.press(selector, key)
+
+    async def select_option(self, selector: str, value: str) -> None:
+        """
+        Select option from dropdown
+
+        Args:
+            selector: CSS selector or locator
+            value: Value to select
+        """
+        logger.info(f"Selecting option {value} in: {selector}")
+        await self.page.select_option(selector, value)
+
+    async def check_checkbox(self, selector: str) -> None:
+        """
+        Check a checkbox
+
+        Args:
+            selector: CSS selector or locator
+        """
+        logger.info(f"Checking checkbox: {selector}")
+        if not await self.page.is_checked(selector):
+            await self.page.check(selector)
+
+    async def uncheck_checkbox(self, selector: str) -> None:
+        """
+        Uncheck a checkbox
+
+        Args:
+            selector: CSS selector or locator
+        """
+        logger.info(f"Unchecking checkbox: {selector}")
+        if await self.page.is_checked(selector):
+            await self.page.uncheck(selector)
+
+    async def hover(self, selector: str) -> None:
+        """
+        Hover over element
+
+        Args:
+            selector: CSS selector or locator
+        """
+        logger.info(f"Hovering over: {selector}")
+        await self.page.hover(selector)
+
+    async def wait_for_element(self, selector: str, state: str = "visible", timeout: Optional[int] = None) -> None:
+        """
+        Wait for element to reach specified state
+
+        Args:
+            selector: CSS selector or locator
+            state: State to wait for (attached, detached, visible, hidden)
+            timeout: Custom timeout in milliseconds
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Waiting for element {selector} to be {state}")
+        await self.page.wait_for_selector(selector, state=state, timeout=timeout)
+
+    async def sleep(self, milliseconds: int) -> None:
+        """
+        Fixed sleep - last resort when no DOM or network condition exists
+
+        Args:
+            milliseconds: Time to sleep in milliseconds
+
+        Raises:
+            FixedSleepError: If strict waits are enabled
+        """
+        if self.strict_waits:
+            raise FixedSleepError(
+                f"Fixed sleep of {milliseconds} ms used while strict waits are enabled"
+            )
+        logger.warning(f"Fixed sleep: {milliseconds} ms")
+        await self.page.wait_for_timeout(milliseconds)
+
+    async def wait_for_condition(self, expression: str, arg: Any = None, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until a JavaScript predicate evaluated in the page returns truthy
+
+        Args:
+            expression: JavaScript function or expression evaluated in the page
+            arg: Optional argument passed to the expression
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if the condition was met, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_function(expression, arg=arg, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"condition {expression[:80]}")
+            logger.warning(f"Condition not met within {timeout} ms: {expression[:80]}")
+            return False
+
+    async def wait_for_populated(self, selector: str, min_count: int = 1, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until at least min_count visible elements match a CSS selector
+
+        Args:
+            selector: Plain CSS selector (no Playwright pseudo-classes)
+            min_count: Minimum number of visible matches
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if the list was populated, False if it timed out
+        """
+        logger.info(f"Waiting for {min_count}+ elements: {selector}")
+        return await self.wait_for_condition(
+            """([selector, minCount]) => {
+                const visible = [...document.querySelectorAll(selector)]
+                    .filter(el => el.offsetWidth > 0 || el.offsetHeight > 0);
+                return visible.length >= minCount;
+            }""",
+            arg=[selector, min_count],
+            timeout=timeout,
+        )
+
+    async def wait_for_state(self, selector: str, state: str = "visible", timeout: Optional[int] = None) -> bool:
+        """
+        Wait for element state without raising on timeout
+
+        Args:
+            selector: CSS selector or locator
+            state: State to wait for (attached, detached, visible, hidden)
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if the state was reached, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(selector, state=state, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"{state} {selector}")
+            logger.warning(f"Element {selector} not {state} within {timeout} ms")
+            return False
+
+    async def wait_for_url_change(self, previous_url: str, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until the page URL differs from previous_url
+
+        Args:
+            previous_url: URL before the triggering action
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if the URL changed, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Waiting for URL to change from: {previous_url}")
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"URL change from {previous_url}")
+            logger.warning(f"URL did not change within {timeout} ms")
+            return False
+
+    async def wait_for_network_idle(self, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until there are no network connections for at least 500 ms
+
+        Args:
+            timeout: Custom timeout in milliseconds
+
+        Returns:
+            True if the network went idle, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            await self.page.wait_for_load_state("networkidle", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, "network idle")
+            logger.warning(f"Network not idle within {timeout} ms")
+            return False
@@ -0,0 +1,429 @@
+"""
+Async Kiwi.com Homepage Page Object Model
+Asyncio counterpart of HomePage sharing its locators and in-page scripts
+"""
+from pages.async_base_page import AsyncBasePage
+from pages.home_page import HomePage
+from pages.place_picker import PlaceNotFoundError, PlacePicker
+from playwright.async_api import Page
+from datetime import datetime, timedelta
+from typing import Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncHomePage(AsyncBasePage):
+    """Async Page Object Model for Kiwi.com homepage"""
+
+    # Locators and scripts are owned by HomePage so both paths stay in step
+    URL = HomePage.URL
+    SEARCH_FORM = HomePage.SEARCH_FORM
+    SUGGESTION_ROWS = HomePage.SUGGESTION_ROWS
+    CALENDAR_GRID = HomePage.CALENDAR_GRID
+    SET_DATES_BUTTON = HomePage.SET_DATES_BUTTON
+    ONE_WAY_OPTION = HomePage.ONE_WAY_OPTION
+    CLEAR_DEPARTURE_PLACES = HomePage.CLEAR_DEPARTURE_PLACES
+    DATE_FIELD = HomePage.DATE_FIELD
+    ACCOMMODATION_SECTION = HomePage.ACCOMMODATION_SECTION
+    RESULTS_URL_PATTERN = HomePage.RESULTS_URL_PATTERN
+    RESULTS_READY = HomePage.RESULTS_READY
+    NO_RESULTS_MESSAGE = HomePage.NO_RESULTS_MESSAGE
+    RESULTS_TIMEOUT = HomePage.RESULTS_TIMEOUT
+    PLACE_CHIP_CLOSE = HomePage.PLACE_CHIP_CLOSE
+    MODE_PICKER = HomePage.MODE_PICKER
+    RETURN_OPTION = HomePage.RETURN_OPTION
+    DEFAULT_TRIP_MODE = HomePage.DEFAULT_TRIP_MODE
+    DATE_CLEAR_SELECTORS = HomePage.DATE_CLEAR_SELECTORS
+    FORM_STATE_SCRIPT = HomePage.FORM_STATE_SCRIPT
+    COOKIE_SELECTORS = HomePage.COOKIE_SELECTORS
+    TRIP_TYPE_SELECTORS = HomePage.TRIP_TYPE_SELECTORS
+    DEPARTURE_SELECTORS = HomePage.DEPARTURE_SELECTORS
+    ARRIVAL_SELECTORS = HomePage.ARRIVAL_SELECTORS
+    CHECKBOX_SELECTORS = HomePage.CHECKBOX_SELECTORS
+    LABEL_SELECTORS = HomePage.LABEL_SELECTORS
+    SEARCH_SELECTORS = HomePage.SEARCH_SELECTORS
+    CONSENT_TIMEOUT = HomePage.CONSENT_TIMEOUT
+    CONSENT_TIMEOUT_WITH_SNAPSHOT = HomePage.CONSENT_TIMEOUT_WITH_SNAPSHOT
+    DAY_CELL_MARKER = HomePage.DAY_CELL_MARKER
+    FIND_DAY_CELL_SCRIPT = HomePage.FIND_DAY_CELL_SCRIPT
+    PLACE_MATCH_MARKER = PlacePicker.MATCH_MARKER
+    FIND_SUGGESTION_SCRIPT = PlacePicker.FIND_SUGGESTION_SCRIPT
+    PLACE_SETTLE_TIMEOUT = PlacePicker.SETTLE_TIMEOUT
+
+    def __init__(self, page: Page, url: Optional[str] = None, storage_state_path: Optional[str] = None):
+        """
+        Initialize async homepage
+
+        Args:
+            page: Playwright async page instance
+            url: Landing page URL (defaults to live Kiwi.com)
+            storage_state_path: Consented storage state the page's context was created with
+        """
+        super().__init__(page)
+        self.url = url or self.URL
+        self.storage_state_path = storage_state_path
+        self.search_started: Optional[float] = None
+        self.time_to_first_result_ms: Optional[float] = None
+        self.results_state: Optional[str] = None
+
+    async def open(self) -> None:
+        """Navigate to Kiwi.com homepage"""
+        await self.navigate_to(self.url)
+        await self.wait_for_load_state("domcontentloaded")
+        await self.wait_for_state(self.SEARCH_FORM, state="visible", timeout=10000)
+        await self._handle_cookie_consent()
+
+    async def _handle_cookie_consent(self) -> None:
+        """Handle cookie consent popup if present"""
+        try:
+            timeout = self.CONSENT_TIMEOUT_WITH_SNAPSHOT if self.storage_state_path else self.CONSENT_TIMEOUT
+            selector = await self.resolve_first(self.COOKIE_SELECTORS, timeout=timeout, cache_key="HomePage._handle_cookie_consent")
+            if selector:
+                logger.info(f"Clicking cookie consent: {selector}")
+                await self.click(selector)
+                await self.wait_for_state(selector, state="hidden", timeout=3000)
+                return
+
+            logger.info("No cookie consent popup found or already accepted")
+        except Exception as e:
+            logger.info(f"Cookie consent handling: {e}")
+
+    async def select_trip_type(self, trip_type: str) -> None:
+        """
+        Select trip type (one-way)
+
+        Args:
+            trip_type: Type of trip ('one-way')
+        """
+        logger.info(f"Selecting trip type: {trip_type}")
+
+        try:
+            if trip_type.lower() in ['one-way', 'oneway', 'one way']:
+                selector = await self.resolve_first(self.TRIP_TYPE_SELECTORS, timeout=5000, cache_key="HomePage.select_trip_type")
+                if selector:
+                    await self.click(selector)
+                    await self.click(self.ONE_WAY_OPTION, timeout=5000)
+                    await self.wait_for_state(self.ONE_WAY_OPTION, state="hidden", timeout=3000)
+                    logger.info("✓ One-way selected")
+                    return
+
+                logger.warning("Could not find one-way button, may already be selected")
+        except Exception as e:
+            logger.error(f"Error selecting trip type: {e}")
+
+    async def _select_place(self, selector: str, airport_code: str, timeout: int = 5000) -> None:
+        """
+        Fill an airport code and click the suggestion with that exact code
+
+        Same flow as PlacePicker.select: suggestions without the code fail
+        after PlacePicker.SETTLE_TIMEOUT.
+
+        Args:
+            selector: Place picker input
+            airport_code: Airport code (e.g., 'MAD')
+            timeout: Maximum wait for the matching suggestion in milliseconds
+
+        Raises:
+            PlaceNotFoundError: If no suggestion matches the code
+        """
+        code = airport_code.strip().upper()
+        await self.page.fill(selector, code)
+        arg = [self.SUGGESTION_ROWS, code, False]
+        if not await self.wait_for_condition(self.FIND_SUGGESTION_SCRIPT, arg=arg, timeout=timeout):
+            await self.page.fill(selector, "")
+            await self.page.type(selector, code, delay=self.typing_delay)
+            await self.wait_for_condition(self.FIND_SUGGESTION_SCRIPT, arg=arg, timeout=timeout)
+
+        match = self.page.locator(f"[{self.PLACE_MATCH_MARKER}]")
+        if not await match.count() and not await self.wait_for_condition(
+            self.FIND_SUGGESTION_SCRIPT, arg=[self.SUGGESTION_ROWS, code, True], timeout=self.PLACE_SETTLE_TIMEOUT
+        ):
+            raise PlaceNotFoundError(f"No suggestion for {code}")
+        await match.first.click()
+        await self.wait_for_state(self.SUGGESTION_ROWS, state="hidden", timeout=3000)
+
+    async def set_departure_airport(self, airport_code: str) -> None:
+        """
+        Set departure airport
+
+        Args:
+            airport_code: Airport code (e.g., 'RTM')
+        """
+        logger.info(f"Setting departure airport: {airport_code}")
+
+        try:
+            selector = await self.resolve_first(self.DEPARTURE_SELECTORS, timeout=5000, cache_key="HomePage.set_departure_airport")
+            if selector:
+                await self.click(selector)
+
+                # Clear preselected place chips, last first like PlacePicker.clear
+                if await self.is_visible_now(self.CLEAR_DEPARTURE_PLACES):
+                    for close in reversed(await self.page.locator(self.CLEAR_DEPARTURE_PLACES).all()):
+                        await close.click()
+                    await self.wait_for_state(self.CLEAR_DEPARTURE_PLACES, state="detached", timeout=2000)
+
+                await self._select_place(selector, airport_code)
+                logger.info(f"✓ Departure set to {airport_code}")
+                return
+
+            logger.error("Could not find departure airport input field")
+
+        except PlaceNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Error setting departure airport: {e}")
+
+    async def set_arrival_airport(self, airport_code: str) -> None:
+        """
+        Set arrival airport
+
+        Args:
+            airport_code: Airport code (e.g., 'MAD')
+        """
+        logger.info(f"Setting arrival airport: {airport_code}")
+
+        try:
+            selector = await self.resolve_first(self.ARRIVAL_SELECTORS, timeout=5000, cache_key="HomePage.set_arrival_airport")
+            if selector:
+                await self.click(selector)
+                await self._select_place(selector, airport_code)
+                logger.info(f"✓ Arrival set to {airport_code}")
+                return
+
+            logger.error("Could not find arrival airport input field")
+
+        except PlaceNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(f"Error setting arrival airport: {e}")
+
+    async def set_departure_date(self, weeks_from_now: int = 1) -> None:
+        """
+        Set departure date
+
+        Args:
+            weeks_from_now: Number of weeks from current date
+        """
+        target_date = datetime.now() + timedelta(weeks=weeks_from_now)
+        logger.info(f"Setting departure date: {target_date.strftime('%Y-%m-%d')}")
+
+        await self.page.keyboard.press("Escape")
+        await self.wait_for_state(self.SUGGESTION_ROWS, state="hidden", timeout=2000)
+
+        element = self.page.locator(self.DATE_FIELD).first
+        await element.scroll_into_view_if_needed()
+        await element.click()
+
+        await self.wait_for_calendar()
+        await self._select_date_from_calendar(target_date)
+        await self._click_set_dates_button()
+        logger.info("✓ Departure date set successfully")
+
+    async def wait_for_calendar(self, timeout: int = 10000) -> bool:
+        """
+        Wait for the calendar popup grid to be attached with day cells rendered
+
+        Args:
+            timeout: Timeout in milliseconds
+
+        Returns:
+            True if calendar is ready, False if it timed out
+        """
+        return await self.wait_for_condition(
+            """(selector) => {
+                const grid = document.querySelector(selector);
+                return !!grid && grid.querySelectorAll('div').length > 0;
+            }""",
+            arg=self.CALENDAR_GRID,
+            timeout=timeout,
+        )
+
+    async def _select_date_from_calendar(self, target_date: datetime) -> None:
+        """
+        Select exact single day with one in-page lookup
+
+        Args:
+            target_date: Date to select
+
+        Raises:
+            Exception: If no enabled cell matches the date
+        """
+        target_day_str = str(target_date.day)
+        match = await self.page.evaluate(
+            self.FIND_DAY_CELL_SCRIPT,
+            [self.CALENDAR_GRID, target_date.strftime('%Y-%m-%d'), target_day_str, target_date.strftime('%B')],
+        )
+        if not match:
+            raise Exception(f"Date {target_day_str} not found or not clickable")
+
+        logger.info(f"Found day cell via {match['strategy']} ({match['candidates']} candidate(s))")
+        await self.page.locator(f"[{self.DAY_CELL_MARKER}]").first.click()
+
+    async def _click_set_dates_button(self) -> None:
+        """Click 'Set dates' button to confirm"""
+        if await self.wait_visible(self.SET_DATES_BUTTON, timeout=3000):
+            await self.page.locator(self.SET_DATES_BUTTON).first.click()
+        else:
+            logger.warning("Set dates button not visible, pressing Enter")
+            await self.page.keyboard.press("Enter")
+        await self.wait_for_state(self.SET_DATES_BUTTON, state="hidden", timeout=3000)
+
+    async def uncheck_accommodation_option(self) -> None:
+        """Uncheck the accommodation booking checkbox"""
+        try:
+            selector = await self.resolve_first(self.CHECKBOX_SELECTORS + self.LABEL_SELECTORS, timeout=4000, cache_key="HomePage.uncheck_accommodation_option")
+
+            if selector in self.CHECKBOX_SELECTORS:
+                if await self.page.is_checked(selector):
+                    await self.page.uncheck(selector)
+                    logger.info(f"✓ Unchecked accommodation: {selector}")
+                return
+
+            if selector in self.LABEL_SELECTORS:
+                label_element = self.page.locator(selector).first
+                checkbox = label_element.locator("..").locator("input[type='checkbox']").first
+                if await checkbox.is_visible():
+                    if await checkbox.is_checked():
+                        await label_element.click()
+                        logger.info(f"✓ Clicked label to uncheck: {selector}")
+                    return
+
+            section = self.page.locator(self.ACCOMMODATION_SECTION).first
+            if await self.is_visible_now(self.ACCOMMODATION_SECTION):
+                checkbox = section.locator("input[type='checkbox']").first
+                if await checkbox.is_visible() and await checkbox.is_checked():
+                    await checkbox.uncheck()
+                    logger.info("✓ Unchecked accommodation via section")
+                return
+
+            logger.warning("Could not find accommodation checkbox - it may not exist or already be unchecked")
+
+        except Exception as e:
+            logger.warning(f"Error with accommodation checkbox: {e}")
+
+    async def click_search_button(self) -> None:
+        """Click the search button to submit the search"""
+        try:
+            selector = await self.resolve_first(self.SEARCH_SELECTORS, timeout=5000, cache_key="HomePage.click_search_button")
+            if selector:
+                previous_url = self.get_current_url()
+                self.search_started = time.perf_counter()
+                self.time_to_first_result_ms = None
+                self.results_state = None
+                await self.click(selector)
+                logger.info("✓ Search button clicked")
+                await self.wait_for_url_change(previous_url, timeout=10000)
+                return
+
+            logger.error("Could not find search button")
+
+        except Exception as e:
+            logger.error(f"Error clicking search button: {e}")
+
+    async def verify_redirected_to_results(self) -> bool:
+        """
+        Verify user is redirected to search results page
+
+        Returns as soon as navigation to the results route commits, then
+        waits for the first result card or the empty-state message.
+
+        Returns:
+            True if redirected to results page and a result card or the
+            empty-state message rendered
+        """
+        try:
+            await self.page.wait_for_url(self.RESULTS_URL_PATTERN, wait_until="commit", timeout=self.RESULTS_TIMEOUT)
+        except Exception:
+            pass
+        current_url = self.get_current_url()
+        if not self.RESULTS_URL_PATTERN.search(current_url):
+            logger.warning(f"URL does not appear to be results page: {current_url}")
+            return False
+
+        if not await self.wait_for_state(self.RESULTS_READY, state="visible", timeout=self.RESULTS_TIMEOUT):
+            logger.warning("Neither a result card nor the empty-state message rendered")
+            return False
+        self.results_state = "empty" if await self.is_visible_now(self.NO_RESULTS_MESSAGE) else "cards"
+        if self.search_started is not None:
+            self.time_to_first_result_ms = round((time.perf_counter() - self.search_started) * 1000, 1)
+        return True
+
+    async def reset_search_form(self) -> None:
+        """
+        Return a loaded homepage to a clean search form without reloading
+
+        Same flow as HomePage.reset_search_form: undoes only the chips, date
+        and trip mode that are set, and reopens the page if the form does not
+        come back clean.
+        """
+        logger.info("Resetting search form")
+        self._clear_search_metrics()
+        if self.is_results_page():
+            await self.page.go_back(wait_until="commit")
+        if not await self.wait_for_state(self.SEARCH_FORM, state="visible", timeout=5000):
+            await self._reopen("search form not visible")
+            return
+
+        await self.page.keyboard.press("Escape")
+        try:
+            state = await self._form_state()
+            if state["mode"] and state["mode"] != self.DEFAULT_TRIP_MODE:
+                await self.click(self.MODE_PICKER, timeout=3000)
+                await self.click(self.RETURN_OPTION, timeout=3000)
+                await self.wait_for_state(self.RETURN_OPTION, state="hidden", timeout=3000)
+            if state["date"]:
+                selector = await self.resolve_first(self.DATE_CLEAR_SELECTORS, timeout=1000, cache_key="HomePage.reset_search_form")
+                if selector:
+                    await self.click(selector)
+            if state["chips"]:
+                for close in reversed(await self.page.locator(self.PLACE_CHIP_CLOSE).all()):
+                    await close.click()
+                await self.wait_for_state(self.PLACE_CHIP_CLOSE, state="detached", timeout=2000)
+            state = await self._form_state()
+        except Exception as e:
+            logger.warning(f"Could not reset search form in place: {e}")
+            state = None
+
+        if not state or state["chips"] or state["date"] or state["mode"] != self.DEFAULT_TRIP_MODE:
+            await self._reopen(f"form state not clean: {state}")
+            return
+        logger.info("✓ Search form reset in place")
+
+    async def _form_state(self) -> dict:
+        """
+        Read place chip count, date field value and trip mode from the page
+
+        Returns:
+            Mapping with chips, date and mode (None where the field is missing)
+        """
+        return await self.page.evaluate(
+            self.FORM_STATE_SCRIPT,
+            ["[data-test='PlacePickerInputPlace']", self.DATE_FIELD, self.MODE_PICKER],
+        )
+
+    async def _reopen(self, reason: str) -> None:
+        """
+        Fall back to a full page load
+
+        Args:
+            reason: Why the in-place reset was abandoned
+        """
+        logger.warning(f"Reopening homepage - {reason}")
+        await self.open()
+
+    def is_results_page(self) -> bool:
+        """
+        Check whether the current URL is a search results route
+
+        Returns:
+            True if the URL path matches RESULTS_URL_PATTERN
+        """
+        return bool(self.RESULTS_URL_PATTERN.search(self.get_current_url()))
+
+    def _clear_search_metrics(self) -> None:
+        """Forget the timing of the previous search on a reused page"""
+        self.search_started = None
+        self.time_to_first_result_ms = None
+        self.results_state = None
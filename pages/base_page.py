@@ -3,16 +3,84 @@ Base Page Object Model
 Provides common functionality for all page objects
 """
 from playwright.sync_api import Page, expect
-from typing import Optional
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from typing import Any, List, Optional
 import logging
+import os
+import time
+
+from utils.selector_cache import SelectorCache
+from utils.wait_stats import wait_stats
+from utils.action_trace import action_tracer
+from utils.perf_metrics import perf_monitor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _env_flag(name: str) -> bool:
+    """Read a boolean flag from the environment"""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class FixedSleepError(Exception):
+    """Raised when a fixed sleep is used while strict waits are enabled"""
+
+
+def guard_fixed_sleeps() -> None:
+    """
+    Make Playwright's wait_for_timeout raise FixedSleepError under strict waits
+
+    BasePage.sleep() checks the flag itself, but page objects can call
+    page.wait_for_timeout() directly. This wraps it on the sync and async
+    Page and Frame classes once per process; the flag is read on every call.
+    """
+    from playwright import async_api, sync_api
+
+    def check(milliseconds: float) -> None:
+        if BasePage.strict_waits:
+            raise FixedSleepError(
+                f"page.wait_for_timeout({milliseconds}) used while strict waits are enabled"
+            )
+
+    for cls in (sync_api.Page, sync_api.Frame):
+        original = cls.wait_for_timeout
+        if getattr(original, "_strict_guard", False):
+            continue
+
+        def guarded(self, timeout: float, _original=original) -> None:
+            check(timeout)
+            return _original(self, timeout)
+
+        guarded._strict_guard = True
+        cls.wait_for_timeout = guarded
+
+    for cls in (async_api.Page, async_api.Frame):
+        original = cls.wait_for_timeout
+        if getattr(original, "_strict_guard", False):
+            continue
+
+        async def guarded_async(self, timeout: float, _original=original) -> None:
+            check(timeout)
+            return await _original(self, timeout)
+
+        guarded_async._strict_guard = True
+        cls.wait_for_timeout = guarded_async
+
+
 class BasePage:
     """Base class for all page objects following POM pattern"""
     
+    # Fail on fixed sleeps instead of waiting (set STRICT_WAITS=1 or --strict-waits)
+    strict_waits = _env_flag("STRICT_WAITS")
+    
+    # Learned winning selectors shared across runs (configured in conftest)
+    selector_cache: Optional[SelectorCache] = None
+    
+    # Set by the execution profile (see utils/profiles.py)
+    default_timeout = 30000
+    typing_delay = 100
+    
     def __init__(self, page: Page):
         """
         Initialize base page
@@ -21,17 +89,22 @@ class BasePage:
             page: Playwright page instance
         """
         self.page = page
-        self.timeout = 30000  # 30 seconds default timeout
+        self.timeout = self.default_timeout
     
     def navigate_to(self, url: str) -> None:
         """
         Navigate to specified URL
         
+        With performance metrics enabled, the page's load metrics are
+        recorded after the load event.
+        
         Args:
             url: URL to navigate to
         """
         logger.info(f"Navigating to: {url}")
+        perf_monitor.prepare(self.page)
         self.page.goto(url, wait_until="domcontentloaded")
+        perf_monitor.capture(self.page, "navigate")
     
     def click(self, selector: str, timeout: Optional[int] = None) -> None:
         """
@@ -43,8 +116,11 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.info(f"Clicking element: {selector}")
-        self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-        self.page.click(selector)
+        with action_tracer.action("click", selector) as span:
+            span.probe(self.page, selector)
+            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            span.waited()
+            self.page.click(selector)
     
     def fill(self, selector: str, text: str, timeout: Optional[int] = None) -> None:
         """
@@ -57,8 +133,11 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.info(f"Filling element {selector} with: {text}")
-        self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-        self.page.fill(selector, text)
+        with action_tracer.action("fill", selector) as span:
+            span.probe(self.page, selector)
+            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            span.waited()
+            self.page.fill(selector, text)
     
     def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
         """
@@ -72,13 +151,19 @@ class BasePage:
             Text content of element
         """
         timeout = timeout or self.timeout
-        self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-        return self.page.text_content(selector)
+        with action_tracer.action("get_text", selector) as span:
+            span.probe(self.page, selector)
+            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            span.waited()
+            return self.page.text_content(selector)
     
     def is_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
         """
         Check if element is visible
         
+        Without a timeout this is an instant snapshot check (is_visible_now);
+        with one it waits up to that bound (wait_visible).
+        
         Args:
             selector: CSS selector or locator
             timeout: Custom timeout in milliseconds
@@ -86,12 +171,116 @@ class BasePage:
         Returns:
             True if visible, False otherwise
         """
+        if timeout is None:
+            return self.is_visible_now(selector)
+        return self.wait_visible(selector, timeout)
+    
+    def is_visible_now(self, selector: str) -> bool:
+        """
+        Snapshot check whether element is visible right now, without waiting
+        
+        Args:
+            selector: CSS selector or locator
+            
+        Returns:
+            True if visible, False otherwise
+        """
+        with action_tracer.action("is_visible_now", selector) as span:
+            try:
+                visible = self.page.locator(selector).first.is_visible()
+            except Exception:
+                visible = False
+            span.set(visible=visible)
+            return visible
+    
+    def wait_visible(self, selector: str, timeout: int) -> bool:
+        """
+        Wait a bounded time for element to become visible
+        
+        Args:
+            selector: CSS selector or locator
+            timeout: Maximum wait in milliseconds
+            
+        Returns:
+            True if visible within timeout, False otherwise
+        """
+        started = time.perf_counter()
+        with action_tracer.action("wait_visible", selector) as span:
+            span.probe(self.page, selector)
+            try:
+                self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+                visible = True
+            except PlaywrightTimeoutError:
+                self._record_timeout(started, f"visible {selector}")
+                visible = False
+            except Exception:
+                visible = False
+            span.set(visible=visible)
+            return visible
+    
+    def _record_timeout(self, started: float, description: str) -> None:
+        """
+        Add time spent in a timed-out wait to the per-test counter
+        
+        Args:
+            started: time.perf_counter() value when the wait began
+            description: What was being waited for
+        """
+        wait_stats.record_timeout((time.perf_counter() - started) * 1000, description)
+    
+    def resolve_first(self, selectors: List[str], timeout: Optional[int] = None,
+                      cache_key: Optional[str] = None) -> Optional[str]:
+        """
+        Race all fallback selectors at once and return the winner
+        
+        All candidates are combined into one locator and awaited within a single
+        timeout budget. When several are visible, the earliest in the list wins.
+        With a cache_key, the selector learned on previous runs is tried first.
+        
+        Args:
+            selectors: Fallback selectors in priority order
+            timeout: Custom timeout in milliseconds for the whole race
+            cache_key: Page action key for the learned selector cache
+            
+        Returns:
+            Winning selector, or None if no candidate became visible
+        """
+        if not selectors:
+            return None
         timeout = timeout or self.timeout
-        try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-            return True
-        except Exception:
-            return False
+        cache = self.selector_cache if cache_key else None
+        if cache:
+            selectors = cache.order(cache_key, selectors)
+        
+        candidates = [self.page.locator(f"{selector} >> visible=true") for selector in selectors]
+        winner = None
+        started = time.perf_counter()
+        
+        with action_tracer.action("resolve_first", cache_key or selectors[0]) as span:
+            # Fast path: learned selector is already on screen
+            if cache and cache.get(cache_key) == selectors[0] and candidates[0].count() > 0:
+                winner = selectors[0]
+            else:
+                combined = candidates[0]
+                for candidate in candidates[1:]:
+                    combined = combined.or_(candidate)
+                try:
+                    combined.first.wait_for(state="attached", timeout=timeout)
+                    span.waited()
+                    winner = next(
+                        (selector for selector, candidate in zip(selectors, candidates) if candidate.count() > 0),
+                        None,
+                    )
+                except PlaywrightTimeoutError:
+                    self._record_timeout(started, f"any of {selectors}")
+                    logger.info(f"No candidate visible within {timeout} ms: {selectors}")
+            span.set(winner=winner, first_attempt=winner == selectors[0], candidates=len(selectors))
+        
+        if winner:
+            logger.info(f"Resolved selector {selectors.index(winner) + 1}/{len(selectors)}: {winner}")
+        if cache:
+            cache.record(cache_key, winner)
+        return winner
     
     def wait_for_url(self, pattern: str, timeout: Optional[int] = None) -> None:
         """
@@ -199,4 +388,136 @@ class BasePage:
         """
         timeout = timeout or self.timeout
         logger.info(f"Waiting for element {selector} to be {state}")
-        self.page.wait_for_selector(selector, state=state, timeout=timeout)
\ No newline at end of file
+        with action_tracer.action("wait_for_element", selector) as span:
+            span.probe(self.page, selector)
+            span.set(state=state)
+            self.page.wait_for_selector(selector, state=state, timeout=timeout)
+    
+    def sleep(self, milliseconds: int) -> None:
+        """
+        Fixed sleep - last resort when no DOM or network condition exists
+        
+        Args:
+            milliseconds: Time to sleep in milliseconds
+            
+        Raises:
+            FixedSleepError: If strict waits are enabled
+        """
+        if self.strict_waits:
+            raise FixedSleepError(
+                f"Fixed sleep of {milliseconds} ms used while strict waits are enabled"
+            )
+        logger.warning(f"Fixed sleep: {milliseconds} ms")
+        self.page.wait_for_timeout(milliseconds)
+    
+    def wait_for_condition(self, expression: str, arg: Any = None, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until a JavaScript predicate evaluated in the page returns truthy
+        
+        Args:
+            expression: JavaScript function or expression evaluated in the page
+            arg: Optional argument passed to the expression
+            timeout: Custom timeout in milliseconds
+            
+        Returns:
+            True if the condition was met, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            self.page.wait_for_function(expression, arg=arg, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"condition {expression[:80]}")
+            logger.warning(f"Condition not met within {timeout} ms: {expression[:80]}")
+            return False
+    
+    def wait_for_populated(self, selector: str, min_count: int = 1, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until at least min_count visible elements match a CSS selector
+        
+        Args:
+            selector: Plain CSS selector (no Playwright pseudo-classes)
+            min_count: Minimum number of visible matches
+            timeout: Custom timeout in milliseconds
+            
+        Returns:
+            True if the list was populated, False if it timed out
+        """
+        logger.info(f"Waiting for {min_count}+ elements: {selector}")
+        return self.wait_for_condition(
+            """([selector, minCount]) => {
+                const visible = [...document.querySelectorAll(selector)]
+                    .filter(el => el.offsetWidth > 0 || el.offsetHeight > 0);
+                return visible.length >= minCount;
+            }""",
+            arg=[selector, min_count],
+            timeout=timeout,
+        )
+    
+    def wait_for_state(self, selector: str, state: str = "visible", timeout: Optional[int] = None) -> bool:
+        """
+        Wait for element state without raising on timeout
+        
+        Args:
+            selector: CSS selector or locator
+            state: State to wait for (attached, detached, visible, hidden)
+            timeout: Custom timeout in milliseconds
+            
+        Returns:
+            True if the state was reached, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        with action_tracer.action("wait_for_state", selector) as span:
+            span.set(state=state)
+            try:
+                self.page.wait_for_selector(selector, state=state, timeout=timeout)
+                return True
+            except PlaywrightTimeoutError:
+                self._record_timeout(started, f"{state} {selector}")
+                logger.warning(f"Element {selector} not {state} within {timeout} ms")
+                span.set(timed_out=True)
+                return False
+    
+    def wait_for_url_change(self, previous_url: str, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until the page URL differs from previous_url
+        
+        Args:
+            previous_url: URL before the triggering action
+            timeout: Custom timeout in milliseconds
+            
+        Returns:
+            True if the URL changed, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        logger.info(f"Waiting for URL to change from: {previous_url}")
+        started = time.perf_counter()
+        try:
+            self.page.wait_for_url(lambda url: url != previous_url, wait_until="commit", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, f"URL change from {previous_url}")
+            logger.warning(f"URL did not change within {timeout} ms")
+            return False
+    
+    def wait_for_network_idle(self, timeout: Optional[int] = None) -> bool:
+        """
+        Wait until there are no network connections for at least 500 ms
+        
+        Args:
+            timeout: Custom timeout in milliseconds
+            
+        Returns:
+            True if the network went idle, False if it timed out
+        """
+        timeout = timeout or self.timeout
+        started = time.perf_counter()
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            self._record_timeout(started, "network idle")
+            logger.warning(f"Network not idle within {timeout} ms")
+            return False
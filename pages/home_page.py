@@ -3,9 +3,15 @@ Kiwi.com Homepage Page Object Model
 Contains all locators and methods for homepage interactions
 """
 from pages.base_page import BasePage
+from pages.place_picker import PlaceNotFoundError, PlacePicker
 from playwright.sync_api import Page
 from datetime import datetime, timedelta
+from typing import Optional
 import logging
+import re
+import time
+
+from utils.perf_metrics import perf_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -16,44 +22,271 @@ class HomePage(BasePage):
     # URL
     URL = "https://www.kiwi.com/en/"
     
-    def __init__(self, page: Page):
+    # Wait conditions
+    SEARCH_FORM = "[data-test='SearchField-input']"
+    SUGGESTION_ROWS = "[data-test^='PlacePickerRow']"
+    CALENDAR_GRID = "[data-test*='Calendar']"
+    SET_DATES_BUTTON = "[data-test='SearchFormDoneButton']"
+    ONE_WAY_OPTION = "[data-test='ModePopupOption-oneWay']"
+    CLEAR_DEPARTURE_PLACES = "[data-test='PlacePickerInput-origin'] [data-test='PlacePickerInputPlace-close']"
+    DATE_FIELD = "[data-test='SearchDateInput']"
+    PLACE_CHIP_CLOSE = "[data-test='PlacePickerInputPlace-close']"
+    MODE_PICKER = "[data-test^='SearchFormModesPicker-active-']"
+    RETURN_OPTION = "[data-test='ModePopupOption-return']"
+    DEFAULT_TRIP_MODE = "return"
+    ACCOMMODATION_SECTION = "[data-test*='ccommodation']"
+    RESULTS_URL_PATTERN = re.compile(r"^https?://[^/]+/[^?#]*(search|results|booking)", re.IGNORECASE)
+    RESULT_CARD = "[data-test='ResultCardWrapper']"
+    NO_RESULTS_MESSAGE = "[data-test='NoResultsMessage']"
+    RESULTS_READY = f"{RESULT_CARD}, {NO_RESULTS_MESSAGE}"
+    RESULTS_TIMEOUT = 15000
+    
+    # Fallback selector lists, in priority order
+    COOKIE_SELECTORS = [
+        "button:has-text('Accept')",
+        "button:has-text('Accept all')",
+        "button:has-text('OK')",
+        "[data-test='CookiesPopup-Accept']",
+        "#cookies-accept",
+    ]
+    TRIP_TYPE_SELECTORS = [
+        "button:has-text('One-way')",
+        "button:has-text('one-way')",
+        "//button[contains(translate(., 'ONEWAY', 'oneway'), 'one-way')]",
+        "[data-test='TripTypeButton-one-way']",
+        "label:has-text('One-way')",
+        "input[value='one-way']",
+        "[data-test='SearchFormModesPicker-active-return']",
+    ]
+    DEPARTURE_SELECTORS = [
+        "[data-test='SearchField-input']:first-of-type",
+    ]
+    ARRIVAL_SELECTORS = [
+        "[data-test='PlacePickerInput-destination'] [data-test='SearchField-input']",
+        "[data-test='SearchField-input'][data-test*='destination']",
+        "[data-test='PlacePickerInputPlace']:last-child input",
+        "input[placeholder*='To']",
+        "input[placeholder*='Where to']",
+    ]
+    CHECKBOX_SELECTORS = [
+        "[data-test='accommodationCheckbox']",
+        "[data-test='BookingCheckbox']",
+        "input[type='checkbox'][name*='accommodation']",
+        "input[type='checkbox'][name*='booking']",
+    ]
+    LABEL_SELECTORS = [
+        "label:has-text('accommodation')",
+        "label:has-text('Booking.com')",
+        "div:has-text('accommodation with Booking.com')",
+    ]
+    DATE_CLEAR_SELECTORS = [
+        "[data-test='SearchDateInput-clear']",
+        "[data-test='SearchDateInput'] ~ button[aria-label*='Clear']",
+        "[data-test*='DateInput'] [aria-label*='Clear']",
+    ]
+    SEARCH_SELECTORS = [
+        "[data-test='LandingSearchButton']",
+        "button[type='submit']",
+        "button:has-text('Search')",
+        "[data-test='SearchButton']",
+        "button:has-text('Search flights')",
+    ]
+    
+    # Reads what reset_search_form has to undo: place chips, chosen date and trip mode
+    FORM_STATE_SCRIPT = """
+    ([chipSelector, dateSelector, modeSelector]) => {
+        const date = document.querySelector(dateSelector);
+        const mode = document.querySelector(modeSelector);
+        return {
+            chips: document.querySelectorAll(chipSelector).length,
+            date: date ? (('value' in date ? date.value : date.textContent) || '').trim() : null,
+            mode: mode ? mode.dataset.test.replace('SearchFormModesPicker-active-', '') : null,
+        };
+    }
+    """
+    
+    # Cookie consent budget - short when contexts load a consented storage state
+    CONSENT_TIMEOUT = 3000
+    CONSENT_TIMEOUT_WITH_SNAPSHOT = 500
+    
+    # Consented storage state snapshot loaded by test contexts (set by conftest)
+    storage_state_path: Optional[str] = None
+    
+    # Calendar day lookup - marks the matching cell with DAY_CELL_MARKER
+    DAY_CELL_MARKER = "data-kiwi-target-day"
+    FIND_DAY_CELL_SCRIPT = """
+    ([gridSelector, isoDate, day, monthName]) => {
+        const marker = '%s';
+        document.querySelectorAll(`[${marker}]`).forEach(el => el.removeAttribute(marker));
+        const root = document.querySelector(gridSelector) || document;
+        const isVisible = el => {
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 && rect.height > 0;
+        };
+        const isEnabled = el => !/disabled/i.test(el.className)
+            && !el.closest('[aria-disabled="true"], [disabled]');
+        const mark = (el, strategy, candidates) => {
+            el.setAttribute(marker, '1');
+            return {strategy, candidates};
+        };
+
+        const byDate = root.querySelector(`[data-date="${isoDate}"]`);
+        if (byDate && isVisible(byDate) && isEnabled(byDate)) {
+            return mark(byDate, 'data-date', 1);
+        }
+
+        const isDayCell = el => {
+            const c = typeof el.className === 'string' ? el.className : '';
+            return (c.includes('font-bold') && c.includes('text-large'))
+                || (c.includes('leading-normal') && c.includes('text-ink'));
+        };
+        const cells = [...root.querySelectorAll('div')].filter(el =>
+            el.textContent.trim() === day && isDayCell(el) && isEnabled(el) && isVisible(el));
+        if (!cells.length) {
+            return null;
+        }
+
+        const monthPattern = /January|February|March|April|May|June|July|August|September|October|November|December/;
+        const monthOf = el => {
+            for (let node = el.parentElement; node && node !== document.body; node = node.parentElement) {
+                const found = (node.innerText || '').match(monthPattern);
+                if (found) {
+                    return found[0];
+                }
+            }
+            return null;
+        };
+        const months = cells.map(monthOf);
+        const index = months.indexOf(monthName);
+        if (index >= 0) {
+            return mark(cells[index], 'month-grid', cells.length);
+        }
+        // Month headings not found at all - fall back to first enabled cell
+        if (months.every(month => month === null)) {
+            return mark(cells[0], 'day-text', cells.length);
+        }
+        return null;
+    }
+    """ % DAY_CELL_MARKER
+    
+    def __init__(self, page: Page, url: Optional[str] = None):
         """
         Initialize homepage
         
         Args:
             page: Playwright page instance
+            url: Landing page URL (defaults to live Kiwi.com)
         """
         super().__init__(page)
+        self.url = url or self.URL
+        # Set by click_search_button / verify_redirected_to_results for the last search
+        self.search_started: Optional[float] = None
+        self.time_to_first_result_ms: Optional[float] = None
+        self.results_state: Optional[str] = None
         logger.info("Homepage POM initialized")
     
     def open(self) -> None:
         """Navigate to Kiwi.com homepage"""
-        self.navigate_to(self.URL)
+        self.navigate_to(self.url)
         self.wait_for_load_state("domcontentloaded")
-        self.page.wait_for_timeout(2000)
+        self.wait_for_state(self.SEARCH_FORM, state="visible", timeout=10000)
         self._handle_cookie_consent()
     
+    def reset_search_form(self) -> None:
+        """
+        Return a loaded homepage to a clean search form without reloading
+        
+        Goes back from the results page, closes popups, then undoes only what
+        is set: origin/destination chips, the chosen date and the trip mode.
+        The page is reopened only if the form does not come back or its state
+        cannot be verified as clean afterwards.
+        """
+        logger.info("Resetting search form")
+        self._clear_search_metrics()
+        if self.is_results_page():
+            self.page.go_back(wait_until="commit")
+        if not self.wait_for_state(self.SEARCH_FORM, state="visible", timeout=5000):
+            self._reopen("search form not visible")
+            return
+        
+        self.page.keyboard.press("Escape")
+        try:
+            state = self._form_state()
+            if state["mode"] and state["mode"] != self.DEFAULT_TRIP_MODE:
+                self.click(self.MODE_PICKER, timeout=3000)
+                self.click(self.RETURN_OPTION, timeout=3000)
+                self.wait_for_state(self.RETURN_OPTION, state="hidden", timeout=3000)
+            if state["date"]:
+                selector = self.resolve_first(self.DATE_CLEAR_SELECTORS, timeout=1000, cache_key="HomePage.reset_search_form")
+                if selector:
+                    self.click(selector)
+            if state["chips"]:
+                for close in reversed(self.page.locator(self.PLACE_CHIP_CLOSE).all()):
+                    close.click()
+                self.wait_for_state(self.PLACE_CHIP_CLOSE, state="detached", timeout=2000)
+            state = self._form_state()
+        except Exception as e:
+            logger.warning(f"Could not reset search form in place: {e}")
+            state = None
+        
+        if not state or state["chips"] or state["date"] or state["mode"] != self.DEFAULT_TRIP_MODE:
+            self._reopen(f"form state not clean: {state}")
+            return
+        logger.info("✓ Search form reset in place")
+    
+    def _form_state(self) -> dict:
+        """
+        Read place chip count, date field value and trip mode from the page
+        
+        Returns:
+            Mapping with chips, date and mode (None where the field is missing)
+        """
+        return self.page.evaluate(
+            self.FORM_STATE_SCRIPT,
+            ["[data-test='PlacePickerInputPlace']", self.DATE_FIELD, self.MODE_PICKER],
+        )
+    
+    def _reopen(self, reason: str) -> None:
+        """
+        Fall back to a full page load
+        
+        Args:
+            reason: Why the in-place reset was abandoned
+        """
+        logger.warning(f"Reopening homepage - {reason}")
+        self.open()
+    
+    def is_results_page(self) -> bool:
+        """
+        Check whether the current URL is a search results route
+        
+        Returns:
+            True if the URL path matches RESULTS_URL_PATTERN
+        """
+        return bool(self.RESULTS_URL_PATTERN.search(self.get_current_url()))
+    
+    def _clear_search_metrics(self) -> None:
+        """Forget the timing of the previous search on a reused page"""
+        self.search_started = None
+        self.time_to_first_result_ms = None
+        self.results_state = None
+    
     def _handle_cookie_consent(self) -> None:
         """Handle cookie consent popup if present"""
         try:
             # Try multiple cookie button selectors
-            cookie_selectors = [
-                "button:has-text('Accept')",
-                "button:has-text('Accept all')",
-                "button:has-text('OK')",
-                "[data-test='CookiesPopup-Accept']",
-                "#cookies-accept"
-            ]
-            
-            for selector in cookie_selectors:
-                try:
-                    if self.is_visible(selector, timeout=3000):
-                        logger.info(f"Clicking cookie consent: {selector}")
-                        self.click(selector)
-                        self.page.wait_for_timeout(1000)
-                        return
-                except Exception:
-                    continue
+            cookie_selectors = self.COOKIE_SELECTORS
+            
+            timeout = self.CONSENT_TIMEOUT_WITH_SNAPSHOT if self.storage_state_path else self.CONSENT_TIMEOUT
+            selector = self.resolve_first(cookie_selectors, timeout=timeout, cache_key="HomePage._handle_cookie_consent")
+            if selector:
+                logger.info(f"Clicking cookie consent: {selector}")
+                self.click(selector)
+                self.wait_for_state(selector, state="hidden", timeout=3000)
+                if self.storage_state_path:
+                    # Only the consent_storage_state fixture writes the shared snapshot
+                    logger.warning(f"Consent shown despite storage state {self.storage_state_path}")
+                return
                     
             logger.info("No cookie consent popup found or already accepted")
         except Exception as e:
@@ -69,36 +302,20 @@ class HomePage(BasePage):
         logger.info(f"Selecting trip type: {trip_type}")
         
         try:
-            # Wait for page to be ready
-            self.page.wait_for_timeout(1000)
-            
             if trip_type.lower() in ['one-way', 'oneway', 'one way']:
                 # Multiple approaches to find one-way button
-                trip_type_selectors = [
-                    "button:has-text('One-way')",
-                    "button:has-text('one-way')",
-                    "//button[contains(translate(., 'ONEWAY', 'oneway'), 'one-way')]",
-                    "[data-test='TripTypeButton-one-way']",
-                    "label:has-text('One-way')",
-                    "input[value='one-way']",
-                    "[data-test='SearchFormModesPicker-active-return']"
-                ]
+                trip_type_selectors = self.TRIP_TYPE_SELECTORS
 
-                trip_types = "[data-test='ModePopupOption-oneWay']"
+                trip_types = self.ONE_WAY_OPTION
                 
-                for selector in trip_type_selectors:
-                    try:
-                        logger.info(f"Trying trip_type selector: {selector}")
-                        if self.is_visible(selector, timeout=2000):
-                            self.click(selector)
-                            logger.info(f"✓ trip_type selected with: {selector}")
-                            self.page.wait_for_timeout(500)
-                            self.click(trip_types)
-                            logger.info(f"✓ One-way selected")
-                            return
-                    except Exception as e:
-                        logger.debug(f"Selector {selector} failed: {e}")
-                        continue
+                selector = self.resolve_first(trip_type_selectors, timeout=5000, cache_key="HomePage.select_trip_type")
+                if selector:
+                    self.click(selector)
+                    logger.info(f"✓ trip_type selected with: {selector}")
+                    self.click(trip_types, timeout=5000)
+                    self.wait_for_state(trip_types, state="hidden", timeout=3000)
+                    logger.info(f"✓ One-way selected")
+                    return
                 
                 logger.warning("Could not find one-way button, may already be selected")    
         except Exception as e:
@@ -106,119 +323,60 @@ class HomePage(BasePage):
     
     def set_departure_airport(self, airport_code: str) -> None:
         """
-        Set departure airport with improved reliability
+        Set departure airport
         
         Args:
             airport_code: Airport code (e.g., 'RTM')
+            
+        Raises:
+            PlaceNotFoundError: If no suggestion matches the code
         """
         logger.info(f"Setting departure airport: {airport_code}")
         
         try:
-            # Wait a bit for page to be ready
-            self.page.wait_for_timeout(1000)
-            
             # Try different selectors for departure field
-            departure_selectors = [
-                "[data-test='SearchField-input']:first-of-type"
-            ]
+            departure_selectors = self.DEPARTURE_SELECTORS
             
-            clear_departure_preselected_items = "[data-test='PlacePickerInput-origin'] [data-test='PlacePickerInputPlace-close']"
-
-            for selector in departure_selectors:
-                try:
-                    logger.info(f"Trying departure selector: {selector}")
-                    
-                    if self.is_visible(selector, timeout=2000):
-                        # Clear and fill
-                        self.click(selector)
-                        self.page.wait_for_timeout(500)
-                        
-                        # Clear existing value
-                        try:
-                            if self.is_visible(clear_departure_preselected_items, timeout=1000):
-                                self.click(clear_departure_preselected_items)
-                                self.page.wait_for_timeout(500)
-                        except Exception:
-                            pass
-                        
-                        self.page.fill(selector, "")
-                        self.page.wait_for_timeout(300)
-                        
-                        # Type slowly
-                        self.page.type(selector, airport_code, delay=100)
-                        self.page.wait_for_timeout(1500)
-                        
-                        logger.info(f"✓ Typed {airport_code} in departure field")
-                        
-                        # Press Enter to confirm
-                        self.page.keyboard.press("Enter")
-                        self.page.wait_for_timeout(1000)
-                        
-                        # Extra wait to ensure dropdown closes
-                        logger.info("Waiting for arrival dropdown to close...")
-                        self.page.wait_for_timeout(1500)
-                        return
-                        
-                except Exception as e:
-                    logger.debug(f"Departure selector {selector} failed: {e}")
-                    continue
+            selector = self.resolve_first(departure_selectors, timeout=5000, cache_key="HomePage.set_departure_airport")
+            if selector:
+                # Drop the preselected origin chip, fill the code and pick its exact suggestion
+                PlacePicker(self.page, selector, clear_selector=self.CLEAR_DEPARTURE_PLACES).select(airport_code)
+                logger.info(f"✓ Departure set to {airport_code}")
+                return
             
             logger.error("Could not find departure airport input field")
             
+        except PlaceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error setting departure airport: {e}")
     
     def set_arrival_airport(self, airport_code: str) -> None:
         """
-        Set arrival airport with improved reliability
+        Set arrival airport
         
         Args:
             airport_code: Airport code (e.g., 'MAD')
+            
+        Raises:
+            PlaceNotFoundError: If no suggestion matches the code
         """
         logger.info(f"Setting arrival airport: {airport_code}")
         
         try:
-            self.page.wait_for_timeout(1000)
-            
             # Try different selectors for arrival field
-            arrival_selectors = [
-                "[data-test='PlacePickerInput-destination'] [data-test='SearchField-input']",
-                "[data-test='SearchField-input'][data-test*='destination']",
-                "[data-test='PlacePickerInputPlace']:last-child input",
-                "input[placeholder*='To']",
-                "input[placeholder*='Where to']"
-            ]
-            
-            for selector in arrival_selectors:
-                try:
-                    logger.info(f"Trying arrival selector: {selector}")
-                    
-                    if self.is_visible(selector, timeout=2000):
-                        # Clear and fill
-                        self.click(selector)
-                        self.page.wait_for_timeout(500)
-                        
-                        # Clear existing value
-                        self.page.fill(selector, "")
-                        self.page.wait_for_timeout(300)
-                        
-                        # Type slowly
-                        self.page.type(selector, airport_code, delay=100)
-                        self.page.wait_for_timeout(1500)
-                        
-                        logger.info(f"✓ Typed {airport_code} in arrival field")
-                        
-                        # Press Enter to confirm
-                        self.page.keyboard.press("Enter")
-                        self.page.wait_for_timeout(500)
-                        return
-                        
-                except Exception as e:
-                    logger.debug(f"Arrival selector {selector} failed: {e}")
-                    continue
+            arrival_selectors = self.ARRIVAL_SELECTORS
+            
+            selector = self.resolve_first(arrival_selectors, timeout=5000, cache_key="HomePage.set_arrival_airport")
+            if selector:
+                PlacePicker(self.page, selector).select(airport_code)
+                logger.info(f"✓ Arrival set to {airport_code}")
+                return
             
             logger.error("Could not find arrival airport input field")
             
+        except PlaceNotFoundError:
+            raise
         except Exception as e:
             logger.error(f"Error setting arrival airport: {e}")
     
@@ -239,10 +397,10 @@ class HomePage(BasePage):
             
             # Step 1: Close any open dropdowns
             self.page.keyboard.press("Escape")
-            self.page.wait_for_timeout(1000)
+            self.wait_for_state(self.SUGGESTION_ROWS, state="hidden", timeout=2000)
             
             # Step 2: Click date field to open calendar
-            date_field_selector = "[data-test='SearchDateInput']"
+            date_field_selector = self.DATE_FIELD
             logger.info(f"Clicking date field: {date_field_selector}")
             
             element = self.page.locator(date_field_selector).first
@@ -250,11 +408,11 @@ class HomePage(BasePage):
             element.click()
             logger.info("✓ Calendar opened")
             
-            # Step 3: Wait for calendar to load
-            self.page.wait_for_timeout(3000)
+            # Step 3: Wait for calendar grid to be attached
+            self.wait_for_calendar()
             
             # Step 4: Select the date
-            self._select_date_from_calendar(target_day_str)
+            self._select_date_from_calendar(target_date)
             
             # Step 5: Click "Set dates" button
             self._click_set_dates_button()
@@ -266,58 +424,56 @@ class HomePage(BasePage):
             self.page.screenshot(path=f"reports/screenshots/date_error.png")
             raise
     
-    def _select_date_from_calendar(self, target_day_str: str) -> None:
+    def wait_for_calendar(self, timeout: int = 10000) -> bool:
+        """
+        Wait for the calendar popup grid to be attached with day cells rendered
+        
+        Args:
+            timeout: Timeout in milliseconds
+            
+        Returns:
+            True if calendar is ready, False if it timed out
+        """
+        logger.info("Waiting for calendar grid")
+        return self.wait_for_condition(
+            """(selector) => {
+                const grid = document.querySelector(selector);
+                return !!grid && grid.querySelectorAll('div').length > 0;
+            }""",
+            arg=self.CALENDAR_GRID,
+            timeout=timeout,
+        )
+    
+    def _select_date_from_calendar(self, target_date: datetime) -> None:
         """
-        Select exact single day - uses the WORKING selector from debug
+        Select exact single day with one in-page lookup
+        
+        Prefers the data-date cell; otherwise matches exact day text on date cell
+        classes inside the month grid whose heading names the target month, so
+        dates past a month boundary resolve to the right grid.
         
         Args:
-            target_day_str: Day as string (e.g., '25')
+            target_date: Date to select
         """
-        logger.info(f"Selecting day: {target_day_str}")
+        target_day_str = str(target_date.day)
+        logger.info(f"Selecting day: {target_date.strftime('%Y-%m-%d')}")
         
         try:
-            # Wait for calendar to fully load
-            self.page.wait_for_timeout(3000)
-            
-            # Find div with specific classes and exact text match
-            logger.info(f"Looking for clickable div with text '{target_day_str}'")
-            
-            # Get all elements containing the day number
-            all_day_elements = self.page.locator(f"div:has-text('{target_day_str}')").all()
-            logger.info(f"Found {len(all_day_elements)} divs containing '{target_day_str}'")
-            
-            clicked = False
-            for i, elem in enumerate(all_day_elements):
-                try:
-                    # Get element details
-                    text = elem.inner_text().strip()
-                    classes = elem.get_attribute("class") or ""
-                    
-                    # Match EXACT text (not '125' or '250') and look for date cell classes
-                    if text == target_day_str:
-                        logger.info(f"Candidate {i}: text='{text}', classes='{classes[:80]}...'")
-                        
-                        # Check if it's a date cell
-                        if ("font-bold" in classes and "text-large" in classes) or \
-                        ("leading-normal" in classes and "text-ink" in classes):
-                            
-                            # Check it's not disabled
-                            if "disabled" not in classes.lower() and elem.is_visible():
-                                logger.info(f"  → Clicking candidate {i}...")
-                                elem.click()
-                                logger.info(f"✓ Successfully clicked day {target_day_str}!")
-                                clicked = True
-                                self.page.wait_for_timeout(1500)
-                                return
-                except Exception as e:
-                    logger.debug(f"Candidate {i} failed: {e}")
-                    continue
-            
-            if not clicked:
+            # Find and mark the enabled day cell in a single round trip
+            match = self.page.evaluate(
+                self.FIND_DAY_CELL_SCRIPT,
+                [self.CALENDAR_GRID, target_date.strftime('%Y-%m-%d'), target_day_str, target_date.strftime('%B')],
+            )
+            
+            if not match:
                 logger.error(f"Could not click day {target_day_str}")
                 # Take screenshot for debugging
                 self.page.screenshot(path=f"reports/screenshots/day_{target_day_str}_not_found.png")
                 raise Exception(f"Date {target_day_str} not found or not clickable")
+            
+            logger.info(f"Found day cell via {match['strategy']} ({match['candidates']} candidate(s))")
+            self.page.locator(f"[{self.DAY_CELL_MARKER}]").first.click()
+            logger.info(f"✓ Successfully clicked day {target_day_str}!")
                 
         except Exception as e:
             logger.error(f"Error selecting date: {e}")
@@ -328,24 +484,19 @@ class HomePage(BasePage):
         logger.info("Clicking 'Set dates' button")
         
         try:
-            self.page.wait_for_timeout(1000)
-            
-            set_dates_selector = "[data-test='SearchFormDoneButton']"
-            
-            element = self.page.locator(set_dates_selector).first
-            if element.is_visible(timeout=3000):
+            element = self.page.locator(self.SET_DATES_BUTTON).first
+            if self.wait_visible(self.SET_DATES_BUTTON, timeout=3000):
                 element.click()
                 logger.info("✓ Clicked 'Set dates' button")
-                self.page.wait_for_timeout(2000)
             else:
                 logger.warning("Set dates button not visible, pressing Enter")
                 self.page.keyboard.press("Enter")
-                self.page.wait_for_timeout(1500)
+            self.wait_for_state(self.SET_DATES_BUTTON, state="hidden", timeout=3000)
                 
         except Exception as e:
             logger.warning(f"Error clicking set dates: {e}")
             self.page.keyboard.press("Enter")
-            self.page.wait_for_timeout(1500)
+            self.wait_for_state(self.SET_DATES_BUTTON, state="hidden", timeout=3000)
 
 
     def uncheck_accommodation_option(self) -> None:
@@ -353,69 +504,50 @@ class HomePage(BasePage):
         logger.info("Looking for accommodation checkbox")
         
         try:
-            self.page.wait_for_timeout(1000)
-            
             # Strategy 1: Direct checkbox selectors
-            checkbox_selectors = [
-                "[data-test='accommodationCheckbox']",
-                "[data-test='BookingCheckbox']",
-                "input[type='checkbox'][name*='accommodation']",
-                "input[type='checkbox'][name*='booking']"
-            ]
-            
-            for selector in checkbox_selectors:
-                try:
-                    logger.info(f"Trying checkbox selector: {selector}")
-                    if self.is_visible(selector, timeout=2000):
-                        # Check if it's checked
-                        is_checked = self.page.is_checked(selector)
-                        logger.info(f"Checkbox state: {'checked' if is_checked else 'unchecked'}")
-                        
-                        if is_checked:
-                            self.page.uncheck(selector)
-                            logger.info(f"✓ Unchecked accommodation: {selector}")
-                        else:
-                            logger.info("Accommodation already unchecked")
-                        return
-                except Exception as e:
-                    logger.debug(f"Checkbox selector {selector} failed: {e}")
-                    continue
+            checkbox_selectors = self.CHECKBOX_SELECTORS
             
             # Strategy 2: Find by label text and click it
-            label_selectors = [
-                "label:has-text('accommodation')",
-                "label:has-text('Booking.com')",
-                "div:has-text('accommodation with Booking.com')"
-            ]
-            
-            for selector in label_selectors:
-                try:
-                    logger.info(f"Trying label selector: {selector}")
-                    if self.is_visible(selector, timeout=2000):
-                        # Check if associated checkbox is checked
-                        label_element = self.page.locator(selector).first
-                        
-                        # Find checkbox near this label
-                        checkbox = label_element.locator("..").locator("input[type='checkbox']").first
-                        
-                        if checkbox.is_visible():
-                            is_checked = checkbox.is_checked()
-                            logger.info(f"Found checkbox via label, checked: {is_checked}")
-                            
-                            if is_checked:
-                                label_element.click()
-                                logger.info(f"✓ Clicked label to uncheck: {selector}")
-                            else:
-                                logger.info("Checkbox already unchecked (via label)")
-                            return
-                except Exception as e:
-                    logger.debug(f"Label selector {selector} failed: {e}")
-                    continue
+            label_selectors = self.LABEL_SELECTORS
+            
+            # Race both strategies within a single budget
+            selector = self.resolve_first(checkbox_selectors + label_selectors, timeout=4000, cache_key="HomePage.uncheck_accommodation_option")
+            
+            if selector in checkbox_selectors:
+                # Check if it's checked
+                is_checked = self.page.is_checked(selector)
+                logger.info(f"Checkbox state: {'checked' if is_checked else 'unchecked'}")
+                
+                if is_checked:
+                    self.page.uncheck(selector)
+                    logger.info(f"✓ Unchecked accommodation: {selector}")
+                else:
+                    logger.info("Accommodation already unchecked")
+                return
+            
+            if selector in label_selectors:
+                # Check if associated checkbox is checked
+                label_element = self.page.locator(selector).first
+                
+                # Find checkbox near this label
+                checkbox = label_element.locator("..").locator("input[type='checkbox']").first
+                
+                if checkbox.is_visible():
+                    is_checked = checkbox.is_checked()
+                    logger.info(f"Found checkbox via label, checked: {is_checked}")
+                    
+                    if is_checked:
+                        label_element.click()
+                        logger.info(f"✓ Clicked label to uncheck: {selector}")
+                    else:
+                        logger.info("Checkbox already unchecked (via label)")
+                    return
             
             # Strategy 3: Find by data-test attribute containing "accommodation"
             try:
-                accommodation_section = self.page.locator("[data-test*='ccommodation']").first
-                if accommodation_section.is_visible(timeout=2000):
+                accommodation_section_selector = self.ACCOMMODATION_SECTION
+                accommodation_section = self.page.locator(accommodation_section_selector).first
+                if self.is_visible_now(accommodation_section_selector):
                     logger.info("Found accommodation section")
                     
                     # Look for checkbox within this section
@@ -442,26 +574,18 @@ class HomePage(BasePage):
         logger.info("Clicking search button")
         
         try:
-            self.page.wait_for_timeout(1000)
-            
-            search_selectors = [
-                "[data-test='LandingSearchButton']",
-                "button[type='submit']",
-                "button:has-text('Search')",
-                "[data-test='SearchButton']",
-                "button:has-text('Search flights')"
-            ]
-            
-            for selector in search_selectors:
-                try:
-                    if self.is_visible(selector, timeout=2000):
-                        logger.info(f"Found search button: {selector}")
-                        self.click(selector)
-                        logger.info("✓ Search button clicked")
-                        self.page.wait_for_timeout(3000)
-                        return
-                except Exception:
-                    continue
+            search_selectors = self.SEARCH_SELECTORS
+            
+            selector = self.resolve_first(search_selectors, timeout=5000, cache_key="HomePage.click_search_button")
+            if selector:
+                logger.info(f"Found search button: {selector}")
+                previous_url = self.get_current_url()
+                self._clear_search_metrics()
+                self.search_started = time.perf_counter()
+                self.click(selector)
+                logger.info("✓ Search button clicked")
+                self.wait_for_url_change(previous_url, timeout=10000)
+                return
             
             logger.error("Could not find search button")
             
@@ -472,27 +596,49 @@ class HomePage(BasePage):
         """
         Verify user is redirected to search results page
         
+        Returns as soon as navigation to the results route commits, then
+        waits for the first result card or the empty-state message and
+        records the time to first result since the search click.
+        
         Returns:
-            True if redirected to results page
+            True if redirected to results page and a result card or the
+            empty-state message rendered
         """
         try:
             logger.info("Verifying redirect to search results...")
             
-            # Wait for URL to change
-            self.page.wait_for_timeout(5000)
+            # Wait for URL to reach the results route
+            try:
+                self.page.wait_for_url(self.RESULTS_URL_PATTERN, wait_until="commit", timeout=self.RESULTS_TIMEOUT)
+            except Exception:
+                pass
             current_url = self.get_current_url()
             logger.info(f"Current URL: {current_url}")
             
-            # Check if URL contains search/results indicators
-            is_results_page = any(keyword in current_url.lower() for keyword in ['search', 'results', 'booking'])
-            
-            if is_results_page:
-                logger.info("✓ Successfully redirected to search results page")
-            else:
+            if not self.is_results_page():
                 logger.warning(f"URL does not appear to be results page: {current_url}")
+                return False
             
-            return is_results_page
+            logger.info("✓ Successfully redirected to search results page")
+            return self._wait_for_first_result()
             
         except Exception as e:
             logger.error(f"Error verifying redirect: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _wait_for_first_result(self) -> bool:
+        """
+        Wait for the first result card or empty-state message and record time to first result
+        
+        Returns:
+            True if either rendered within RESULTS_TIMEOUT
+        """
+        if not self.wait_for_state(self.RESULTS_READY, state="visible", timeout=self.RESULTS_TIMEOUT):
+            logger.warning("Neither a result card nor the empty-state message rendered")
+            return False
+        self.results_state = "empty" if self.is_visible_now(self.NO_RESULTS_MESSAGE) else "cards"
+        if self.search_started is not None:
+            self.time_to_first_result_ms = round((time.perf_counter() - self.search_started) * 1000, 1)
+        logger.info(f"✓ Results rendered ({self.results_state}), time to first result: {self.time_to_first_result_ms} ms")
+        perf_monitor.capture(self.page, "search_results")
+        return True
@@ -0,0 +1,122 @@
+"""
+Place Picker Component Object
+Fills an airport field and selects the suggestion matching the exact IATA code
+"""
+from pages.base_page import BasePage
+from playwright.sync_api import Page
+from typing import List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PlaceNotFoundError(Exception):
+    """Raised when the autocomplete offers no suggestion for an airport code"""
+
+
+class PlacePicker(BasePage):
+    """Component object for one origin/destination place picker input"""
+
+    SUGGESTION_ROWS = "[data-test^='PlacePickerRow']"
+    MATCH_MARKER = "data-kiwi-place-match"
+    # Grace for the list to catch up with the typed code once it shows other places
+    SETTLE_TIMEOUT = 500
+
+    # Marks the visible suggestion row whose data-code or text holds the exact code; true once it
+    # is found or, unless matchOnly, once any suggestion is shown
+    FIND_SUGGESTION_SCRIPT = """
+    ([rowSelector, code, matchOnly]) => {
+        const marker = '%s';
+        document.querySelectorAll(`[${marker}]`).forEach(el => el.removeAttribute(marker));
+        const exact = new RegExp(`(^|[^A-Z])${code}([^A-Z]|$)`);
+        const rows = [...document.querySelectorAll(rowSelector)]
+            .filter(el => el.offsetWidth > 0 || el.offsetHeight > 0);
+        const row = rows.find(el => (el.dataset.code || '').toUpperCase() === code)
+            || rows.find(el => exact.test(el.innerText || ''));
+        if (!row) {
+            return !matchOnly && rows.length > 0;
+        }
+        row.setAttribute(marker, '1');
+        return true;
+    }
+    """ % MATCH_MARKER
+
+    def __init__(self, page: Page, input_selector: str, clear_selector: Optional[str] = None):
+        """
+        Initialize place picker
+
+        Args:
+            page: Playwright page instance
+            input_selector: Text input of the picker
+            clear_selector: Close buttons of preselected place chips, removed before typing
+        """
+        super().__init__(page)
+        self.input_selector = input_selector
+        self.clear_selector = clear_selector
+
+    def clear(self) -> None:
+        """Remove preselected place chips and empty the input"""
+        if self.clear_selector and self.is_visible_now(self.clear_selector):
+            for close in reversed(self.page.locator(self.clear_selector).all()):
+                close.click()
+            self.wait_for_state(self.clear_selector, state="detached", timeout=2000)
+        self.page.fill(self.input_selector, "")
+
+    def select(self, code: str, timeout: int = 5000) -> None:
+        """
+        Fill the code in one go and click the suggestion with that exact code
+
+        If the autocomplete did not react to the fill at all, the code is
+        typed once more key by key before giving up. Once suggestions are
+        shown without the code, it fails after SETTLE_TIMEOUT instead of
+        waiting out the full timeout.
+
+        Args:
+            code: IATA airport code (e.g., 'MAD')
+            timeout: Maximum wait for the first suggestions in milliseconds
+
+        Raises:
+            PlaceNotFoundError: If no suggestion matches the code
+        """
+        code = code.strip().upper()
+        logger.info(f"Selecting place {code} in {self.input_selector}")
+        self.click(self.input_selector)
+        self.clear()
+        self.page.fill(self.input_selector, code)
+
+        if not self._wait_for_suggestions(code, timeout):
+            logger.info(f"No suggestions after fill - typing {code} key by key")
+            self.page.fill(self.input_selector, "")
+            self.page.type(self.input_selector, code, delay=self.typing_delay)
+            self._wait_for_suggestions(code, timeout)
+
+        match = self.page.locator(f"[{self.MATCH_MARKER}]")
+        if match.count() == 0 and not self._wait_for_suggestions(code, self.SETTLE_TIMEOUT, match_only=True):
+            raise PlaceNotFoundError(f"No suggestion for {code}; offered: {self._suggestions()}")
+
+        match.first.click()
+        self.wait_for_state(self.SUGGESTION_ROWS, state="hidden", timeout=3000)
+        logger.info(f"✓ Selected {code}")
+
+    def _wait_for_suggestions(self, code: str, timeout: int, match_only: bool = False) -> bool:
+        """
+        Wait until suggestions are shown, marking the row with the exact code if there is one
+
+        Args:
+            code: Upper-case IATA code
+            timeout: Maximum wait in milliseconds
+            match_only: Keep waiting until a row carries the code
+
+        Returns:
+            True if suggestions (with match_only, a matching row) appeared in time
+        """
+        return self.wait_for_condition(
+            self.FIND_SUGGESTION_SCRIPT, arg=[self.SUGGESTION_ROWS, code, match_only], timeout=timeout
+        )
+
+    def _suggestions(self) -> List[str]:
+        """Texts of the suggestion rows currently shown"""
+        try:
+            return [text.strip() for text in self.page.locator(f"{self.SUGGESTION_ROWS} >> visible=true").all_inner_texts()]
+        except Exception:
+            return []
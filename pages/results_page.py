@@ -0,0 +1,319 @@
+"""
+Kiwi.com Search Results Page Object Model
+Streams itineraries out of the results list in batches while it loads and scrolls
+"""
+from collections import OrderedDict
+from pages.base_page import BasePage
+from pages.home_page import HomePage
+from playwright.sync_api import Page
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+
+class Itinerary:
+    """One result card: price, carriers, duration and number of stops"""
+
+    __slots__ = ("id", "price", "currency", "carriers", "duration_minutes", "stops")
+
+    def __init__(self, id: str, price: Optional[float], currency: str, carriers: Tuple[str, ...],
+                 duration_minutes: Optional[int], stops: Optional[int]):
+        self.id = id
+        self.price = price
+        self.currency = currency
+        self.carriers = carriers
+        self.duration_minutes = duration_minutes
+        self.stops = stops
+
+    def __repr__(self) -> str:
+        return (
+            f"Itinerary(id={self.id!r}, price={self.price}{self.currency}, carriers={list(self.carriers)}, "
+            f"duration_minutes={self.duration_minutes}, stops={self.stops})"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain mapping of the record's fields"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _price_amount(number: str) -> float:
+    """
+    Read a price number written with either "," or "." as decimal separator
+
+    When both appear the last one is the decimal separator ("1.234,50",
+    "1,234.50"). A single separator followed by exactly three digits groups
+    thousands ("1.234", "1,234"); otherwise it is decimal ("12,50").
+
+    Args:
+        number: Digits with optional separators and spaces
+
+    Returns:
+        Amount
+
+    Raises:
+        ValueError: If the separators cannot be read as a number
+    """
+    number = re.sub(r"[\s'\u00a0\u202f]", "", number)
+    separators = [char for char in number if char in ".,"]
+    if not separators:
+        return float(number)
+    decimal = separators[-1]
+    if len(set(separators)) == 1:
+        decimals = number.rsplit(decimal, 1)[1]
+        if len(separators) > 1 or len(decimals) == 3:
+            decimal = None
+    if decimal is None:
+        return float(re.sub(r"[.,]", "", number))
+    whole, decimals = number.rsplit(decimal, 1)
+    return float(f"{re.sub(r'[.,]', '', whole)}.{decimals}")
+
+
+def parse_price(text: Optional[str]) -> Tuple[Optional[float], str]:
+    """
+    Split a card price like "€1,234" or "1.234,50 €" into amount and currency symbol
+
+    Args:
+        text: Price text from the card
+
+    Returns:
+        Amount (None if unreadable) and the non-numeric prefix/suffix
+    """
+    if not text:
+        return None, ""
+    match = re.search(r"\d(?:[\d.,\s'\u00a0\u202f]*\d)?", text)
+    if not match:
+        return None, text.strip()
+    currency = (text[:match.start()] + text[match.end():]).strip()
+    try:
+        return _price_amount(match.group()), currency
+    except ValueError:
+        return None, currency
+
+
+def parse_duration(text: Optional[str]) -> Optional[int]:
+    """
+    Convert a duration like "5h 40m" to minutes
+
+    Args:
+        text: Duration text from the card
+
+    Returns:
+        Minutes, or None if there is no hour/minute part
+    """
+    if not text:
+        return None
+    hours = re.search(r"(\d+)\s*h", text)
+    minutes = re.search(r"(\d+)\s*m", text)
+    if not hours and not minutes:
+        return None
+    return int(hours.group(1) if hours else 0) * 60 + int(minutes.group(1) if minutes else 0)
+
+
+def parse_stops(code: Optional[str], text: Optional[str]) -> Optional[int]:
+    """
+    Number of stops from the badge's data-test suffix, falling back to its text
+
+    Args:
+        code: Suffix of StopCountBadge-<n>
+        text: Badge text ("Direct", "1 stop")
+
+    Returns:
+        Number of stops, or None if unknown
+    """
+    if code and code.isdigit():
+        return int(code)
+    if text:
+        if "direct" in text.lower():
+            return 0
+        match = re.search(r"\d+", text)
+        if match:
+            return int(match.group())
+    return None
+
+
+class ResultsPage(BasePage):
+    """Page Object Model for the Kiwi.com search results page"""
+
+    RESULT_LIST = "[data-test='ResultList']"
+    RESULT_CARD = HomePage.RESULT_CARD
+    NO_RESULTS_MESSAGE = HomePage.NO_RESULTS_MESSAGE
+    RESULTS_READY = HomePage.RESULTS_READY
+    PRICE = "[data-test='ResultCardPrice']"
+    CARRIER_LOGO = "[data-test='ResultCardCarrierLogo']"
+    DURATION = "[data-test='TripDurationBadge']"
+    STOPS = "[data-test^='StopCountBadge']"
+
+    # Cards already read carry their key here; recycled virtual-list nodes get a new key
+    SEEN_MARKER = "data-kiwi-seen"
+    # Recently yielded keys, to skip cards re-mounted after scrolling back
+    RECENT_KEYS = 500
+
+    # Reads up to `limit` unread cards in one round trip and marks them as read
+    EXTRACT_BATCH_SCRIPT = """
+    ([card, price, carrier, duration, stops, marker, limit]) => {
+        const text = (root, selector) => {
+            const el = root.querySelector(selector);
+            return el ? el.innerText.trim() : null;
+        };
+        const batch = [];
+        for (const el of document.querySelectorAll(card)) {
+            if (batch.length >= limit) {
+                break;
+            }
+            const key = el.dataset.id || (el.innerText || '').slice(0, 200);
+            if (!key || el.getAttribute(marker) === key) {
+                continue;
+            }
+            el.setAttribute(marker, key);
+            const badge = el.querySelector(stops);
+            batch.push({
+                key,
+                price: text(el, price),
+                carriers: [...el.querySelectorAll(carrier)]
+                    .map(logo => logo.getAttribute('alt') || logo.getAttribute('title') || '')
+                    .filter(Boolean),
+                duration: text(el, duration),
+                stopsCode: badge ? badge.dataset.test.split('-').pop() : null,
+                stopsText: badge ? badge.innerText.trim() : null,
+            });
+        }
+        return batch;
+    }
+    """
+
+    # True once a card without the current read marker is in the DOM
+    HAS_UNREAD_SCRIPT = """
+    ([card, marker]) => [...document.querySelectorAll(card)]
+        .some(el => el.getAttribute(marker) !== (el.dataset.id || (el.innerText || '').slice(0, 200)))
+    """
+
+    # Brings the last card into view so lazy and virtualized lists render more
+    SCROLL_SCRIPT = """
+    (card) => {
+        const cards = document.querySelectorAll(card);
+        if (cards.length) {
+            cards[cards.length - 1].scrollIntoView({block: 'end'});
+        } else {
+            window.scrollBy(0, window.innerHeight);
+        }
+    }
+    """
+
+    def __init__(self, page: Page):
+        """
+        Initialize results page
+
+        Args:
+            page: Playwright page instance on a results route
+        """
+        super().__init__(page)
+
+    def wait_until_ready(self, timeout: int = HomePage.RESULTS_TIMEOUT) -> bool:
+        """
+        Wait for the first result card or the empty-state message
+
+        Args:
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            True if either rendered in time
+        """
+        return self.wait_for_state(self.RESULTS_READY, state="visible", timeout=timeout)
+
+    def has_no_results(self) -> bool:
+        """Check whether the empty-state message is shown"""
+        return self.is_visible_now(self.NO_RESULTS_MESSAGE)
+
+    def iter_itineraries(self, batch_size: int = 20, max_results: Optional[int] = None,
+                         idle_timeout: int = 2000, scroll: bool = True) -> Iterator[Itinerary]:
+        """
+        Yield itineraries as cards render, reading each batch in one evaluation
+
+        Read cards are marked in the DOM, so only new cards cross the wire and
+        nothing but a bounded window of recent keys is held in Python. When no
+        unread card is left the list is scrolled to its last card; iteration
+        ends once no new card appears within idle_timeout.
+
+        Args:
+            batch_size: Cards read per evaluation
+            max_results: Stop after this many itineraries
+            idle_timeout: Milliseconds to wait for new cards before finishing
+            scroll: Scroll to load more cards when the rendered ones are read
+
+        Yields:
+            Itinerary records in list order
+        """
+        if not self.wait_until_ready() or self.has_no_results():
+            return
+        recent: "OrderedDict[str, None]" = OrderedDict()
+        yielded = 0
+        while True:
+            batch = self._read_batch(batch_size)
+            for raw in batch:
+                if raw["key"] in recent:
+                    continue
+                recent[raw["key"]] = None
+                if len(recent) > self.RECENT_KEYS:
+                    recent.popitem(last=False)
+                yield self._to_itinerary(raw)
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+            if batch:
+                continue
+            if scroll:
+                self.page.evaluate(self.SCROLL_SCRIPT, self.RESULT_CARD)
+            if not self.wait_for_condition(self.HAS_UNREAD_SCRIPT, arg=[self.RESULT_CARD, self.SEEN_MARKER], timeout=idle_timeout):
+                logger.info(f"Results list settled after {yielded} itineraries")
+                return
+
+    def take(self, count: int, **kwargs) -> List[Itinerary]:
+        """
+        First itineraries of the list
+
+        Args:
+            count: Number of itineraries
+            **kwargs: Passed to iter_itineraries()
+
+        Returns:
+            Up to count itineraries
+        """
+        return list(self.iter_itineraries(max_results=count, **kwargs))
+
+    def _read_batch(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read up to limit unread cards in one in-page evaluation
+
+        Args:
+            limit: Maximum cards in the batch
+
+        Returns:
+            Raw card fields
+        """
+        return self.page.evaluate(
+            self.EXTRACT_BATCH_SCRIPT,
+            [self.RESULT_CARD, self.PRICE, self.CARRIER_LOGO, self.DURATION, self.STOPS, self.SEEN_MARKER, limit],
+        )
+
+    @staticmethod
+    def _to_itinerary(raw: Dict[str, Any]) -> Itinerary:
+        """
+        Build a typed record from raw card fields
+
+        Args:
+            raw: One entry of EXTRACT_BATCH_SCRIPT's result
+
+        Returns:
+            Itinerary record
+        """
+        price, currency = parse_price(raw["price"])
+        return Itinerary(
+            id=raw["key"],
+            price=price,
+            currency=currency,
+            carriers=tuple(raw["carriers"]),
+            duration_minutes=parse_duration(raw["duration"]),
+            stops=parse_stops(raw["stopsCode"], raw["stopsText"]),
+        )
@@ -6,6 +6,8 @@ import subprocess
 import sys
 import argparse
 from datetime import datetime
+from utils.duration_store import DurationStore
+from utils.route_matrix import split_by_cost
 
 
 class TestRunner:
@@ -66,16 +68,62 @@ class TestRunner:
         ]
         return subprocess.run(cmd)
     
-    def run_parallel_tests(self, workers=4):
-        """Run tests in parallel"""
-        print(f"Running tests in parallel with {workers} workers...")
+    def run_parallel_tests(self, workers=4, shared_browser=False, memory_report=False):
+        """
+        Run tests in parallel, optionally with all workers attached to one browser
+        
+        Tests are ordered and grouped longest first from the duration store,
+        so the slowest tests start first and worker totals stay balanced.
+        memory_report adds the peak RSS summary for comparing both modes.
+        """
+        mode = "one shared browser" if shared_browser else "one browser per worker"
+        print(f"Running tests in parallel with {workers} workers ({mode})...")
+        self.print_schedule_estimate(workers)
         cmd = [
             "pytest", "-v",
             "-n", str(workers),
+            "--dist", "loadgroup",
+            "--schedule", "lpt",
             f"--html={self.report_path}",
             "--self-contained-html"
         ]
+        if shared_browser:
+            cmd.append("--shared-browser")
+        if memory_report:
+            cmd.append("--memory-report")
         return subprocess.run(cmd)
+    
+    def print_schedule_estimate(self, workers):
+        """Print the longest-first split of the tests with recorded durations"""
+        durations = DurationStore().test_durations()
+        if not durations:
+            print("No duration history yet - tests keep collection order")
+            return
+        loads = [0.0] * workers
+        for nodeid, group in split_by_cost(durations, workers).items():
+            loads[group] += durations[nodeid]
+        print(
+            f"Duration history for {len(durations)} tests: estimated {max(loads) / 1000:.1f}s "
+            f"wall clock on {workers} workers ({sum(durations.values()) / 1000:.1f}s serial)"
+        )
+    
+    def show_trends(self, step=None, runs=10):
+        """Print mean step latency per run, oldest first, to spot HomePage slowdowns"""
+        trend = DurationStore().step_trend(step, runs)
+        if not trend:
+            print("No step durations recorded yet")
+            return
+        by_step = {}
+        for row in trend:
+            by_step.setdefault(row["step"], []).append(row)
+        for name, rows in sorted(by_step.items()):
+            series = " -> ".join(f"{row['wall_ms']:.0f}" for row in rows)
+            latest = rows[-1]
+            print(f"{name}")
+            print(
+                f"    wall ms per run: {series}  "
+                f"(latest: Playwright {latest['playwright_ms']:.0f} ms, sleeps {latest['sleep_ms']:.0f} ms)"
+            )
 
 
 def main():
@@ -103,12 +151,33 @@ def main():
         metavar="N",
         help="Run tests in parallel with N workers"
     )
+    parser.add_argument(
+        "--shared-browser",
+        action="store_true",
+        help="With --parallel, attach all workers to one browser instead of one each"
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="With --parallel, report peak memory per worker (and of the shared browser)"
+    )
+    parser.add_argument(
+        "--trends",
+        nargs="?",
+        const="",
+        metavar="STEP",
+        help="Show step latency trends from the duration store (optionally only steps containing STEP) and exit"
+    )
     
     args = parser.parse_args()
     runner = TestRunner()
     
+    if args.trends is not None:
+        runner.show_trends(args.trends or None)
+        sys.exit(0)
+    
     if args.parallel:
-        result = runner.run_parallel_tests(args.parallel)
+        result = runner.run_parallel_tests(args.parallel, args.shared_browser, args.memory_report)
     elif args.suite == "smoke":
         result = runner.run_smoke_tests(args.browser, args.headed)
     elif args.suite == "basic_search":
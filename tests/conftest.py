@@ -3,40 +3,424 @@ Pytest configuration and fixtures
 Handles browser setup, teardown, and shared fixtures
 """
 import pytest
-from playwright.sync_api import Page, BrowserContext, Browser, Playwright
-from typing import Generator
+from pytest_html import extras
+from pytest_metadata.plugin import metadata_key
+from playwright.sync_api import Page, BrowserContext, Browser, BrowserType, Playwright, sync_playwright
+from typing import Callable, Dict, Generator, Optional
+import html
+import json
 import logging
 from datetime import datetime
 import os
+from pages.base_page import BasePage, guard_fixed_sleeps
+from pages.home_page import HomePage
+from utils.selector_cache import SelectorCache, DEFAULT_CACHE_PATH, DEFAULT_MAX_MISSES
+from utils.wait_stats import wait_stats
+from utils.context_pool import ContextPool
+from utils.local_server import LocalSite
+from utils.har import DEFAULT_HAR_DIR, MISSING_POLICIES, NETWORK_MODES, attach_har, har_path
+from utils.search_capture import DEFAULT_FIXTURE_DIR, SEARCH_FIXTURE_MODES, SearchCapture
+from utils.action_trace import DEFAULT_TRACE_PATH, action_tracer
+from utils.perf_metrics import DEFAULT_SERIES_PATH, append_series, perf_monitor
+from utils.trace_ring import DEFAULT_RING_SIZE, DEFAULT_TRACE_DIR, StepTraceRing, trace_dir_for
+from utils.browser_server import BrowserServer, MemorySampler, process_tree_rss_mb
+from utils.profiles import PROFILES, default_profile, describe
+from utils.duration_store import DEFAULT_DURATION_DB, DurationStore, strip_group
+from utils.route_matrix import (
+    DEFAULT_ROW_COST,
+    estimate_cost,
+    historical_costs,
+    load_routes,
+    matrix_path,
+    route_key,
+    split_by_cost,
+)
+from utils.step_timing import (
+    DEFAULT_HISTORY_PATH,
+    DEFAULT_TIMINGS_PATH,
+    load_history,
+    percentiles,
+    step_timer,
+    summarize,
+)
+from utils.resource_filter import (
+    DEFAULT_BLOCKED_DOMAINS,
+    DEFAULT_BLOCKED_TYPES,
+    DEFAULT_SIZES_PATH,
+    ResourceFilter,
+    load_sizes,
+    save_sizes,
+)
+from utils.storage_state import (
+    DEFAULT_MAX_AGE_HOURS,
+    DEFAULT_STORAGE_STATE_PATH,
+    is_storage_state_fresh,
+    publish,
+    temp_path_for,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture(scope="session")
-def browser_type_launch_args():
+def launch_options(config) -> Dict:
     """
-    Browser launch arguments
-    Can be customized for different environments
+    Browser launch options of the execution profile
+    
+    --headed and a non-zero --slowmo on the command line override the profile.
+    
+    Args:
+        config: pytest config
+        
+    Returns:
+        headless and slow_mo launch arguments
     """
+    profile = PROFILES[config.getoption("--profile")]
     return {
-        "headless": False,  # Set to True for CI/CD
-        "slow_mo": 500,  # Slow down operations for visibility
+        "headless": profile["headless"] and not config.getoption("--headed"),
+        "slow_mo": config.getoption("--slowmo") or profile["slow_mo"],
     }
 
 
 @pytest.fixture(scope="session")
-def browser_context_args():
+def browser_type_launch_args(pytestconfig) -> Dict:
+    """
+    Browser launch arguments
+    Taken from the execution profile (--profile / EXECUTION_PROFILE)
+    """
+    return launch_options(pytestconfig)
+
+
+CONTEXT_POOL_STATS_KEY = pytest.StashKey[Dict]()
+RESOURCE_FILTER_KEY = pytest.StashKey[ResourceFilter]()
+SEARCH_CAPTURE_KEY = pytest.StashKey[SearchCapture]()
+TRACE_RING_KEY = pytest.StashKey[StepTraceRing]()
+CURRENT_STEP_KEY = pytest.StashKey[str]()
+SHARED_BROWSER_KEY = pytest.StashKey[BrowserServer]()
+MEMORY_SAMPLER_KEY = pytest.StashKey[MemorySampler]()
+WORKER_MEMORY_KEY = pytest.StashKey[Dict[str, float]]()
+DURATION_RUN_KEY = pytest.StashKey[Dict[str, str]]()
+TEST_DURATIONS_KEY = pytest.StashKey[Dict[str, Dict]]()
+
+# Base context arguments shared by test contexts and the snapshot recorder
+CONTEXT_ARGS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "en-US",
+    "timezone_id": "Europe/Amsterdam",
+    "permissions": ["geolocation"],
+}
+
+
+def shared_browser_endpoint(config) -> Optional[str]:
+    """
+    DevTools endpoint of the shared browser, if --shared-browser is active
+    
+    Args:
+        config: pytest config (controller or xdist worker)
+        
+    Returns:
+        Endpoint URL, or None when each worker launches its own browser
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        return workerinput.get("shared_browser_endpoint")
+    server = config.stash.get(SHARED_BROWSER_KEY, None)
+    return server.endpoint if server else None
+
+
+@pytest.fixture(scope="session")
+def browser(launch_browser: Callable[[], Browser], browser_type: BrowserType,
+            browser_type_launch_args: Dict, pytestconfig) -> Generator[Browser, None, None]:
+    """
+    Session browser - attached to the shared browser server or launched per worker
+    
+    Yields:
+        Browser instance
+    """
+    endpoint = shared_browser_endpoint(pytestconfig)
+    if endpoint:
+        logger.info(f"Connecting to shared browser: {endpoint}")
+        browser = browser_type.connect_over_cdp(endpoint, slow_mo=browser_type_launch_args.get("slow_mo"))
+    else:
+        browser = launch_browser()
+    yield browser
+    # Disconnects from a shared browser without closing it
+    browser.close()
+
+
+def bind_step_tracing(context: BrowserContext, node: pytest.Item) -> Optional[StepTraceRing]:
+    """
+    Start the step trace ring buffer on a test's context if --trace-on-failure is set
+    
+    Contexts are created lazily by the first step's fixtures, so the running
+    step, if any, becomes the first chunk. The caller closes the ring before
+    the context is released.
+    
+    Args:
+        context: Browser context the test drives
+        node: Test item
+        
+    Returns:
+        The ring, or None if step tracing is off or already bound
+    """
+    if not node.config.getoption("--trace-on-failure") or TRACE_RING_KEY in node.stash:
+        return None
+    ring = StepTraceRing(context, size=node.config.getoption("--trace-steps"))
+    try:
+        ring.start(node.stash.get(CURRENT_STEP_KEY, None))
+    except Exception as e:
+        logger.warning(f"Could not start step tracing: {e}")
+        ring.close()
+        return None
+    node.stash[TRACE_RING_KEY] = ring
+    return ring
+
+
+def route_network(context: BrowserContext, name: str, config) -> None:
+    """
+    Apply the --network mode to a context
+    
+    Args:
+        context: Browser context to route
+        name: Scenario name used for the HAR archive
+        config: pytest config
+    """
+    mode = config.getoption("--network")
+    not_found = config.getoption("--network-missing")
+    path = har_path(config.getoption("--har-dir"), name)
+    try:
+        attach_har(context, mode, path, not_found=not_found)
+    except FileNotFoundError as e:
+        if not_found != "fallback":
+            raise
+        logger.warning(f"{e} - falling back to live network")
+
+
+def _split_option(value: str) -> list:
+    """Split a comma separated option into a list"""
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def resource_blocking_enabled(item, config) -> bool:
+    """
+    Decide whether the resource filter blocks requests for a test
+    
+    With --block-resources=auto, tests carrying an "off" marker are never
+    filtered and tests carrying an "on" marker are.
+    
+    Args:
+        item: pytest test item
+        config: pytest config
+        
+    Returns:
+        True if the filter should block requests
+    """
+    mode = config.getoption("--block-resources")
+    if mode != "auto":
+        return mode == "on"
+    markers = {marker.name for marker in item.iter_markers()}
+    if markers & set(_split_option(config.getoption("--block-resources-off"))):
+        return False
+    return bool(markers & set(_split_option(config.getoption("--block-resources-on"))))
+
+
+@pytest.fixture(scope="session")
+def resource_sizes(pytestconfig) -> Generator[Dict[str, int], None, None]:
+    """
+    Learned response sizes used to report bytes saved by the resource filter
+    
+    Yields:
+        Size table by URL, merged back to disk at session end
+    """
+    sizes = load_sizes(DEFAULT_SIZES_PATH)
+    yield sizes
+    save_sizes(sizes, DEFAULT_SIZES_PATH)
+
+
+@pytest.fixture(scope="session")
+def target_url(pytestconfig) -> Generator[str, None, None]:
+    """
+    Landing page URL for the selected --target
+    
+    'live' uses Kiwi.com; 'local' serves the offline stand-in from
+    tests/local_site on an in-process HTTP server.
+    
+    Yields:
+        Landing page URL
+    """
+    if pytestconfig.getoption("--target") != "local":
+        yield HomePage.URL
+        return
+    
+    site = LocalSite()
+    yield site.start()
+    site.stop()
+
+
+@pytest.fixture(scope="session")
+def consent_storage_state(browser: Browser, target_url: str, pytestconfig) -> Optional[str]:
+    """
+    Accept cookie consent once per session and snapshot the storage state
+    
+    The snapshot is reused while fresh and re-recorded when it is older than
+    --storage-state-max-age hours or one of its cookies expired.
+    
+    Returns:
+        Path to the storage state file, or None if disabled or recording failed
+    """
+    if pytestconfig.getoption("--no-storage-state"):
+        return None
+    
+    path = pytestconfig.getoption("--storage-state")
+    if pytestconfig.getoption("--target") == "local":
+        # Consent cookies are per host - keep the local snapshot separate
+        root, ext = os.path.splitext(path)
+        path = f"{root}.local{ext}"
+    if not is_storage_state_fresh(path, pytestconfig.getoption("--storage-state-max-age")):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        logger.info(f"Recording consent storage state: {path}")
+        context = browser.new_context(**CONTEXT_ARGS)
+        try:
+            route_network(context, "session_consent", pytestconfig)
+            HomePage(context.new_page(), url=target_url).open()
+            tmp_path = temp_path_for(path)
+            context.storage_state(path=tmp_path)
+            if not publish(tmp_path, path):
+                return None
+        except Exception as e:
+            logger.warning(f"Could not record storage state: {e}")
+            return None
+        finally:
+            context.close()
+    
+    HomePage.storage_state_path = path
+    return path
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(consent_storage_state: Optional[str]) -> Dict:
     """
     Browser context arguments
     Configure viewport, locale, etc.
     """
-    return {
-        "viewport": {"width": 1920, "height": 1080},
-        "locale": "en-US",
-        "timezone_id": "Europe/Amsterdam",
-        "permissions": ["geolocation"],
-    }
+    context_args = dict(CONTEXT_ARGS)
+    if consent_storage_state:
+        context_args["storage_state"] = consent_storage_state
+    return context_args
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, browser_context_args: Dict, pytestconfig) -> Generator[Optional[ContextPool], None, None]:
+    """
+    Per-worker pool of pre-warmed browser contexts
+    
+    Yields:
+        ContextPool instance, or None when --context-pool-size is 0
+    """
+    size = pytestconfig.getoption("--context-pool-size")
+    if size <= 0:
+        yield None
+        return
+    
+    pool = ContextPool(
+        browser,
+        browser_context_args,
+        size=size,
+        max_uses=pytestconfig.getoption("--context-pool-max-uses"),
+    )
+    yield pool
+    pytestconfig.stash[CONTEXT_POOL_STATS_KEY] = pool.stats()
+    pool.close()
+
+
+def attach_resource_filter(context: BrowserContext, request: pytest.FixtureRequest,
+                           sizes: Dict[str, int]) -> ResourceFilter:
+    """
+    Attach the resource filter to a test context
+    
+    Args:
+        context: Browser context, already routed for the --network mode
+        request: pytest fixture request of the test
+        sizes: Learned response sizes
+        
+    Returns:
+        ResourceFilter attached to the context
+    """
+    config = request.config
+    resource_filter = ResourceFilter(
+        block_types=_split_option(config.getoption("--block-types")),
+        block_domains=_split_option(config.getoption("--block-domains")),
+        allow_domains=_split_option(config.getoption("--allow-domains")),
+        sizes=sizes,
+    )
+    resource_filter.attach(context, block=resource_blocking_enabled(request.node, config))
+    request.node.stash[RESOURCE_FILTER_KEY] = resource_filter
+    return resource_filter
+
+
+@pytest.fixture(scope="function")
+def context(
+    browser: Browser,
+    browser_context_args: Dict,
+    context_pool: Optional[ContextPool],
+    resource_sizes: Dict[str, int],
+    request: pytest.FixtureRequest,
+) -> Generator[BrowserContext, None, None]:
+    """
+    Provide a browser context for each test
+    
+    Contexts come from the pool and are reset on release. Tests marked with
+    browser_context_args get a dedicated context with the extra arguments, and
+    so does --network=record because the HAR is written when the context closes.
+    
+    Yields:
+        BrowserContext instance
+    """
+    marker = next(request.node.iter_markers("browser_context_args"), None)
+    recording = request.config.getoption("--network") == "record"
+    if context_pool is None or marker or recording:
+        context_args = {**browser_context_args, **(marker.kwargs if marker else {})}
+        context = browser.new_context(**context_args)
+        route_network(context, strip_group(request.node.nodeid), request.config)
+        resource_filter = attach_resource_filter(context, request, resource_sizes)
+        ring = bind_step_tracing(context, request.node)
+        yield context
+        if ring:
+            ring.close()
+        resource_filter.detach()
+        context.close()
+        return
+    
+    context = context_pool.acquire()
+    route_network(context, strip_group(request.node.nodeid), request.config)
+    resource_filter = attach_resource_filter(context, request, resource_sizes)
+    ring = bind_step_tracing(context, request.node)
+    yield context
+    if ring:
+        ring.close()
+    resource_filter.detach()
+    context_pool.release(context)
+
+
+@pytest.fixture(scope="function")
+def search_capture(homepage: HomePage, request: pytest.FixtureRequest) -> Generator[SearchCapture, None, None]:
+    """
+    Capture search API responses on the homepage's context for one test
+    
+    Request it before the search is submitted. Latency, payload size and
+    result count of the last response go to the report properties.
+    
+    Yields:
+        SearchCapture attached to the context
+    """
+    capture = SearchCapture(
+        mode=request.config.getoption("--search-fixtures"),
+        fixture_dir=request.config.getoption("--search-fixtures-dir"),
+    )
+    capture.attach(homepage.page.context)
+    request.node.stash[SEARCH_CAPTURE_KEY] = capture
+    yield capture
+    capture.detach()
 
 
 @pytest.fixture(scope="function")
@@ -50,7 +434,7 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page = context.new_page()
     
     # Set default timeout
-    page.set_default_timeout(30000)
+    page.set_default_timeout(BasePage.default_timeout)
     
     yield page
     
@@ -58,6 +442,209 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page.close()
 
 
+@pytest.fixture(scope="session")
+def warm_homepage(browser: Browser, browser_context_args: Dict, target_url: str,
+                  pytestconfig) -> Generator[HomePage, None, None]:
+    """
+    One loaded homepage per worker, shared by route matrix rows
+    
+    Rows reset the search form in place instead of opening the page again.
+    
+    Yields:
+        Opened HomePage on a dedicated context
+    """
+    context = browser.new_context(**browser_context_args)
+    route_network(context, "route_matrix", pytestconfig)
+    page = context.new_page()
+    page.set_default_timeout(BasePage.default_timeout)
+    homepage = HomePage(page, url=target_url)
+    homepage.open()
+    yield homepage
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def traced_warm_homepage(warm_homepage: HomePage, request: pytest.FixtureRequest) -> Generator[HomePage, None, None]:
+    """
+    The worker's warmed homepage with step tracing bound for one test
+    
+    Yields:
+        The shared HomePage
+    """
+    ring = bind_step_tracing(warm_homepage.page.context, request.node)
+    yield warm_homepage
+    if ring:
+        ring.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_wait_stats() -> Generator[None, None, None]:
+    """
+    Reset the timed-out wait counter before each test
+    """
+    wait_stats.reset()
+    yield
+
+
+STEP_TRACE_KEY = pytest.StashKey[float]()
+
+
+def pytest_bdd_before_step(request, feature, scenario, step, step_func):
+    """
+    Start timing a BDD step
+    """
+    step_timer.start_step(strip_group(request.node.nodeid), scenario.name, f"{step.keyword} {step.name}")
+    request.node.stash[STEP_TRACE_KEY] = action_tracer.begin()
+    request.node.stash[CURRENT_STEP_KEY] = f"{step.keyword} {step.name}"
+    ring = request.node.stash.get(TRACE_RING_KEY, None)
+    if ring:
+        ring.start_step(f"{step.keyword} {step.name}")
+
+
+def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func_args):
+    """
+    Finish timing a passed BDD step
+    """
+    step_timer.end_step("passed")
+    action_tracer.end(f"{step.keyword} {step.name}", "step", request.node.stash[STEP_TRACE_KEY])
+    _end_traced_step(request.node, "passed")
+
+
+def pytest_bdd_step_error(request, feature, scenario, step, step_func, step_func_args, exception):
+    """
+    Finish timing a failed BDD step
+    """
+    step_timer.end_step("failed")
+    action_tracer.end(
+        f"{step.keyword} {step.name}", "step", request.node.stash[STEP_TRACE_KEY], {"error": type(exception).__name__}
+    )
+    _end_traced_step(request.node, "failed")
+
+
+def _end_traced_step(node: pytest.Item, status: str) -> None:
+    """
+    Save the finished step's trace chunk into the ring buffer
+    """
+    node.stash[CURRENT_STEP_KEY] = ""
+    ring = node.stash.get(TRACE_RING_KEY, None)
+    if ring:
+        try:
+            ring.end_step(status)
+        except Exception as e:
+            logger.warning(f"Could not save step trace chunk: {e}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """
+    Trace the test body as an enclosing span
+    """
+    started = action_tracer.begin()
+    yield
+    action_tracer.end(strip_group(item.nodeid), "test", started)
+
+
+def _step_timing_table(records: list) -> str:
+    """
+    Render step timings as an HTML table
+    
+    Args:
+        records: Step records or (step, summary) rows
+        
+    Returns:
+        HTML table
+    """
+    rows = "".join(
+        f"<tr><td>{html.escape(r['step'])}</td><td>{r['wall_ms']}</td><td>{r['playwright_ms']}</td>"
+        f"<td>{r['sleep_ms']}</td><td>{r['status']}</td></tr>"
+        for r in records
+    )
+    return (
+        "<table><tr><th>Step</th><th>Wall ms</th><th>Playwright ms</th>"
+        f"<th>Fixed sleep ms</th><th>Status</th></tr>{rows}</table>"
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    """
+    Add step timing percentiles across runs to the HTML report
+    """
+    records = load_history(DEFAULT_HISTORY_PATH)
+    if not step_timer.written:
+        records += step_timer.records
+    if not records:
+        return
+    
+    rows = "".join(
+        f"<tr><td>{html.escape(step)}</td><td>{stats['samples']}</td>"
+        f"<td>{stats['wall_ms'].get('p50')}</td><td>{stats['wall_ms'].get('p95')}</td>"
+        f"<td>{stats['playwright_ms'].get('p50')}</td><td>{stats['sleep_ms'].get('p50')}</td></tr>"
+        for step, stats in sorted(summarize(records).items(), key=lambda item: -item[1]["wall_ms"]["p50"])
+    )
+    postfix.append(
+        "<h2>Step timings (all runs)</h2>"
+        "<table><tr><th>Step</th><th>Samples</th><th>Wall p50 ms</th><th>Wall p95 ms</th>"
+        f"<th>Playwright p50 ms</th><th>Fixed sleep p50 ms</th></tr>{rows}</table>"
+    )
+
+
+PERF_COLUMNS = (
+    ("label", "Page"),
+    ("same_document", "Same document"),
+    ("ttfb_ms", "TTFB ms"),
+    ("dom_content_loaded_ms", "DCL ms"),
+    ("load_ms", "Load ms"),
+    ("first_contentful_paint_ms", "FCP ms"),
+    ("lcp_ms", "LCP ms"),
+    ("cls", "CLS"),
+    ("long_task_count", "Long tasks"),
+    ("long_task_ms", "Long task ms"),
+    ("cdp_ScriptDuration_ms", "Script ms"),
+    ("cdp_JSHeapUsedSize", "JS heap bytes"),
+)
+
+
+def _perf_metrics_table(records: list) -> str:
+    """
+    Render browser performance records as an HTML table
+    
+    Args:
+        records: Records from perf_monitor.take()
+        
+    Returns:
+        HTML table
+    """
+    header = "".join(f"<th>{title}</th>" for _, title in PERF_COLUMNS)
+    rows = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(record.get(key, '')))}</td>" for key, _ in PERF_COLUMNS) + "</tr>"
+        for record in records
+    )
+    return f"<table><tr>{header}</tr>{rows}</table>"
+
+
+def _log_time_to_first_result(item, homepage: HomePage) -> None:
+    """
+    Append one search's time to first result to the --ttfr-log file, if set
+    """
+    path = item.config.getoption("--ttfr-log")
+    if not path:
+        return
+    record = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "test": strip_group(item.nodeid),
+        "url": homepage.get_current_url(),
+        "results": homepage.results_state,
+        "time_to_first_result_ms": homepage.time_to_first_result_ms,
+    }
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning(f"Could not log time to first result to {path}: {e}")
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
@@ -66,11 +653,84 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     
+    # Accumulate setup + call + teardown time for the duration store
+    duration = item.config.stash[TEST_DURATIONS_KEY].setdefault(
+        strip_group(item.nodeid), {"outcome": "passed", "duration_ms": 0.0}
+    )
+    duration["duration_ms"] += report.duration * 1000
+    if report.failed:
+        duration["outcome"] = "failed"
+    elif report.skipped and duration["outcome"] == "passed":
+        duration["outcome"] = "skipped"
+    
+    # Record time lost to waits that timed out
+    if report.when == "call":
+        report.user_properties.append(("timed_out_wait_ms", round(wait_stats.timed_out_ms)))
+        report.user_properties.append(("timed_out_wait_count", wait_stats.timed_out_count))
+        logger.info(
+            f"Timed-out waits: {wait_stats.timed_out_count} "
+            f"({wait_stats.timed_out_ms:.0f} ms) in {item.name}"
+        )
+        
+        resource_filter = item.stash.get(RESOURCE_FILTER_KEY, None)
+        if resource_filter:
+            savings = resource_filter.summary()
+            report.user_properties.extend(savings.items())
+            logger.info(
+                f"Resource filter blocked {savings['blocked_requests']} requests "
+                f"(at least {savings['blocked_bytes'] / 1024:.0f} KiB, {savings['unknown_size_requests']} "
+                f"of unknown size) in {item.name}"
+            )
+        
+        if item.config.getoption("--memory-report"):
+            server = item.config.stash.get(SHARED_BROWSER_KEY, None)
+            item.config.stash[MEMORY_SAMPLER_KEY].sample(os.getpid(), exclude=[server.pid] if server else [])
+        
+        capture = item.stash.get(SEARCH_CAPTURE_KEY, None)
+        if capture and capture.responses:
+            report.user_properties.extend(capture.responses[-1].metrics().items())
+        
+        homepage = item.funcargs.get('homepage')
+        time_to_first_result_ms = getattr(homepage, 'time_to_first_result_ms', None)
+        if time_to_first_result_ms is not None:
+            report.user_properties.append(("time_to_first_result_ms", time_to_first_result_ms))
+            _log_time_to_first_result(item, homepage)
+        
+        steps = step_timer.records_for(strip_group(item.nodeid))
+        if steps:
+            report_extras = getattr(report, "extras", [])
+            report_extras.append(extras.html(_step_timing_table(steps)))
+            report.extras = report_extras
+        
+        ring = item.stash.get(TRACE_RING_KEY, None)
+        budget_ms = item.config.getoption("--trace-budget-ms")
+        over_budget = budget_ms > 0 and report.duration * 1000 > budget_ms
+        if ring and (report.failed or over_budget):
+            try:
+                kept = ring.keep(trace_dir_for(item.config.getoption("--trace-dir"), strip_group(item.nodeid)))
+                reason = "failed" if report.failed else f"took {report.duration * 1000:.0f} ms > {budget_ms} ms budget"
+                report.user_properties.append(("step_traces", len(kept)))
+                report_extras = getattr(report, "extras", [])
+                report_extras.append(extras.html(
+                    f"<p>Step traces ({reason}; open with <code>playwright show-trace</code>):<br>"
+                    + "<br>".join(kept) + "</p>"
+                ))
+                report.extras = report_extras
+            except Exception as e:
+                logger.error(f"Failed to keep step traces: {e}")
+        
+        perf_records = perf_monitor.take()
+        if perf_records:
+            report_extras = getattr(report, "extras", [])
+            report_extras.append(extras.html(_perf_metrics_table(perf_records)))
+            report.extras = report_extras
+            append_series(perf_records, strip_group(item.nodeid), item.config.getoption("--perf-series"))
+    
     # Only for failed tests in call phase
     if report.when == "call" and report.failed:
         try:
-            # Get the page fixture from the test
-            page = item.funcargs.get('page')
+            # Get the page fixture from the test (route matrix rows only hold the homepage)
+            page = item.funcargs.get('page') or getattr(item.funcargs.get('homepage'), 'page', None)
             if page:
                 # Create screenshots directory if it doesn't exist
                 screenshot_dir = "reports/screenshots"
@@ -85,17 +745,358 @@ def pytest_runtest_makereport(item, call):
                 logger.info(f"Screenshot saved: {screenshot_path}")
                 
                 # Attach to HTML report
-                extra = getattr(report, 'extra', [])
-                extra.append(pytest.html.extras.image(screenshot_path))
-                report.extra = extra
+                report_extras = getattr(report, 'extras', [])
+                report_extras.append(extras.image(screenshot_path))
+                report.extras = report_extras
         except Exception as e:
             logger.error(f"Failed to capture screenshot: {e}")
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Order and split tests across xdist workers by estimated cost
+    
+    With --schedule lpt every test is ordered longest first by its mean
+    duration in the duration store and, under xdist, assigned to one
+    xdist_group per worker (longest-processing-time-first); tests without
+    history cost the median. Otherwise only route matrix rows are split,
+    with costs from step timing history, then the matrix "cost" column.
+    Either way --dist loadgroup keeps each group, and its warmed homepage,
+    on one worker. Runs first: xdist reads the xdist_group markers in its own
+    hook implementation, suffixing node ids with "@<group>".
+    
+    Tests marked local_only are skipped unless --target=local.
+    """
+    if config.getoption("--target") != "local":
+        skip_live = pytest.mark.skip(reason="Asserts on the offline stand-in's results (--target=local)")
+        for item in items:
+            if item.get_closest_marker("local_only"):
+                item.add_marker(skip_live)
+    
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+    if config.getoption("--schedule") == "lpt":
+        db_path = config.getoption("--duration-db")
+        history = DurationStore(db_path).test_durations() if db_path else {}
+        known = sorted(history.values())
+        fallback = known[len(known) // 2] if known else DEFAULT_ROW_COST * 1000
+        costs = {item.nodeid: history.get(strip_group(item.nodeid), fallback) for item in items}
+        items.sort(key=lambda item: -costs[item.nodeid])
+        known_items = sum(1 for item in items if strip_group(item.nodeid) in history)
+        logger.info(f"Longest-first schedule: {known_items} of {len(items)} tests have duration history")
+        if workers >= 2:
+            groups = split_by_cost(costs, workers)
+            for item in items:
+                item.add_marker(pytest.mark.xdist_group(f"lpt_{groups[item.nodeid]}"))
+        return
+    
+    matrix_items = [item for item in items if item.get_closest_marker("route_matrix")]
+    if workers < 2 or not matrix_items:
+        return
+    
+    row_costs = {route_key(row): row.get("cost") for row in load_routes(matrix_path())}
+    history_costs = historical_costs(load_history(DEFAULT_HISTORY_PATH))
+    costs = {}
+    for item in matrix_items:
+        example = item.callspec.params.get("_pytest_bdd_example", {})
+        costs[item.nodeid] = estimate_cost(strip_group(item.nodeid), row_costs.get(route_key(example)), history_costs)
+    groups = split_by_cost(costs, workers)
+    for item in matrix_items:
+        item.add_marker(pytest.mark.xdist_group(f"route_matrix_{groups[item.nodeid]}"))
+
+
+def pytest_collection_finish(session):
+    """
+    Warn on an xdist worker when grouped tests did not get their "@<group>" node id suffix
+    """
+    if not hasattr(session.config, "workerinput") or session.config.getoption("dist", None) != "loadgroup":
+        return
+    ungrouped = [
+        item.nodeid for item in session.items
+        if item.get_closest_marker("xdist_group") and "@" not in item.nodeid
+    ]
+    if ungrouped:
+        logger.warning(
+            f"{len(ungrouped)} test(s) have an xdist_group marker but no group suffix, "
+            f"so loadgroup will not keep them together: {ungrouped[:3]}"
+        )
+
+
+def pytest_addoption(parser):
+    """
+    Register custom command line options
+    """
+    parser.addoption(
+        "--profile",
+        action="store",
+        choices=sorted(PROFILES),
+        default=default_profile(),
+        help="Execution profile: debug (headed, slowed), ci (headless) or benchmark (max speed)",
+    )
+    parser.addoption(
+        "--target",
+        action="store",
+        choices=["live", "local"],
+        default=os.getenv("TARGET", "live"),
+        help="Run against live Kiwi.com or the bundled offline stand-in",
+    )
+    parser.addoption(
+        "--network",
+        action="store",
+        choices=NETWORK_MODES,
+        default=os.getenv("NETWORK_MODE", "live"),
+        help="Record traffic per scenario into HAR archives, replay it, or go live",
+    )
+    parser.addoption(
+        "--network-missing",
+        action="store",
+        choices=MISSING_POLICIES,
+        default=os.getenv("NETWORK_MISSING", "abort"),
+        help="In replay mode, abort requests missing from the archive or send them to the network",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default=os.getenv("HAR_DIR", DEFAULT_HAR_DIR),
+        help="Directory for per-scenario HAR archives",
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store",
+        choices=["auto", "on", "off"],
+        default=os.getenv("BLOCK_RESOURCES", "auto"),
+        help="Block unneeded resources: auto decides per test from its markers",
+    )
+    parser.addoption(
+        "--block-resources-on",
+        action="store",
+        default="smoke,block_resources",
+        help="Markers that enable the resource filter in auto mode (comma separated)",
+    )
+    parser.addoption(
+        "--block-resources-off",
+        action="store",
+        default="visual,allow_resources",
+        help="Markers that disable the resource filter in auto mode (comma separated)",
+    )
+    parser.addoption(
+        "--block-types",
+        action="store",
+        default=",".join(DEFAULT_BLOCKED_TYPES),
+        help="Resource types to block (comma separated)",
+    )
+    parser.addoption(
+        "--block-domains",
+        action="store",
+        default=",".join(DEFAULT_BLOCKED_DOMAINS),
+        help="Analytics/ad domains to block (comma separated)",
+    )
+    parser.addoption(
+        "--allow-domains",
+        action="store",
+        default="",
+        help="Domains never blocked, overriding the deny lists (comma separated)",
+    )
+    parser.addoption(
+        "--trace-actions",
+        action="store_true",
+        default=os.getenv("TRACE_ACTIONS", "").lower() in ("1", "true", "yes"),
+        help="Write BasePage actions to a Chrome trace file (reports/action_trace.json)",
+    )
+    parser.addoption(
+        "--no-step-timing",
+        action="store_true",
+        default=False,
+        help="Disable per-step wall/Playwright/sleep timing",
+    )
+    parser.addoption(
+        "--strict-waits",
+        action="store_true",
+        default=False,
+        help="Fail when a page object falls back to a fixed sleep",
+    )
+    parser.addoption(
+        "--selector-cache",
+        action="store",
+        default=os.getenv("SELECTOR_CACHE", DEFAULT_CACHE_PATH),
+        help="File for learned winning selectors (shared across xdist workers)",
+    )
+    parser.addoption(
+        "--selector-cache-max-misses",
+        action="store",
+        type=int,
+        default=int(os.getenv("SELECTOR_CACHE_MAX_MISSES", DEFAULT_MAX_MISSES)),
+        help="Evict a learned selector after this many misses",
+    )
+    parser.addoption(
+        "--storage-state",
+        action="store",
+        default=os.getenv("STORAGE_STATE", DEFAULT_STORAGE_STATE_PATH),
+        help="Consented storage state snapshot shared by all test contexts",
+    )
+    parser.addoption(
+        "--storage-state-max-age",
+        action="store",
+        type=float,
+        default=float(os.getenv("STORAGE_STATE_MAX_AGE", DEFAULT_MAX_AGE_HOURS)),
+        help="Re-record the storage state snapshot after this many hours",
+    )
+    parser.addoption(
+        "--no-storage-state",
+        action="store_true",
+        default=False,
+        help="Run cookie consent in every test instead of loading a snapshot",
+    )
+    parser.addoption(
+        "--context-pool-size",
+        action="store",
+        type=int,
+        default=int(os.getenv("CONTEXT_POOL_SIZE", 2)),
+        help="Pre-warmed browser contexts per worker (0 creates one context per test)",
+    )
+    parser.addoption(
+        "--context-pool-max-uses",
+        action="store",
+        type=int,
+        default=int(os.getenv("CONTEXT_POOL_MAX_USES", 50)),
+        help="Recycle a pooled context after this many tests",
+    )
+    parser.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=os.getenv("SHARED_BROWSER", "").lower() in ("1", "true", "yes"),
+        help="Start one browser for the session; xdist workers attach to it with their own contexts",
+    )
+    parser.addoption(
+        "--memory-report",
+        action="store_true",
+        default=os.getenv("MEMORY_REPORT", "").lower() in ("1", "true", "yes"),
+        help="Sample peak RSS per worker process tree after each test and summarize it",
+    )
+    parser.addoption(
+        "--search-fixtures",
+        action="store",
+        choices=SEARCH_FIXTURE_MODES,
+        default=os.getenv("SEARCH_FIXTURES", "off"),
+        help="Record search API responses as fixtures, or replay them instead of calling the API",
+    )
+    parser.addoption(
+        "--search-fixtures-dir",
+        action="store",
+        default=os.getenv("SEARCH_FIXTURES_DIR", DEFAULT_FIXTURE_DIR),
+        help="Directory of recorded search API responses",
+    )
+    parser.addoption(
+        "--trace-on-failure",
+        action="store_true",
+        default=os.getenv("TRACE_ON_FAILURE", "").lower() in ("1", "true", "yes"),
+        help="Trace each step into a ring buffer and keep the last --trace-steps chunks of failed or slow tests",
+    )
+    parser.addoption(
+        "--trace-steps",
+        action="store",
+        type=int,
+        default=int(os.getenv("TRACE_STEPS", DEFAULT_RING_SIZE)),
+        help="Step trace chunks kept in the ring buffer",
+    )
+    parser.addoption(
+        "--trace-budget-ms",
+        action="store",
+        type=float,
+        default=float(os.getenv("TRACE_BUDGET_MS", 0)),
+        help="Also keep step traces of passing tests slower than this (0 disables)",
+    )
+    parser.addoption(
+        "--trace-dir",
+        action="store",
+        default=os.getenv("TRACE_DIR", DEFAULT_TRACE_DIR),
+        help="Directory for kept step traces",
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=os.getenv("PERF_METRICS", "").lower() in ("1", "true", "yes"),
+        help="Collect Navigation/Paint Timing, LCP, CLS, long tasks and CDP metrics per page load",
+    )
+    parser.addoption(
+        "--perf-series",
+        action="store",
+        default=os.getenv("PERF_SERIES", DEFAULT_SERIES_PATH),
+        help="JSON Lines time series the performance metrics are appended to",
+    )
+    parser.addoption(
+        "--ttfr-log",
+        action="store",
+        default=os.getenv("TTFR_LOG", ""),
+        help="Append time to first result of every search to this JSON Lines file",
+    )
+    parser.addoption(
+        "--duration-db",
+        action="store",
+        default=os.getenv("DURATION_DB", DEFAULT_DURATION_DB),
+        help="SQLite store of per-test and per-step durations, appended after every run (empty disables)",
+    )
+    parser.addoption(
+        "--schedule",
+        action="store",
+        choices=["collection", "lpt"],
+        default=os.getenv("TEST_SCHEDULE", "collection"),
+        help="Test order: collection order, or longest first from the duration store (use --dist loadgroup)",
+    )
+    parser.addoption(
+        "--no-selector-cache",
+        action="store_true",
+        default=False,
+        help="Disable the learned selector cache",
+    )
+
+
 def pytest_configure(config):
     """
     Configure pytest
     """
+    profile = PROFILES[config.getoption("--profile")]
+    BasePage.default_timeout = profile["timeout"]
+    BasePage.typing_delay = profile["typing_delay"]
+    metadata = config.stash.get(metadata_key, None)
+    if metadata is not None:
+        metadata["Execution profile"] = describe(config.getoption("--profile"))
+    if config.getoption("--strict-waits"):
+        BasePage.strict_waits = True
+    if BasePage.strict_waits:
+        guard_fixed_sleeps()
+    if not config.getoption("--no-step-timing"):
+        step_timer.install()
+        if metadata is not None and not step_timer.instrumented:
+            metadata["Step timing"] = "wall time only (Playwright release not verified)"
+    action_tracer.enabled = config.getoption("--trace-actions")
+    perf_monitor.enabled = config.getoption("--perf-metrics")
+    if not config.getoption("--no-selector-cache"):
+        BasePage.selector_cache = SelectorCache(
+            config.getoption("--selector-cache"),
+            max_misses=config.getoption("--selector-cache-max-misses"),
+        )
+    config.stash[MEMORY_SAMPLER_KEY] = MemorySampler()
+    config.stash[WORKER_MEMORY_KEY] = {}
+    config.stash[TEST_DURATIONS_KEY] = {}
+    workerinput = getattr(config, "workerinput", {})
+    config.stash[DURATION_RUN_KEY] = workerinput.get("duration_run") or {
+        "run_id": f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}",
+        "started": datetime.now().isoformat(timespec="seconds"),
+    }
+    if config.getoption("--shared-browser") and not hasattr(config, "workerinput"):
+        browsers = config.getoption("browser", None) or ["chromium"]
+        if any(name != "chromium" for name in browsers):
+            raise pytest.UsageError(
+                f"--shared-browser attaches over the Chromium DevTools protocol and cannot run --browser "
+                f"{' '.join(browsers)}; use --browser chromium or drop --shared-browser"
+            )
+        with sync_playwright() as playwright:
+            executable_path = playwright.chromium.executable_path
+        server = BrowserServer(executable_path, headless=launch_options(config)["headless"])
+        server.start()
+        config.stash[SHARED_BROWSER_KEY] = server
+    
     # Create reports directory
     os.makedirs("reports", exist_ok=True)
     os.makedirs("reports/screenshots", exist_ok=True)
@@ -109,4 +1110,170 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "one_way: Mark test as one-way flight test"
-    )
\ No newline at end of file
+    )
+    config.addinivalue_line(
+        "markers", "visual: Visual check - resources are never blocked"
+    )
+    config.addinivalue_line(
+        "markers", "block_resources: Block images, fonts, analytics and ads"
+    )
+    config.addinivalue_line(
+        "markers", "allow_resources: Never block resources"
+    )
+    config.addinivalue_line(
+        "markers", "route_matrix: Data-driven route matrix rows sharing a warmed homepage"
+    )
+    config.addinivalue_line(
+        "markers", "local_only: Needs the offline stand-in's fixed results - skipped with --target=live"
+    )
+
+
+def pytest_report_header(config):
+    """
+    Show the active execution profile
+    """
+    return f"execution profile: {describe(config.getoption('--profile'))}"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Hand the shared browser endpoint and the duration run id to each xdist worker
+    """
+    node.workerinput["duration_run"] = node.config.stash[DURATION_RUN_KEY]
+    endpoint = shared_browser_endpoint(node.config)
+    if endpoint:
+        node.workerinput["shared_browser_endpoint"] = endpoint
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Collect the peak memory reported by a finished xdist worker
+    """
+    peak_rss_mb = getattr(node, "workeroutput", {}).get("peak_rss_mb")
+    if peak_rss_mb is not None:
+        node.config.stash[WORKER_MEMORY_KEY][node.workerinput["workerid"]] = peak_rss_mb
+
+
+def pytest_unconfigure(config):
+    """
+    Stop the shared browser server
+    """
+    server = config.stash.get(SHARED_BROWSER_KEY, None)
+    if server:
+        server.stop()
+
+
+def pytest_sessionfinish(session):
+    """
+    Write step timings for this run and append them to the history and duration store
+    """
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None and session.config.getoption("--memory-report"):
+        workeroutput["peak_rss_mb"] = session.config.stash[MEMORY_SAMPLER_KEY].peak_mb
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    path = DEFAULT_TIMINGS_PATH.replace(".json", f"_{worker}.json") if worker else DEFAULT_TIMINGS_PATH
+    step_timer.write(path, DEFAULT_HISTORY_PATH)
+    db_path = session.config.getoption("--duration-db")
+    if db_path:
+        run = session.config.stash[DURATION_RUN_KEY]
+        try:
+            DurationStore(db_path).record_run(
+                run["run_id"], run["started"], worker or "main",
+                session.config.stash[TEST_DURATIONS_KEY], step_timer.records,
+            )
+        except Exception as e:
+            logger.error(f"Failed to record durations in {db_path}: {e}")
+    trace_path = DEFAULT_TRACE_PATH.replace(".json", f"_{worker}.json") if worker else DEFAULT_TRACE_PATH
+    action_tracer.write(trace_path)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Summarize time per test spent in waits that timed out, context pool usage, memory,
+    time to first result and search API responses
+    """
+    pool_stats = config.stash.get(CONTEXT_POOL_STATS_KEY, None)
+    if pool_stats:
+        terminalreporter.write_sep("-", "browser context pool")
+        terminalreporter.write_line(
+            f"size={pool_stats['size']} created={pool_stats['created']} reused={pool_stats['reused']} "
+            f"recycled={pool_stats['recycled']} acquire avg={pool_stats['acquire_ms_avg']} ms "
+            f"max={pool_stats['acquire_ms_max']} ms"
+        )
+    
+    sampler = config.stash.get(MEMORY_SAMPLER_KEY, None)
+    worker_memory = dict(config.stash.get(WORKER_MEMORY_KEY, {}))
+    if not worker_memory and sampler and sampler.samples:
+        worker_memory["main"] = sampler.peak_mb
+    if worker_memory:
+        server = config.stash.get(SHARED_BROWSER_KEY, None)
+        server_mb = process_tree_rss_mb(server.pid) if server and server.pid else 0.0
+        total_mb = sum(worker_memory.values()) + server_mb
+        terminalreporter.write_sep("-", "peak memory (RSS)")
+        terminalreporter.write_line(
+            f"mode={'shared browser' if server else 'browser per worker'} workers={len(worker_memory)} "
+            f"total={total_mb:.0f} MiB per worker={total_mb / len(worker_memory):.0f} MiB"
+        )
+        for worker, rss_mb in sorted(worker_memory.items()):
+            terminalreporter.write_line(f"{rss_mb:>8.0f} MiB  {worker}")
+        if server:
+            terminalreporter.write_line(f"{server_mb:>8.0f} MiB  shared browser (at session end)")
+    
+    rows = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "call":
+                continue
+            properties = dict(report.user_properties)
+            if properties.get("timed_out_wait_count"):
+                rows.append((report.nodeid, properties["timed_out_wait_count"], properties["timed_out_wait_ms"]))
+    
+    blocked = [
+        dict(report.user_properties)
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call" and "blocked_requests" in dict(report.user_properties)
+    ]
+    if blocked:
+        terminalreporter.write_sep("-", "resource filter savings")
+        terminalreporter.write_line(
+            f"{sum(p['blocked_requests'] for p in blocked)} requests blocked, "
+            f"at least {sum(p['blocked_bytes'] for p in blocked) / 1024:.0f} KiB saved "
+            f"({sum(p['unknown_size_requests'] for p in blocked)} blocked requests of unknown size)"
+        )
+    
+    first_results = [
+        dict(report.user_properties)["time_to_first_result_ms"]
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call" and "time_to_first_result_ms" in dict(report.user_properties)
+    ]
+    if first_results:
+        stats = percentiles(first_results, (50, 95))
+        terminalreporter.write_sep("-", "time to first result")
+        terminalreporter.write_line(
+            f"{len(first_results)} searches  p50={stats['p50']} ms  p95={stats['p95']} ms  max={max(first_results)} ms"
+        )
+    
+    searches = [
+        dict(report.user_properties)
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call" and "search_api_results" in dict(report.user_properties)
+    ]
+    if searches:
+        latencies = [search["search_api_latency_ms"] for search in searches if search["search_api_latency_ms"] is not None]
+        stats = percentiles(latencies, (50, 95))
+        terminalreporter.write_sep("-", "search API")
+        terminalreporter.write_line(
+            f"{len(searches)} responses  latency p50={stats.get('p50')} ms  p95={stats.get('p95')} ms  "
+            f"avg size={sum(search['search_api_bytes'] for search in searches) / len(searches) / 1024:.1f} KiB  "
+            f"avg results={sum(search['search_api_results'] for search in searches) / len(searches):.1f}"
+        )
+    
+    if rows:
+        terminalreporter.write_sep("-", "time lost to timed-out waits")
+        for nodeid, count, ms in sorted(rows, key=lambda row: row[2], reverse=True):
+            terminalreporter.write_line(f"{ms:>8} ms  {count:>3} waits  {nodeid}")
@@ -0,0 +1,22 @@
+@route_matrix
+Feature: Route matrix
+    As a user
+    I want to search many routes from the same search form
+    So that every origin/destination/date combination is covered
+
+    # Rows below are extended at collection time from tests/data/route_matrix.csv
+    # (or the file named by ROUTE_MATRIX)
+    @one_way
+    Scenario Outline: One way search across the route matrix
+        Given the search form is ready
+        When I select one-way trip type
+        And Set as departure airport <origin>
+        And Set the arrival Airport <destination>
+        And Set the departure time <weeks> week in the future starting current date
+        And Uncheck the "Check accommodation with booking.com" option
+        And Click the search button
+        Then I am redirected to search results page
+
+        Examples:
+            | origin | destination | weeks |
+            | RTM    | MAD         | 1     |
@@ -0,0 +1,19 @@
+@local_only
+Feature: Search results
+    As a user
+    I want the results list to show priced itineraries
+    So that I can compare travel options
+
+    # The stand-in's /api/search serves fixed itineraries; live results are not stable enough to assert on
+    @one_way
+    Scenario: One way search results list priced itineraries
+        Given As an not logged user navigate to homepage https://www.kiwi.com/en/
+        When I select one-way trip type
+        And Set as departure airport RTM
+        And Set the arrival Airport MAD
+        And Set the departure time 1 week in the future starting current date
+        And Uncheck the "Check accommodation with booking.com" option
+        And Click the search button
+        Then I am redirected to search results page
+        And the search API returned priced itineraries
+        And the results list shows 5 priced itineraries
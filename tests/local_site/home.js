@@ -0,0 +1,181 @@
+// Behaviour of the local Kiwi.com landing page stand-in
+(function () {
+    const AIRPORTS = [
+        {code: 'RTM', name: 'Rotterdam The Hague Airport', city: 'Rotterdam'},
+        {code: 'AMS', name: 'Amsterdam Airport Schiphol', city: 'Amsterdam'},
+        {code: 'EIN', name: 'Eindhoven Airport', city: 'Eindhoven'},
+        {code: 'MAD', name: 'Adolfo Suárez Madrid–Barajas', city: 'Madrid'},
+        {code: 'BCN', name: 'Josep Tarradellas Barcelona–El Prat', city: 'Barcelona'},
+        {code: 'LHR', name: 'Heathrow', city: 'London'},
+        {code: 'STN', name: 'Stansted', city: 'London'},
+        {code: 'PRG', name: 'Václav Havel Airport Prague', city: 'Prague'},
+        {code: 'VIE', name: 'Vienna International', city: 'Vienna'},
+        {code: 'SOF', name: 'Sofia Airport', city: 'Sofia'},
+        {code: 'CDG', name: 'Charles de Gaulle', city: 'Paris'},
+        {code: 'FCO', name: 'Fiumicino', city: 'Rome'},
+    ];
+    const MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+        'August', 'September', 'October', 'November', 'December'];
+
+    const $ = (selector, root = document) => root.querySelector(selector);
+    const state = {mode: 'return', date: null, pendingDate: null, activePicker: null};
+
+    // Cookie consent
+    const cookies = $('[data-test="CookiesPopup"]');
+    if (!document.cookie.split('; ').includes('kiwi_consent=1')) {
+        cookies.hidden = false;
+    }
+    $('[data-test="CookiesPopup-Accept"]').addEventListener('click', () => {
+        document.cookie = 'kiwi_consent=1; max-age=31536000; path=/';
+        cookies.hidden = true;
+    });
+
+    // Trip mode
+    const modeButton = $('.mode-picker');
+    const modePopup = $('.mode-popup');
+    modeButton.addEventListener('click', () => { modePopup.hidden = !modePopup.hidden; });
+    const setMode = (mode, label) => {
+        state.mode = mode;
+        modeButton.textContent = label;
+        modeButton.dataset.test = `SearchFormModesPicker-active-${mode}`;
+        modePopup.hidden = true;
+    };
+    $('[data-test="ModePopupOption-oneWay"]').addEventListener('click', () => setMode('oneWay', 'One-way'));
+    $('[data-test="ModePopupOption-return"]').addEventListener('click', () => setMode('return', 'Return'));
+
+    // Place pickers
+    const suggestions = $('.suggestions');
+    const addChip = (picker, airport) => {
+        const chip = document.createElement('div');
+        chip.className = 'chip';
+        chip.dataset.test = 'PlacePickerInputPlace';
+        chip.dataset.code = airport.code;
+        chip.textContent = `${airport.city} ${airport.code} `;
+        const close = document.createElement('span');
+        close.dataset.test = 'PlacePickerInputPlace-close';
+        close.setAttribute('role', 'button');
+        close.textContent = '×';
+        close.addEventListener('click', (event) => { event.stopPropagation(); chip.remove(); });
+        chip.appendChild(close);
+        $('.chips', picker).appendChild(chip);
+    };
+    const closeSuggestions = () => { suggestions.hidden = true; suggestions.innerHTML = ''; };
+    const matches = (query) => {
+        const q = query.trim().toLowerCase();
+        if (!q) return [];
+        return AIRPORTS.filter(a => a.code.toLowerCase().startsWith(q)
+            || a.city.toLowerCase().startsWith(q) || a.name.toLowerCase().includes(q));
+    };
+    const choose = (picker, airport) => {
+        addChip(picker, airport);
+        $('input', picker).value = '';
+        closeSuggestions();
+    };
+    const showSuggestions = (picker) => {
+        const results = matches($('input', picker).value);
+        suggestions.innerHTML = '';
+        results.forEach(airport => {
+            const row = document.createElement('div');
+            row.dataset.test = 'PlacePickerRow-station';
+            row.dataset.code = airport.code;
+            row.setAttribute('role', 'button');
+            row.textContent = `${airport.code} ${airport.name}, ${airport.city}`;
+            row.addEventListener('click', () => choose(picker, airport));
+            suggestions.appendChild(row);
+        });
+        suggestions.hidden = results.length === 0;
+    };
+    document.querySelectorAll('.place-picker').forEach(picker => {
+        const input = $('input', picker);
+        const preset = AIRPORTS.find(a => a.code === picker.dataset.default);
+        if (preset) addChip(picker, preset);
+        input.addEventListener('focus', () => { state.activePicker = picker; });
+        // Emulate the autocomplete round trip
+        input.addEventListener('input', () => setTimeout(() => showSuggestions(picker), 50));
+        input.addEventListener('keydown', (event) => {
+            if (event.key === 'Enter') {
+                event.preventDefault();
+                const first = matches(input.value)[0];
+                if (first) choose(picker, first);
+            }
+        });
+    });
+    document.addEventListener('keydown', (event) => {
+        if (event.key === 'Escape') {
+            closeSuggestions();
+            modePopup.hidden = true;
+        }
+    });
+
+    // Calendar
+    const dateInput = $('[data-test="SearchDateInput"]');
+    const calendar = $('[data-test="CalendarContainer"]');
+    const pad = (n) => String(n).padStart(2, '0');
+    const iso = (d) => `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
+    const renderMonth = (year, month, today) => {
+        const wrapper = document.createElement('div');
+        wrapper.className = 'month';
+        const title = document.createElement('div');
+        title.className = 'month-title';
+        title.textContent = `${MONTHS[month]} ${year}`;
+        const grid = document.createElement('div');
+        grid.className = 'month-grid';
+        const days = new Date(year, month + 1, 0).getDate();
+        for (let day = 1; day <= days; day++) {
+            const date = new Date(year, month, day);
+            const cell = document.createElement('div');
+            cell.className = 'leading-normal text-ink';
+            cell.dataset.date = iso(date);
+            cell.textContent = String(day);
+            if (iso(date) < iso(today)) {
+                cell.classList.add('disabled');
+            } else {
+                cell.addEventListener('click', () => {
+                    calendar.querySelectorAll('.selected').forEach(el => el.classList.remove('selected'));
+                    cell.classList.add('selected');
+                    state.pendingDate = cell.dataset.date;
+                });
+            }
+            grid.appendChild(cell);
+        }
+        wrapper.append(title, grid);
+        return wrapper;
+    };
+    dateInput.addEventListener('click', () => {
+        closeSuggestions();
+        const today = new Date();
+        const months = $('.months', calendar);
+        months.innerHTML = '';
+        for (let offset = 0; offset < 2; offset++) {
+            const first = new Date(today.getFullYear(), today.getMonth() + offset, 1);
+            months.appendChild(renderMonth(first.getFullYear(), first.getMonth(), today));
+        }
+        calendar.hidden = false;
+    });
+    const dateClear = $('[data-test="SearchDateInput-clear"]');
+    $('[data-test="SearchFormDoneButton"]').addEventListener('click', () => {
+        if (state.pendingDate) {
+            state.date = state.pendingDate;
+            dateInput.value = state.date;
+            dateClear.hidden = false;
+        }
+        calendar.hidden = true;
+    });
+    dateClear.addEventListener('click', () => {
+        state.date = null;
+        state.pendingDate = null;
+        dateInput.value = '';
+        dateClear.hidden = true;
+    });
+
+    // Search
+    const codes = (picker) => [...picker.querySelectorAll('[data-test="PlacePickerInputPlace"]')]
+        .map(chip => chip.dataset.code.toLowerCase()).join(',') || 'anywhere';
+    $('[data-test="LandingSearchButton"]').addEventListener('click', (event) => {
+        event.preventDefault();
+        const origin = codes($('[data-test="PlacePickerInput-origin"]'));
+        const destination = codes($('[data-test="PlacePickerInput-destination"]'));
+        const returnPart = state.mode === 'oneWay' ? 'no-return' : 'anytime';
+        window.location.assign(`/en/search/results/${origin}/${destination}/${state.date || 'anytime'}/${returnPart}`);
+    });
+})();
@@ -0,0 +1,38 @@
+// Renders itineraries from the local search API like the Kiwi.com results page
+(function () {
+    const [, , , , origin, destination, date] = window.location.pathname.split('/');
+    const list = document.querySelector('[data-test="ResultList"]');
+    const params = new URLSearchParams({origin, destination, date});
+    const CHUNK = 10;
+
+    const card = (itinerary) => {
+        const el = document.createElement('div');
+        el.dataset.test = 'ResultCardWrapper';
+        el.dataset.id = itinerary.id;
+        const carriers = itinerary.carriers
+            .map(c => `<img data-test="ResultCardCarrierLogo" alt="${c}" src="data:,">`).join('');
+        el.innerHTML = `
+            <div data-test="ResultCardPrice">€${itinerary.price}</div>
+            <div class="carriers">${carriers}</div>
+            <div data-test="TripDurationBadge">${Math.floor(itinerary.duration_minutes / 60)}h ${itinerary.duration_minutes % 60}m</div>
+            <div data-test="StopCountBadge-${itinerary.stops}">${itinerary.stops === 0 ? 'Direct' : itinerary.stops + ' stop(s)'}</div>`;
+        return el;
+    };
+
+    fetch(`/api/search?${params}`)
+        .then(response => response.json())
+        .then(payload => {
+            if (!payload.itineraries.length) {
+                list.innerHTML = '<div data-test="NoResultsMessage">No results found</div>';
+                return;
+            }
+            // Render in chunks across frames, like the real list streaming in
+            const render = (start) => {
+                payload.itineraries.slice(start, start + CHUNK).forEach(itinerary => list.appendChild(card(itinerary)));
+                if (start + CHUNK < payload.itineraries.length) {
+                    requestAnimationFrame(() => render(start + CHUNK));
+                }
+            };
+            render(0);
+        });
+})();
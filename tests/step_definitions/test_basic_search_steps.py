@@ -4,27 +4,46 @@ Step definitions for basic search feature
 import pytest
 from pytest_bdd import scenarios, given, when, then, parsers
 from pages.home_page import HomePage
+from pages.results_page import ResultsPage
+from utils.search_capture import SearchCapture
 from playwright.sync_api import Page
 import logging
+import os
+
+from utils.route_matrix import add_examples, load_routes, matrix_path
 
 logger = logging.getLogger(__name__)
 
-# Load scenarios from feature file
-scenarios('../features/basic_search.feature')
+ROUTE_MATRIX_FEATURE = os.path.join(os.path.dirname(__file__), os.pardir, "features", "route_matrix.feature")
+
+# Extend the route matrix Examples from CSV/JSON before the outline is bound
+add_examples(os.path.abspath(ROUTE_MATRIX_FEATURE), load_routes(matrix_path()))
+
+# Load scenarios from feature files
+scenarios('../features/basic_search.feature', '../features/route_matrix.feature', '../features/search_results.feature')
 
 
 @pytest.fixture
-def homepage(page: Page) -> HomePage:
+def homepage(request: pytest.FixtureRequest, target_url: str) -> HomePage:
     """
     Fixture to create HomePage instance
     
+    Route matrix rows share the worker's warmed homepage and only reset the
+    search form; every other scenario gets a fresh page.
+    
     Args:
-        page: Playwright page fixture
+        request: pytest fixture request
+        target_url: Landing page URL for the selected --target
         
     Returns:
         HomePage instance
     """
-    return HomePage(page)
+    if request.node.get_closest_marker("route_matrix"):
+        homepage = request.getfixturevalue("traced_warm_homepage")
+        homepage.reset_search_form()
+        return homepage
+    page: Page = request.getfixturevalue("page")
+    return HomePage(page, url=target_url)
 
 
 @given(parsers.parse('As an not logged user navigate to homepage {url}'))
@@ -37,12 +56,27 @@ def navigate_to_homepage(homepage: HomePage, url: str = "https://www.kiwi.com/en
         homepage: HomePage instance
         url: URL to navigate to
     """
+    # The feature names the live URL; --target=local serves the same page locally
+    url = url.replace(HomePage.URL, homepage.url)
     logger.info(f"Step: Navigate to homepage - {url}")
     homepage.open()
     assert homepage.get_current_url() == url or url in homepage.get_current_url(), \
         f"Failed to navigate to {url}"
 
 
+@given('the search form is ready')
+def search_form_ready(homepage: HomePage):
+    """
+    Check the (warmed) homepage shows the search form
+    
+    Args:
+        homepage: HomePage instance
+    """
+    logger.info("Step: Search form is ready")
+    assert homepage.wait_for_state(homepage.SEARCH_FORM, state="visible", timeout=5000), \
+        "Search form is not visible"
+
+
 @when('I select one-way trip type')
 def select_one_way_trip(homepage: HomePage):
     """
@@ -110,12 +144,13 @@ def uncheck_accommodation(homepage: HomePage, option: str = None):
 
 
 @when('Click the search button')
-def click_search(homepage: HomePage):
+def click_search(homepage: HomePage, search_capture: SearchCapture):
     """
     Click search button
     
     Args:
         homepage: HomePage instance
+        search_capture: Search API capture, attached before the click
     """
     logger.info("Step: Click search button")
     homepage.click_search_button()
@@ -131,5 +166,41 @@ def verify_results_page(homepage: HomePage):
     """
     logger.info("Step: Verify redirect to results page")
     is_redirected = homepage.verify_redirected_to_results()
-    assert is_redirected, "Failed to redirect to search results page"
-    logger.info("Successfully verified redirect to search results page")
\ No newline at end of file
+    assert is_redirected, "Search results page did not load or rendered no results"
+    logger.info("Successfully verified redirect to search results page")
+
+
+@then(parsers.parse('the results list shows {count:d} priced itineraries'))
+def verify_itineraries(homepage: HomePage, count: int):
+    """
+    Read the first itineraries from the results list
+    
+    Args:
+        homepage: HomePage instance on the results page
+        count: Number of itineraries to check
+    """
+    logger.info(f"Step: Read the first {count} itineraries")
+    itineraries = ResultsPage(homepage.page).take(count)
+    assert len(itineraries) == count, f"Expected {count} itineraries, got {len(itineraries)}"
+    for itinerary in itineraries:
+        assert itinerary.price and itinerary.price > 0, f"Itinerary without price: {itinerary}"
+        assert itinerary.carriers, f"Itinerary without carriers: {itinerary}"
+    logger.info(f"Cheapest of the first {count}: {min(itinerary.price for itinerary in itineraries)}")
+
+
+@then('the search API returned priced itineraries')
+def verify_search_api(search_capture: SearchCapture):
+    """
+    Check the decoded search API response instead of the rendered cards
+    
+    Args:
+        search_capture: Search API capture of this test
+    """
+    logger.info("Step: Verify search API response")
+    response = search_capture.wait_for_search()
+    assert response is not None, "No search API response captured"
+    assert response.error is None, f"Search API response not decoded: {response.error}"
+    assert response.result_count > 0, f"Search API returned no itineraries: {response.url}"
+    unpriced = [itinerary for itinerary in response.itineraries if not itinerary.price]
+    assert not unpriced, f"{len(unpriced)} itineraries without price, e.g. {unpriced[0]}"
+    logger.info(f"Search API: {response.result_count} itineraries in {response.latency_ms} ms")
@@ -0,0 +1,16 @@
+"""
+Unit tests for the shared browser server
+"""
+import sys
+
+import pytest
+
+from utils.browser_server import BrowserServer
+
+
+def test_browser_exiting_early_raises_runtime_error():
+    # The Python interpreter rejects Chromium's switches and exits right away
+    server = BrowserServer(sys.executable)
+    with pytest.raises(RuntimeError, match="exited with code"):
+        server.start(timeout=10)
+    assert server.pid is None
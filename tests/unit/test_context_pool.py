@@ -0,0 +1,50 @@
+"""
+Unit tests for the browser context pool
+Checks that a reused context does not carry storage over from the previous test
+"""
+import os
+
+import pytest
+from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+
+from utils.context_pool import ContextPool
+
+ORIGIN = "https://pool.example.test"
+
+
+def _chromium_installed() -> bool:
+    """Whether Playwright's Chromium build is available to launch"""
+    with sync_playwright() as playwright:
+        return os.path.exists(playwright.chromium.executable_path)
+
+
+pytestmark = pytest.mark.skipif(not _chromium_installed(), reason="Chromium is not installed")
+
+
+def _open(context: BrowserContext) -> Page:
+    """Page on ORIGIN, served a blank document, like a test's page fixture"""
+    context.route(f"{ORIGIN}/**", lambda route: route.fulfill(status=200, content_type="text/html", body="<html></html>"))
+    page = context.new_page()
+    page.goto(f"{ORIGIN}/")
+    return page
+
+
+def test_reused_context_starts_with_empty_local_storage(browser: Browser):
+    pool = ContextPool(browser, {}, size=1)
+    try:
+        # First test writes storage; its page closes before the context is released
+        context = pool.acquire()
+        page = _open(context)
+        page.evaluate("localStorage.setItem('search', 'RTM-MAD')")
+        page.close()
+        pool.release(context)
+
+        # Next test gets the same context back
+        reused = pool.acquire()
+        assert reused is context
+        page = _open(reused)
+        assert page.evaluate("localStorage.getItem('search')") is None
+        page.close()
+        pool.release(reused)
+    finally:
+        pool.close()
@@ -0,0 +1,19 @@
+"""
+Unit tests for the learned resource size table
+"""
+import json
+import os
+
+from utils.resource_filter import load_sizes, save_sizes, size_key
+
+
+def test_size_key_drops_query_and_fragment():
+    assert size_key("https://images.kiwi.com/airlines/64/FR.png?v=3#x") == "https://images.kiwi.com/airlines/64/FR.png"
+
+
+def test_save_sizes_keeps_most_recent_entries(tmp_path):
+    path = os.path.join(str(tmp_path), "sizes.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"https://a.test/old.png": 1, "https://a.test/seen.png?v=1": 2}, f)
+    save_sizes({"https://a.test/new.png": 3, "https://a.test/seen.png": 4}, path, max_entries=2)
+    assert load_sizes(path) == {"https://a.test/new.png": 3, "https://a.test/seen.png": 4}
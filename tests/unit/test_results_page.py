@@ -0,0 +1,37 @@
+"""
+Unit tests for result card parsing
+"""
+import pytest
+
+from pages.results_page import parse_duration, parse_price, parse_stops
+
+
+@pytest.mark.parametrize("text, amount, currency", [
+    ("1.234 €", 1234.0, "€"),
+    ("1.234,50 €", 1234.5, "€"),
+    ("1,234.50", 1234.5, ""),
+    ("€1,234", 1234.0, "€"),
+    ("12,50 €", 12.5, "€"),
+    ("12.5 €", 12.5, "€"),
+    ("123", 123.0, ""),
+    ("€ 1 234,50", 1234.5, "€"),
+    ("1,234,567 Kč", 1234567.0, "Kč"),
+    ("CHF 1'234.50", 1234.5, "CHF"),
+])
+def test_parse_price(text, amount, currency):
+    assert parse_price(text) == (amount, currency)
+
+
+@pytest.mark.parametrize("text", [None, "", "Sold out"])
+def test_parse_price_without_amount(text):
+    assert parse_price(text)[0] is None
+
+
+@pytest.mark.parametrize("text, minutes", [("5h 40m", 340), ("2h", 120), ("45m", 45), ("", None)])
+def test_parse_duration(text, minutes):
+    assert parse_duration(text) == minutes
+
+
+@pytest.mark.parametrize("code, text, stops", [("1", "1 stop", 1), (None, "Direct", 0), (None, "2 stops", 2), (None, None, None)])
+def test_parse_stops(code, text, stops):
+    assert parse_stops(code, text) == stops
@@ -0,0 +1,51 @@
+"""
+Unit tests for xdist scheduling
+Collects the route matrix under loadgroup workers and checks the group suffixes
+"""
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from utils.duration_store import strip_group
+
+ROOT = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+
+
+def _plan(*args: str) -> str:
+    """Output of a --setup-plan run of the route matrix, which needs no browser"""
+    command = [
+        sys.executable, "-m", "pytest", "-o", "addopts=", "-p", "no:cacheprovider", "--duration-db=",
+        "--setup-plan", "-v", "-m", "route_matrix", "tests/step_definitions", *args,
+    ]
+    result = subprocess.run(command, cwd=os.path.abspath(ROOT), capture_output=True, text=True, timeout=300)
+    assert result.returncode in (0, 5), result.stdout + result.stderr
+    return result.stdout
+
+
+def test_route_matrix_rows_carry_loadgroup_suffix():
+    pytest.importorskip("xdist")
+    nodeids = re.findall(r"^(tests/\S+::test_one_way_search_across_the_route_matrix\S*)", _plan(
+        "-n", "2", "--dist", "loadgroup", "--schedule", "collection",
+    ), re.MULTILINE)
+    assert nodeids
+    assert all(re.search(r"@route_matrix_\d+$", nodeid) for nodeid in nodeids), nodeids
+
+
+@pytest.mark.parametrize("nodeid, expected", [
+    ("tests/a.py::test_row[RTM-MAD-1]@route_matrix_0", "tests/a.py::test_row[RTM-MAD-1]"),
+    ("tests/a.py::test_search@lpt_3", "tests/a.py::test_search"),
+    ("tests/a.py::test_login[user@example.com]", "tests/a.py::test_login[user@example.com]"),
+    ("tests/a.py::test_search", "tests/a.py::test_search"),
+])
+def test_strip_group(nodeid, expected):
+    assert strip_group(nodeid) == expected
+
+
+def test_longest_first_schedule_carries_loadgroup_suffix():
+    pytest.importorskip("xdist")
+    nodeids = re.findall(r"^(tests/\S+::\S+)", _plan("-n", "2", "--dist", "loadgroup", "--schedule", "lpt"), re.MULTILINE)
+    assert nodeids
+    assert all(re.search(r"@lpt_\d+$", nodeid) for nodeid in nodeids), nodeids
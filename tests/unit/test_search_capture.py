@@ -0,0 +1,31 @@
+"""
+Unit tests for search API fixture naming
+"""
+import os
+
+from utils.search_capture import fixture_path
+
+GRAPHQL_URL = "https://api.skypicker.com/umbrella/v2/graphql?featureName=SearchOneWayItinerariesQuery"
+
+
+def test_graphql_bodies_get_separate_fixtures():
+    to_madrid = fixture_path("fixtures", GRAPHQL_URL, '{"variables": {"source": "RTM", "destination": "MAD"}}')
+    to_rome = fixture_path("fixtures", GRAPHQL_URL, '{"variables": {"source": "RTM", "destination": "FCO"}}')
+    assert to_madrid != to_rome
+    assert os.path.dirname(to_madrid) == "fixtures"
+
+
+def test_dates_do_not_change_the_fixture():
+    assert (
+        fixture_path("fixtures", "http://127.0.0.1:8000/api/search?origin=RTM&destination=MAD&date=2026-11-14")
+        == fixture_path("fixtures", "http://127.0.0.1:8000/api/search?origin=RTM&destination=MAD&date=2026-11-21")
+    )
+    assert (
+        fixture_path("fixtures", GRAPHQL_URL, '{"outboundDate": "2026-11-14T00:00:00"}')
+        == fixture_path("fixtures", GRAPHQL_URL, '{"outboundDate": "2026-11-21T00:00:00"}')
+    )
+
+
+def test_local_fixture_is_named_after_path_and_query():
+    path = fixture_path("fixtures", "http://127.0.0.1:8000/api/search?origin=RTM&destination=MAD&date=2026-11-14")
+    assert path == os.path.join("fixtures", "api_search_origin_RTM_destination_MAD_date_DATE.json")
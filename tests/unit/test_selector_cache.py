@@ -0,0 +1,37 @@
+"""
+Unit tests for the learned selector cache
+"""
+import os
+
+from utils.selector_cache import SelectorCache
+
+KEY = "HomePage.click_search_button"
+
+
+def _cache(tmp_path) -> SelectorCache:
+    return SelectorCache(os.path.join(str(tmp_path), "selector_cache.json"), max_misses=3)
+
+
+def test_hits_between_misses_keep_the_selector(tmp_path):
+    cache = _cache(tmp_path)
+    cache.record(KEY, "primary")
+    for _ in range(5):
+        cache.record(KEY, "fallback")
+        cache.record(KEY, "primary")
+    assert cache.get(KEY) == "primary"
+
+
+def test_consecutive_misses_evict_the_selector(tmp_path):
+    cache = _cache(tmp_path)
+    cache.record(KEY, "primary")
+    for _ in range(3):
+        cache.record(KEY, "fallback")
+    assert cache.get(KEY) == "fallback"
+
+
+def test_nothing_matched_is_not_a_miss(tmp_path):
+    cache = _cache(tmp_path)
+    cache.record(KEY, "primary")
+    for _ in range(5):
+        cache.record(KEY, None)
+    assert cache.get(KEY) == "primary"
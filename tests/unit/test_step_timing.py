@@ -0,0 +1,30 @@
+"""
+Unit tests for step timing history
+"""
+import json
+import os
+
+from utils.step_timing import load_history, percentiles, trim_history
+
+
+def test_history_keeps_newest_records(tmp_path):
+    path = os.path.join(str(tmp_path), "history.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps({"step": f"step {i}"}) + "\n" for i in range(130))
+    trim_history(path, max_records=100)
+    records = load_history(path)
+    assert len(records) == 100
+    assert records[0]["step"] == "step 30" and records[-1]["step"] == "step 129"
+
+
+def test_history_within_margin_is_left_alone(tmp_path):
+    path = os.path.join(str(tmp_path), "history.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps({"step": f"step {i}"}) + "\n" for i in range(110))
+    trim_history(path, max_records=100)
+    assert len(load_history(path)) == 110
+
+
+def test_percentiles_nearest_rank():
+    assert percentiles([float(value) for value in range(1, 101)], points=(50, 95)) == {"p50": 50.0, "p95": 95.0}
+    assert percentiles([]) == {}
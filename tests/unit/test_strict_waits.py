@@ -0,0 +1,42 @@
+"""
+Unit tests for strict waits
+A raw page.wait_for_timeout() in a page object must fail, not only BasePage.sleep()
+"""
+import asyncio
+
+import pytest
+from playwright import async_api, sync_api
+
+from pages.base_page import BasePage, FixedSleepError, guard_fixed_sleeps
+
+
+@pytest.fixture
+def strict_waits():
+    guard_fixed_sleeps()
+    previous, BasePage.strict_waits = BasePage.strict_waits, True
+    yield
+    BasePage.strict_waits = previous
+
+
+def _unconnected(cls):
+    """Page or Frame without a browser behind it; the guard raises before any call goes out"""
+    return object.__new__(cls)
+
+
+@pytest.mark.parametrize("cls", [sync_api.Page, sync_api.Frame])
+def test_raw_sync_sleep_fails(strict_waits, cls):
+    with pytest.raises(FixedSleepError):
+        _unconnected(cls).wait_for_timeout(500)
+
+
+@pytest.mark.parametrize("cls", [async_api.Page, async_api.Frame])
+def test_raw_async_sleep_fails(strict_waits, cls):
+    with pytest.raises(FixedSleepError):
+        asyncio.run(_unconnected(cls).wait_for_timeout(500))
+
+
+def test_guard_is_installed_once():
+    guard_fixed_sleeps()
+    guarded = sync_api.Page.wait_for_timeout
+    guard_fixed_sleeps()
+    assert sync_api.Page.wait_for_timeout is guarded
@@ -0,0 +1,64 @@
+"""
+Unit tests for the step trace ring
+Drives the ring with a tracing stand-in that records which chunks were saved or discarded
+"""
+import os
+from types import SimpleNamespace
+
+from utils.trace_ring import StepTraceRing
+
+
+class _Tracing:
+    """Records actions into the chunk in progress, like context.tracing"""
+
+    def __init__(self):
+        self.chunk = None
+        self.saved = {}
+
+    def start(self, **kwargs):
+        self.chunk = []
+
+    def start_chunk(self, title=None):
+        self.chunk = []
+
+    def stop_chunk(self, path=None):
+        with open(path, "w", encoding="utf-8"):
+            pass
+        self.saved[os.path.basename(path)] = self.chunk
+        self.chunk = None
+
+    def stop(self):
+        self.chunk = None
+
+
+def test_actions_between_steps_land_in_next_step_chunk():
+    tracing = _Tracing()
+    ring = StepTraceRing(SimpleNamespace(tracing=tracing), size=5)
+    try:
+        ring.start()
+        tracing.chunk.append("goto")
+        ring.start_step("Given the homepage")
+        tracing.chunk.append("click consent")
+        ring.end_step()
+        tracing.chunk.append("fixture action")
+        ring.start_step("When I search")
+        tracing.chunk.append("click search")
+        ring.end_step()
+    finally:
+        ring.close()
+    assert tracing.saved == {
+        "01_passed_Given_the_homepage.zip": ["goto", "click consent"],
+        "02_passed_When_I_search.zip": ["fixture action", "click search"],
+    }
+
+
+def test_step_left_open_is_saved_as_unfinished():
+    tracing = _Tracing()
+    ring = StepTraceRing(SimpleNamespace(tracing=tracing), size=5)
+    try:
+        ring.start("Given the homepage")
+        tracing.chunk.append("goto")
+        ring.start_step("When I search")
+    finally:
+        ring.close()
+    assert tracing.saved == {"01_unfinished_Given_the_homepage.zip": ["goto"]}
@@ -0,0 +1,184 @@
+"""
+Action tracing
+Records BasePage actions as Chrome trace events (chrome://tracing / Perfetto)
+"""
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_PATH = "reports/action_trace.json"
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled - every method is a no-op"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def waited(self) -> None:
+        pass
+
+    def probe(self, page, selector: str) -> None:
+        pass
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class ActionSpan:
+    """One traced action, split into a wait phase and an action phase"""
+
+    __slots__ = ("tracer", "name", "args", "started", "wait_ended")
+
+    def __init__(self, tracer: "ActionTracer", name: str, selector: Optional[str]):
+        self.tracer = tracer
+        self.name = name
+        self.args: Dict[str, Any] = {"selector": selector} if selector else {}
+        self.started = 0.0
+        self.wait_ended: Optional[float] = None
+
+    def __enter__(self) -> "ActionSpan":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._finish(self, time.perf_counter())
+        return False
+
+    def waited(self) -> None:
+        """Mark the end of the wait phase"""
+        self.wait_ended = time.perf_counter()
+
+    def probe(self, page, selector: str) -> None:
+        """
+        Record whether the element was already visible before waiting
+
+        Costs one extra round trip, only paid while tracing is enabled.
+
+        Args:
+            page: Playwright page
+            selector: CSS selector or locator
+        """
+        try:
+            self.args["first_attempt"] = page.locator(selector).first.is_visible()
+        except Exception:
+            self.args["first_attempt"] = False
+
+    def set(self, **args: Any) -> None:
+        """Attach extra arguments to the trace event"""
+        self.args.update(args)
+
+
+class ActionTracer:
+    """
+    Collects Chrome trace events for page object actions
+
+    Disabled by default; action() then returns a shared no-op span so the
+    hot path costs one attribute check.
+    """
+
+    def __init__(self):
+        """Initialize a disabled tracer"""
+        self.enabled = False
+        self.events: List[Dict] = []
+        # Wall-clock anchored timestamps so traces from several workers line up
+        self._epoch_us = time.time() * 1e6
+        self._perf_origin = time.perf_counter()
+
+    def _ts(self, perf: float) -> float:
+        """Convert a perf_counter value to trace microseconds"""
+        return round(self._epoch_us + (perf - self._perf_origin) * 1e6, 1)
+
+    def action(self, name: str, selector: Optional[str] = None):
+        """
+        Start a traced action
+
+        Args:
+            name: Action name (click, fill, ...)
+            selector: Selector the action targets
+
+        Returns:
+            Context manager span
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return ActionSpan(self, name, selector)
+
+    def _event(self, name: str, category: str, started: float, ended: float, args: Optional[Dict] = None) -> None:
+        """Append a complete ('X') event"""
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": self._ts(started),
+            "dur": round((ended - started) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args or {},
+        })
+
+    def _finish(self, span: ActionSpan, ended: float) -> None:
+        """Emit events for a finished span"""
+        if span.wait_ended is not None:
+            span.args["wait_ms"] = round((span.wait_ended - span.started) * 1000, 1)
+            span.args["action_ms"] = round((ended - span.wait_ended) * 1000, 1)
+            self._event("wait", "wait", span.started, span.wait_ended)
+            self._event("act", "act", span.wait_ended, ended)
+        self._event(span.name, "action", span.started, ended, span.args)
+
+    def begin(self) -> float:
+        """
+        Start an enclosing span such as a test or step
+
+        Returns:
+            Start time to pass to end()
+        """
+        return time.perf_counter()
+
+    def end(self, name: str, category: str, started: float, args: Optional[Dict] = None) -> None:
+        """
+        Finish an enclosing span
+
+        Args:
+            name: Span name
+            category: Trace category
+            started: Value returned by begin()
+            args: Extra event arguments
+        """
+        if self.enabled:
+            self._event(name, category, started, time.perf_counter(), args)
+
+    def write(self, path: str = DEFAULT_TRACE_PATH) -> None:
+        """
+        Write collected events as a Chrome trace file
+
+        Args:
+            path: Output JSON file
+        """
+        if not self.enabled or not self.events:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        metadata = {"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": f"pytest {worker}"}}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": [metadata] + self.events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Action trace written to {path} ({len(self.events)} events)")
+
+
+# Single tracer per process
+action_tracer = ActionTracer()
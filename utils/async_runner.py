@@ -0,0 +1,106 @@
+"""
+Async scenario runner
+Runs search scenarios concurrently on one event loop across contexts of a single browser
+"""
+from playwright.async_api import Browser, async_playwright
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from pages.async_home_page import AsyncHomePage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+
+
+async def run_search_scenario(browser: Browser, url: str, scenario: Dict, context_args: Optional[Dict] = None) -> Dict:
+    """
+    Run the one-way search flow in a fresh context
+
+    Args:
+        browser: Browser that owns the context
+        url: Landing page URL
+        scenario: Mapping with origin, destination and optional weeks
+        context_args: Arguments passed to browser.new_context()
+
+    Returns:
+        Result with the scenario, passed flag, duration_ms, time_to_first_result_ms and error message
+    """
+    started = time.perf_counter()
+    context_args = context_args or {}
+    context = await browser.new_context(**context_args)
+    error = None
+    passed = False
+    time_to_first_result_ms = None
+    try:
+        homepage = AsyncHomePage(await context.new_page(), url=url, storage_state_path=context_args.get("storage_state"))
+        await homepage.open()
+        await homepage.select_trip_type("one-way")
+        await homepage.set_departure_airport(scenario["origin"])
+        await homepage.set_arrival_airport(scenario["destination"])
+        await homepage.set_departure_date(scenario.get("weeks", 1))
+        await homepage.uncheck_accommodation_option()
+        await homepage.click_search_button()
+        passed = await homepage.verify_redirected_to_results()
+        time_to_first_result_ms = homepage.time_to_first_result_ms
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        logger.error(f"Scenario {scenario} failed: {error}")
+    finally:
+        await context.close()
+    return {
+        "scenario": scenario,
+        "passed": passed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "time_to_first_result_ms": time_to_first_result_ms,
+        "error": error,
+    }
+
+
+async def run_scenarios(browser: Browser, url: str, scenarios: List[Dict],
+                        concurrency: int = DEFAULT_CONCURRENCY, context_args: Optional[Dict] = None) -> List[Dict]:
+    """
+    Run scenarios concurrently, at most concurrency contexts at a time
+
+    Args:
+        browser: Browser shared by every scenario
+        url: Landing page URL
+        scenarios: Scenario mappings (see run_search_scenario)
+        concurrency: Maximum number of open contexts
+        context_args: Arguments passed to browser.new_context()
+
+    Returns:
+        Results in scenario order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(scenario: Dict) -> Dict:
+        async with semaphore:
+            return await run_search_scenario(browser, url, scenario, context_args)
+
+    return await asyncio.gather(*(bounded(scenario) for scenario in scenarios))
+
+
+async def run(url: str, scenarios: List[Dict], concurrency: int = DEFAULT_CONCURRENCY,
+              headless: bool = True, context_args: Optional[Dict] = None) -> List[Dict]:
+    """
+    Launch one Chromium browser and run scenarios on it
+
+    Args:
+        url: Landing page URL
+        scenarios: Scenario mappings (see run_search_scenario)
+        concurrency: Maximum number of open contexts
+        headless: Run the browser headless
+        context_args: Arguments passed to browser.new_context()
+
+    Returns:
+        Results in scenario order
+    """
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            return await run_scenarios(browser, url, scenarios, concurrency, context_args)
+        finally:
+            await browser.close()
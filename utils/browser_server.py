@@ -0,0 +1,197 @@
+"""
+Shared browser server
+Runs one Chromium for every xdist worker and measures memory per worker process tree
+"""
+from typing import Dict, Iterable, List, Optional
+import logging
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+
+def _free_port() -> int:
+    """Ask the OS for an unused local TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BrowserServer:
+    """
+    Chromium process exposing a DevTools endpoint on localhost
+
+    Workers attach with browser_type.connect_over_cdp(endpoint) and each
+    open their own contexts, so the browser binary, GPU and network processes
+    are paid for once per session instead of once per worker.
+    """
+
+    def __init__(self, executable_path: str, headless: bool = True, args: Iterable[str] = (),
+                 chromium_sandbox: bool = False):
+        """
+        Initialize browser server
+
+        Args:
+            executable_path: Chromium binary (playwright.chromium.executable_path)
+            headless: Run without a window
+            args: Extra Chromium command line switches
+            chromium_sandbox: Keep Chromium's sandbox; off by default like Playwright's
+                launcher, since Chromium refuses to start sandboxed as root (Docker)
+        """
+        self.executable_path = executable_path
+        self.headless = headless
+        self.chromium_sandbox = chromium_sandbox
+        self.args = list(args)
+        self.endpoint: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._user_data_dir: Optional[str] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process id of the browser, None while stopped"""
+        return self._process.pid if self._process else None
+
+    def start(self, timeout: float = 30.0) -> str:
+        """
+        Launch the browser and wait for its DevTools endpoint
+
+        Args:
+            timeout: Seconds to wait for the endpoint
+
+        Returns:
+            HTTP endpoint to pass to connect_over_cdp
+
+        Raises:
+            RuntimeError: If the browser exits or the endpoint does not come up
+        """
+        port = _free_port()
+        self._user_data_dir = tempfile.mkdtemp(prefix="shared-browser-")
+        command = [
+            self.executable_path,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={self._user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            *(["--headless=new"] if self.headless else []),
+            *([] if self.chromium_sandbox else ["--no-sandbox"]),
+            *self.args,
+            "about:blank",
+        ]
+        self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        endpoint = f"http://127.0.0.1:{port}"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            returncode = self._process.poll()
+            if returncode is not None:
+                self.stop()
+                raise RuntimeError(f"Shared browser exited with code {returncode}")
+            try:
+                with urllib.request.urlopen(f"{endpoint}/json/version", timeout=1):
+                    self.endpoint = endpoint
+                    logger.info(f"Shared browser listening on {endpoint} (pid {self.pid})")
+                    return endpoint
+            except OSError:
+                time.sleep(0.1)
+        self.stop()
+        raise RuntimeError(f"Shared browser endpoint {endpoint} not reachable within {timeout} s")
+
+    def stop(self) -> None:
+        """Terminate the browser and remove its profile directory"""
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+        self._process = None
+        self._user_data_dir = None
+        self.endpoint = None
+
+
+def _children_by_parent() -> Dict[int, List[int]]:
+    """Map of parent pid to child pids from /proc"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # The command name may contain spaces; fields resume after the last ')'
+                parent = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    return children
+
+
+def _rss_kb(pid: int) -> int:
+    """Resident set size of one process in KiB"""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def process_tree_rss_mb(pid: int, exclude: Iterable[int] = ()) -> float:
+    """
+    Resident memory of a process and all its descendants
+
+    Shared pages are counted once per process, so this over-estimates
+    absolute usage but compares fairly between modes. Linux only.
+
+    Args:
+        pid: Root process
+        exclude: Subtrees to leave out (e.g. a shared browser started by pid)
+
+    Returns:
+        RSS in MiB, 0.0 where /proc is unavailable
+    """
+    if not os.path.isdir("/proc"):
+        return 0.0
+    children = _children_by_parent()
+    skipped = set(exclude)
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        if current in skipped:
+            continue
+        total_kb += _rss_kb(current)
+        stack.extend(children.get(current, []))
+    return round(total_kb / 1024, 1)
+
+
+class MemorySampler:
+    """Tracks the peak RSS of a process tree across samples"""
+
+    def __init__(self):
+        """Initialize with no samples"""
+        self.peak_mb = 0.0
+        self.samples = 0
+
+    def sample(self, pid: int, exclude: Iterable[int] = ()) -> float:
+        """
+        Measure the tree now and keep the peak
+
+        Args:
+            pid: Root process
+            exclude: Subtrees to leave out
+
+        Returns:
+            Current RSS in MiB
+        """
+        current = process_tree_rss_mb(pid, exclude)
+        self.peak_mb = max(self.peak_mb, current)
+        self.samples += 1
+        return current
@@ -0,0 +1,241 @@
+"""
+Browser context pool
+Hands out pre-warmed BrowserContexts and resets them between tests
+"""
+from playwright.sync_api import Browser, BrowserContext
+from typing import Dict, List, Optional
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Restores each page's origin storage to the snapshot it was created with
+RESET_STORAGE_SCRIPT = """
+(snapshot) => {
+    localStorage.clear();
+    sessionStorage.clear();
+    for (const item of snapshot[location.origin] || []) {
+        localStorage.setItem(item.name, item.value);
+    }
+}
+"""
+
+# Served to the temporary page that resets an origin's storage, so no request leaves the browser
+BLANK_DOCUMENT = "<!DOCTYPE html><title>reset</title>"
+
+
+def _storage_items(items: Optional[List[Dict]]) -> Dict[str, str]:
+    """localStorage entries of a storage state origin as a name -> value mapping"""
+    return {item["name"]: item["value"] for item in items or []}
+
+
+class ContextPool:
+    """
+    Pool of reusable browser contexts for one worker
+
+    Contexts are created up front, handed out with acquire() and returned
+    with release(), which resets cookies, storage, routes and permissions to
+    the state the context was created with. A context that fails its health
+    check or reaches max_uses is closed and replaced.
+    """
+
+    def __init__(self, browser: Browser, context_args: Dict, size: int = 2, max_uses: int = 50):
+        """
+        Initialize and pre-warm the pool
+
+        Args:
+            browser: Browser that owns the contexts
+            context_args: Arguments passed to browser.new_context()
+            size: Number of contexts kept warm
+            max_uses: Recycle a context after this many tests
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.size = size
+        self.max_uses = max_uses
+        self._initial_cookies, self._initial_storage = self._load_initial_state(context_args.get("storage_state"))
+        self._idle: List[BrowserContext] = []
+        self._uses: Dict[BrowserContext, int] = {}
+
+        self.created = 0
+        self.recycled = 0
+        self.reused = 0
+        self.acquire_ms: List[float] = []
+
+        for _ in range(size):
+            self._idle.append(self._create())
+        logger.info(f"Context pool warmed with {size} context(s)")
+
+    @staticmethod
+    def _load_initial_state(storage_state: Optional[str]):
+        """Read cookies and per-origin localStorage from a storage state file"""
+        if not storage_state:
+            return [], {}
+        try:
+            with open(storage_state, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read storage state {storage_state}: {e}")
+            return [], {}
+        storage = {origin["origin"]: origin.get("localStorage", []) for origin in state.get("origins", [])}
+        return state.get("cookies", []), storage
+
+    def _create(self) -> BrowserContext:
+        """Create a new context with the pool's arguments"""
+        context = self.browser.new_context(**self.context_args)
+        self._uses[context] = 0
+        self.created += 1
+        return context
+
+    def _discard(self, context: BrowserContext) -> None:
+        """Close a context and forget it"""
+        self._uses.pop(context, None)
+        try:
+            context.close()
+        except Exception as e:
+            logger.debug(f"Closing pooled context failed: {e}")
+
+    def _is_healthy(self, context: BrowserContext) -> bool:
+        """
+        Check that a pooled context is still usable
+
+        Args:
+            context: Context to check
+
+        Returns:
+            True if the browser is connected and the context answers
+        """
+        if not self.browser.is_connected():
+            return False
+        try:
+            context.cookies()
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled context failed health check: {e}")
+            return False
+
+    def acquire(self) -> BrowserContext:
+        """
+        Hand out a healthy context, creating one if the pool is empty
+
+        Returns:
+            Browser context ready for a test
+        """
+        started = time.perf_counter()
+        context = None
+        while self._idle:
+            candidate = self._idle.pop()
+            if self._is_healthy(candidate):
+                context = candidate
+                break
+            self._discard(candidate)
+            self.recycled += 1
+
+        if context is None:
+            context = self._create()
+        if self._uses[context] > 0:
+            self.reused += 1
+        self._uses[context] += 1
+
+        self.acquire_ms.append((time.perf_counter() - started) * 1000)
+        return context
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Reset a context and return it to the pool
+
+        Args:
+            context: Context obtained from acquire()
+        """
+        if context not in self._uses:
+            return
+        if self._uses[context] >= self.max_uses or len(self._idle) >= self.size:
+            self._discard(context)
+            self.recycled += 1
+            return
+
+        try:
+            self._reset(context)
+        except Exception as e:
+            logger.warning(f"Resetting pooled context failed, discarding: {e}")
+            self._discard(context)
+            self.recycled += 1
+            return
+        self._idle.append(context)
+
+    def _reset(self, context: BrowserContext) -> None:
+        """
+        Return a context to the state it was created with
+
+        Args:
+            context: Context to reset
+        """
+        for page in list(context.pages):
+            try:
+                page.evaluate(RESET_STORAGE_SCRIPT, self._initial_storage)
+            except Exception:
+                # about:blank or crashed pages have no storage to reset
+                pass
+            page.close()
+
+        context.unroute_all(behavior="ignoreErrors")
+        self._reset_origin_storage(context)
+        context.clear_cookies()
+        if self._initial_cookies:
+            context.add_cookies(self._initial_cookies)
+        context.clear_permissions()
+        if self.context_args.get("permissions"):
+            context.grant_permissions(self.context_args["permissions"])
+
+    def _reset_origin_storage(self, context: BrowserContext) -> None:
+        """
+        Restore localStorage of origins whose pages were already closed
+
+        Tests close their pages before the context is released, so the
+        storage state is compared with the snapshot and each origin that
+        differs is reset from a temporary page served a blank document.
+
+        Args:
+            context: Context without open pages
+        """
+        current = {origin["origin"]: origin.get("localStorage", []) for origin in context.storage_state()["origins"]}
+        changed = [
+            origin for origin in sorted(set(current) | set(self._initial_storage))
+            if _storage_items(current.get(origin)) != _storage_items(self._initial_storage.get(origin))
+        ]
+        if not changed:
+            return
+        page = context.new_page()
+        try:
+            page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=BLANK_DOCUMENT))
+            for origin in changed:
+                page.goto(origin, wait_until="domcontentloaded")
+                page.evaluate(RESET_STORAGE_SCRIPT, self._initial_storage)
+        finally:
+            page.close()
+        logger.debug(f"Reset localStorage of {len(changed)} origin(s)")
+
+    def close(self) -> None:
+        """Close every context owned by the pool"""
+        for context in list(self._uses):
+            self._discard(context)
+        self._idle.clear()
+
+    def stats(self) -> Dict:
+        """
+        Pool metrics
+
+        Returns:
+            Created, reused and recycled counts plus acquire latency in ms
+        """
+        latencies = sorted(self.acquire_ms)
+        return {
+            "size": self.size,
+            "created": self.created,
+            "reused": self.reused,
+            "recycled": self.recycled,
+            "acquires": len(latencies),
+            "acquire_ms_avg": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "acquire_ms_max": round(latencies[-1], 2) if latencies else 0.0,
+        }
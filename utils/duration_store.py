@@ -0,0 +1,180 @@
+"""
+Duration store
+SQLite history of per-test and per-step durations used for scheduling and trends
+"""
+from typing import Dict, List, Optional
+import logging
+import os
+import re
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DURATION_DB = ".cache/durations.sqlite"
+
+# "@<group>" appended to node ids by xdist --dist loadgroup; never inside a parameter id
+GROUP_SUFFIX = re.compile(r"@[^\[\]/:]+$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_durations (
+    run_id TEXT NOT NULL,
+    started TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS step_durations (
+    run_id TEXT NOT NULL,
+    started TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    step TEXT NOT NULL,
+    wall_ms REAL NOT NULL,
+    playwright_ms REAL NOT NULL,
+    sleep_ms REAL NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_durations_nodeid ON test_durations (nodeid, started);
+CREATE INDEX IF NOT EXISTS step_durations_step ON step_durations (step, started);
+"""
+
+
+def strip_group(nodeid: str) -> str:
+    """
+    Node id without the xdist loadgroup suffix
+
+    History must be keyed the same whether or not a run was grouped.
+
+    Args:
+        nodeid: pytest node id, possibly ending in "@<group>"
+
+    Returns:
+        The node id as collected without xdist
+    """
+    return GROUP_SUFFIX.sub("", nodeid)
+
+
+class DurationStore:
+    """
+    Local SQLite database of test and step durations across runs
+
+    Every xdist worker appends its own rows at session end under the run id
+    shared by the controller; WAL mode lets them write concurrently.
+    """
+
+    def __init__(self, path: str = DEFAULT_DURATION_DB):
+        """
+        Initialize duration store
+
+        Args:
+            path: SQLite database file, created on first write
+        """
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and make sure the schema exists"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        return connection
+
+    def record_run(self, run_id: str, started: str, worker: str, tests: Dict[str, Dict],
+                   steps: List[Dict]) -> None:
+        """
+        Append one worker's results for a run
+
+        Args:
+            run_id: Identifier shared by all workers of the run
+            started: Run start time (ISO format)
+            worker: xdist worker id or "main"
+            tests: Mapping of node id to {"outcome", "duration_ms"}
+            steps: Step records from utils.step_timing
+        """
+        if not tests and not steps:
+            return
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO test_durations VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, started, worker, strip_group(nodeid), test["outcome"], test["duration_ms"])
+                     for nodeid, test in tests.items()],
+                )
+                connection.executemany(
+                    "INSERT INTO step_durations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(run_id, started, worker, strip_group(step["test"]), step["step"], step["wall_ms"],
+                      step["playwright_ms"], step["sleep_ms"], step["status"]) for step in steps],
+                )
+        finally:
+            connection.close()
+        logger.info(f"Recorded {len(tests)} test and {len(steps)} step durations in {self.path}")
+
+    def test_durations(self, last_runs: int = 5) -> Dict[str, float]:
+        """
+        Mean duration per test over its most recent runs
+
+        Args:
+            last_runs: Number of most recent runs to average per test
+
+        Returns:
+            Milliseconds per node id; empty if there is no history
+        """
+        if not os.path.exists(self.path):
+            return {}
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                """
+                SELECT nodeid, AVG(duration_ms) FROM (
+                    SELECT nodeid, duration_ms,
+                           ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY started DESC) AS recent
+                    FROM test_durations WHERE outcome != 'skipped'
+                ) WHERE recent <= ? GROUP BY nodeid
+                """,
+                (last_runs,),
+            ).fetchall()
+        finally:
+            connection.close()
+        return {nodeid: duration for nodeid, duration in rows}
+
+    def step_trend(self, step: Optional[str] = None, last_runs: int = 10) -> List[Dict]:
+        """
+        Mean step wall time per run, for spotting latency trends
+
+        Args:
+            step: Only steps containing this text (e.g. "departure airport")
+            last_runs: Number of most recent runs to include
+
+        Returns:
+            Rows of started, step, samples and mean wall/Playwright/sleep ms, oldest first
+        """
+        if not os.path.exists(self.path):
+            return []
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                """
+                SELECT started, step, COUNT(*), AVG(wall_ms), AVG(playwright_ms), AVG(sleep_ms)
+                FROM step_durations
+                WHERE run_id IN (
+                    SELECT run_id FROM step_durations GROUP BY run_id ORDER BY MAX(started) DESC LIMIT ?
+                ) AND step LIKE ?
+                GROUP BY run_id, step ORDER BY started, step
+                """,
+                (last_runs, f"%{step or ''}%"),
+            ).fetchall()
+        finally:
+            connection.close()
+        return [
+            {
+                "started": started,
+                "step": name,
+                "samples": samples,
+                "wall_ms": round(wall, 1),
+                "playwright_ms": round(playwright, 1),
+                "sleep_ms": round(sleep, 1),
+            }
+            for started, name, samples, wall, playwright, sleep in rows
+        ]
@@ -0,0 +1,68 @@
+"""
+HAR record/replay
+Records per-scenario network traffic into compressed HAR archives and replays it
+"""
+from playwright.sync_api import BrowserContext
+from typing import Optional
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+NETWORK_MODES = ("live", "record", "replay")
+MISSING_POLICIES = ("abort", "fallback")
+DEFAULT_HAR_DIR = "tests/har"
+
+
+def har_path(har_dir: str, name: str) -> str:
+    """
+    Archive path for a scenario
+
+    Args:
+        har_dir: Directory holding the archives
+        name: Scenario name or pytest node id
+
+    Returns:
+        Path of the compressed HAR archive
+    """
+    slug = re.sub(r"[^\w.-]+", "_", name).strip("_")
+    return os.path.join(har_dir, f"{slug}.har.zip")
+
+
+def attach_har(context: BrowserContext, mode: str, path: str, not_found: str = "abort",
+               url: Optional[str] = None) -> bool:
+    """
+    Route a context through a HAR archive
+
+    In record mode the archive is written when the context closes, so the
+    context must not outlive the scenario. In replay mode requests missing
+    from the archive are aborted or sent to the network per not_found.
+
+    Args:
+        context: Browser context to route
+        mode: One of NETWORK_MODES
+        path: HAR archive path (.har.zip is stored compressed)
+        not_found: One of MISSING_POLICIES
+        url: Optional glob limiting which requests go through the archive
+
+    Returns:
+        True if the context is routed through the archive
+
+    Raises:
+        FileNotFoundError: If replaying and the archive does not exist
+    """
+    if mode == "record":
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        logger.info(f"Recording network traffic to {path}")
+        context.route_from_har(path, url=url, update=True, update_content="attach", update_mode="full")
+        return True
+
+    if mode == "replay":
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No HAR archive at {path} - record it with --network=record")
+        logger.info(f"Replaying network traffic from {path} (missing requests: {not_found})")
+        context.route_from_har(path, url=url, not_found=not_found)
+        return True
+
+    return False
@@ -0,0 +1,156 @@
+"""
+Local Kiwi.com stand-in server
+Serves the offline replica of the search form from an in-process HTTP server
+"""
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+import json
+import logging
+import os
+import random
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SITE_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "local_site")
+
+CARRIERS = ["KLM", "Transavia", "Iberia", "Vueling", "Ryanair", "easyJet", "Air Europa", "Lufthansa"]
+
+
+def generate_itineraries(origin: str, destination: str, date: str, count: int = 30) -> List[Dict]:
+    """
+    Build a deterministic list of itineraries for a route
+
+    Args:
+        origin: Origin code(s) from the results URL
+        destination: Destination code(s) from the results URL
+        date: Departure date from the results URL
+        count: Number of itineraries
+
+    Returns:
+        Itineraries sorted by price
+    """
+    if destination in ("", "anywhere") or origin == destination:
+        return []
+    rng = random.Random(f"{origin}-{destination}-{date}")
+    itineraries = []
+    for index in range(count):
+        stops = rng.choice([0, 0, 1, 1, 2])
+        carriers = rng.sample(CARRIERS, stops + 1 if stops < 2 else 2)
+        itineraries.append({
+            "id": f"{origin}-{destination}-{index}",
+            "price": rng.randint(39, 420),
+            "carriers": carriers,
+            "duration_minutes": 130 + stops * rng.randint(60, 240),
+            "stops": stops,
+            "departure": date,
+        })
+    return sorted(itineraries, key=lambda itinerary: itinerary["price"])
+
+
+class LocalSiteHandler(SimpleHTTPRequestHandler):
+    """Request handler mapping Kiwi.com routes onto the local site files"""
+
+    def __init__(self, *args, directory: Optional[str] = None, **kwargs):
+        super().__init__(*args, directory=directory or DEFAULT_SITE_ROOT, **kwargs)
+
+    def do_GET(self) -> None:
+        """Route landing, results, static and API requests"""
+        url = urlparse(self.path)
+        path = url.path
+
+        if path == "/":
+            self.send_response(302)
+            self.send_header("Location", "/en/")
+            self.end_headers()
+        elif path in ("/en", "/en/"):
+            self._send_file("index.html")
+        elif path.startswith("/en/search/"):
+            self._send_file("results.html")
+        elif path.startswith("/static/"):
+            self._send_file(path[len("/static/"):])
+        elif path == "/api/search":
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            payload = {
+                "search_id": f"{query.get('origin')}-{query.get('destination')}-{query.get('date')}",
+                "itineraries": generate_itineraries(
+                    query.get("origin", ""), query.get("destination", ""), query.get("date", "")
+                ),
+            }
+            self._send_bytes(json.dumps(payload).encode("utf-8"), "application/json")
+        else:
+            self.send_error(404)
+
+    def _send_file(self, name: str) -> None:
+        """Serve a file from the site root"""
+        file_path = os.path.realpath(os.path.join(self.directory, name))
+        if not file_path.startswith(os.path.realpath(self.directory)) or not os.path.isfile(file_path):
+            self.send_error(404)
+            return
+        with open(file_path, "rb") as f:
+            self._send_bytes(f.read(), self.guess_type(file_path))
+
+    def _send_bytes(self, body: bytes, content_type: str) -> None:
+        """Write a 200 response"""
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        """Route access logs through logging instead of stderr"""
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class LocalSite:
+    """In-process HTTP server for the local Kiwi.com stand-in"""
+
+    def __init__(self, root: str = DEFAULT_SITE_ROOT, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize local site
+
+        Args:
+            root: Directory with the site files
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+        """
+        self.root = root
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """
+        Start serving in a daemon thread
+
+        Returns:
+            Landing page URL
+        """
+        root = self.root
+
+        class Handler(LocalSiteHandler):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, directory=root, **kwargs)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-kiwi-site", daemon=True)
+        self._thread.start()
+        logger.info(f"Local Kiwi.com stand-in running at {self.url}")
+        return f"{self.url}/en/"
+
+    def stop(self) -> None:
+        """Stop the server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            logger.info("Local Kiwi.com stand-in stopped")
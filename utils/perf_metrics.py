@@ -0,0 +1,248 @@
+"""
+Browser performance metrics
+Collects Navigation/Paint Timing, LCP, CLS, long tasks and Chromium CDP metrics per page load
+"""
+from playwright.sync_api import CDPSession, Page
+from typing import Any, Dict, List, Optional
+from weakref import WeakKeyDictionary
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERIES_PATH = ".cache/perf_metrics.jsonl"
+LOAD_TIMEOUT = 5000
+
+# Installed per page (not per context): pooled contexts would keep context init scripts forever
+OBSERVER_SCRIPT = """
+(() => {
+    if (window.__kiwiPerf) {
+        return;
+    }
+    const state = window.__kiwiPerf = {lcp: null, cls: 0, longTaskCount: 0, longTaskMs: 0, longTaskMaxMs: 0};
+    const observe = (type, handler) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(handler)).observe({type, buffered: true});
+        } catch (e) {
+            // Entry type not supported by this browser
+        }
+    };
+    observe('largest-contentful-paint', entry => { state.lcp = entry.startTime; });
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) state.cls += entry.value; });
+    observe('longtask', entry => {
+        state.longTaskCount += 1;
+        state.longTaskMs += entry.duration;
+        state.longTaskMaxMs = Math.max(state.longTaskMaxMs, entry.duration);
+    });
+})();
+"""
+
+# Milliseconds are relative to the document's navigation start
+COLLECT_SCRIPT = """
+() => {
+    const round = value => (value === null || value === undefined) ? null : Math.round(value * 10) / 10;
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = Object.fromEntries(performance.getEntriesByType('paint').map(entry => [entry.name, entry.startTime]));
+    const state = window.__kiwiPerf || {lcp: null, cls: null, longTaskCount: null, longTaskMs: null, longTaskMaxMs: null};
+    return {
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        ttfb_ms: nav ? round(nav.responseStart) : null,
+        dom_content_loaded_ms: nav ? round(nav.domContentLoadedEventEnd) : null,
+        load_ms: nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+        transfer_bytes: nav ? nav.transferSize : null,
+        first_paint_ms: round(paint['first-paint']),
+        first_contentful_paint_ms: round(paint['first-contentful-paint']),
+        lcp_ms: round(state.lcp),
+        cls: state.cls === null ? null : Math.round(state.cls * 1000) / 1000,
+        long_task_count: state.longTaskCount,
+        long_task_ms: round(state.longTaskMs),
+        long_task_max_ms: round(state.longTaskMaxMs),
+    };
+}
+"""
+
+# Describe the document's load; a capture without a new navigation (SPA route change) leaves them empty
+NAVIGATION_FIELDS = (
+    "ttfb_ms", "dom_content_loaded_ms", "load_ms", "transfer_bytes",
+    "first_paint_ms", "first_contentful_paint_ms", "lcp_ms",
+)
+# Accumulate over the document's lifetime; same-document captures report the change since the last one
+DOCUMENT_TOTALS = ("cls", "long_task_count", "long_task_ms")
+
+# Performance.getMetrics names kept, with durations converted from seconds to ms. Gauges are
+# current values; the counts and durations accumulate over the page's lifetime, so records
+# hold the change since the previous capture on the same page.
+CDP_GAUGES = ("Nodes", "JSHeapUsedSize")
+CDP_COUNTERS = ("LayoutCount", "RecalcStyleCount")
+CDP_DURATIONS = ("ScriptDuration", "LayoutDuration", "RecalcStyleDuration", "TaskDuration")
+
+
+class PerfMonitor:
+    """
+    Per-page performance metrics collector
+
+    Disabled by default; prepare() and capture() then return immediately, so
+    page objects can call them unconditionally. Each prepared page keeps its
+    previous capture, so cumulative values are recorded as deltas and a
+    capture of the same document (no navigation in between) is flagged with
+    same_document and has no navigation fields.
+    """
+
+    def __init__(self):
+        """Initialize a disabled monitor"""
+        self.enabled = False
+        self.records: List[Dict] = []
+        # Prepared pages: CDP session (None off Chromium) and the previous capture's raw values
+        self._pages: "WeakKeyDictionary[Page, Dict[str, Any]]" = WeakKeyDictionary()
+
+    def prepare(self, page: Page) -> None:
+        """
+        Install the PerformanceObserver script and CDP session once per page
+
+        Must run before the navigation to be measured.
+
+        Args:
+            page: Playwright page
+        """
+        if not self.enabled or page in self._pages:
+            return
+        page.add_init_script(OBSERVER_SCRIPT)
+        self._pages[page] = {"session": self._cdp_session(page), "cdp": {}, "document": {}}
+
+    @staticmethod
+    def _cdp_session(page: Page) -> Optional[CDPSession]:
+        """Open a CDP session with Performance enabled, on Chromium only"""
+        browser = page.context.browser
+        if not browser or browser.browser_type.name != "chromium":
+            return None
+        try:
+            session = page.context.new_cdp_session(page)
+            session.send("Performance.enable")
+            return session
+        except Exception as e:
+            logger.warning(f"CDP performance metrics unavailable: {e}")
+            return None
+
+    def capture(self, page: Page, label: str, wait_for_load: bool = True) -> Optional[Dict]:
+        """
+        Record the metrics of the page's current document
+
+        Args:
+            page: Playwright page
+            label: What was measured (e.g. "navigate", "search_results")
+            wait_for_load: Wait up to LOAD_TIMEOUT for the load event first
+
+        Returns:
+            The record, or None if disabled or collection failed
+        """
+        if not self.enabled:
+            return None
+        self.prepare(page)
+        state = self._pages[page]
+        try:
+            if wait_for_load:
+                try:
+                    page.wait_for_load_state("load", timeout=LOAD_TIMEOUT)
+                except Exception:
+                    logger.info(f"No load event within {LOAD_TIMEOUT} ms - collecting {label} metrics anyway")
+            record = {"label": label, **self._document_metrics(page.evaluate(COLLECT_SCRIPT), state)}
+            if state["session"]:
+                record.update(self._cdp_metrics(state["session"], state))
+        except Exception as e:
+            logger.warning(f"Could not collect {label} performance metrics: {e}")
+            return None
+        self.records.append(record)
+        if record["same_document"]:
+            logger.info(
+                f"Perf {label} (same document): CLS +{record['cls']}, long tasks +{record['long_task_count']}"
+            )
+        else:
+            logger.info(
+                f"Perf {label}: TTFB {record['ttfb_ms']} ms, FCP {record['first_contentful_paint_ms']} ms, "
+                f"LCP {record['lcp_ms']} ms, CLS {record['cls']}, long tasks {record['long_task_count']}"
+            )
+        return record
+
+    @staticmethod
+    def _document_metrics(collected: Dict, state: Dict[str, Any]) -> Dict:
+        """
+        Page metrics, relative to the previous capture when the document did not change
+
+        Args:
+            collected: COLLECT_SCRIPT result
+            state: The page's entry in _pages, updated with this capture
+
+        Returns:
+            Metrics with same_document set
+        """
+        previous = state["document"]
+        state["document"] = dict(collected)
+        time_origin = collected.pop("time_origin")
+        same_document = time_origin is not None and time_origin == previous.get("time_origin")
+        if same_document:
+            for field in NAVIGATION_FIELDS:
+                collected[field] = None
+            for field in DOCUMENT_TOTALS:
+                if collected[field] is not None and previous.get(field) is not None:
+                    collected[field] = round(collected[field] - previous[field], 3)
+        return {"same_document": same_document, **collected}
+
+    @staticmethod
+    def _cdp_metrics(session: CDPSession, state: Dict[str, Any]) -> Dict:
+        """
+        Selected Performance.getMetrics values, cumulative ones as the change since the last capture
+
+        Args:
+            session: The page's CDP session
+            state: The page's entry in _pages, updated with this capture
+
+        Returns:
+            cdp_* metrics
+        """
+        metrics = {metric["name"]: metric["value"] for metric in session.send("Performance.getMetrics")["metrics"]}
+        previous, state["cdp"] = state["cdp"], metrics
+        result = {f"cdp_{name}": metrics[name] for name in CDP_GAUGES if name in metrics}
+        result.update({
+            f"cdp_{name}": metrics[name] - previous.get(name, 0) for name in CDP_COUNTERS if name in metrics
+        })
+        result.update({
+            f"cdp_{name}_ms": round((metrics[name] - previous.get(name, 0)) * 1000, 1)
+            for name in CDP_DURATIONS if name in metrics
+        })
+        return result
+
+    def take(self) -> List[Dict]:
+        """
+        Records collected since the last call
+
+        Returns:
+            Records in capture order
+        """
+        records, self.records = self.records, []
+        return records
+
+
+def append_series(records: List[Dict], test: str, path: str = DEFAULT_SERIES_PATH) -> None:
+    """
+    Append records to the JSON Lines time series
+
+    Args:
+        records: Records from PerfMonitor.take()
+        test: pytest node id
+        path: Series file
+    """
+    if not records:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps({"time": timestamp, "test": test, "worker": worker, **record}) + "\n")
+
+
+# Single monitor per process
+perf_monitor = PerfMonitor()
@@ -0,0 +1,45 @@
+"""
+Execution profiles
+Named bundles of headless, slow_mo, typing delay and timeout settings
+"""
+from typing import Dict
+import os
+
+# headless/slow_mo go to the browser launch; typing_delay and timeout to BasePage
+PROFILES: Dict[str, Dict] = {
+    # Watch the run locally: visible browser, slowed down, human-speed typing
+    "debug": {"headless": False, "slow_mo": 500, "typing_delay": 100, "timeout": 30000},
+    # Docker and CI: headless, no artificial slowdown
+    "ci": {"headless": True, "slow_mo": 0, "typing_delay": 20, "timeout": 30000},
+    # Maximum speed for throughput and latency measurements
+    "benchmark": {"headless": True, "slow_mo": 0, "typing_delay": 0, "timeout": 15000},
+}
+
+
+def default_profile() -> str:
+    """
+    Profile to use when none is given on the command line
+
+    Returns:
+        EXECUTION_PROFILE if set, "ci" under CI or in a container, otherwise "debug"
+    """
+    name = os.getenv("EXECUTION_PROFILE", "").strip().lower()
+    if name in PROFILES:
+        return name
+    if os.getenv("CI") or os.path.exists("/.dockerenv"):
+        return "ci"
+    return "debug"
+
+
+def describe(name: str) -> str:
+    """
+    One-line description of a profile for report headers
+
+    Args:
+        name: Profile name
+
+    Returns:
+        Name followed by its settings
+    """
+    settings = ", ".join(f"{key}={value}" for key, value in PROFILES[name].items())
+    return f"{name} ({settings})"
@@ -0,0 +1,211 @@
+"""
+Resource filter
+Blocks images, fonts, media, analytics and ads that page flows do not need
+"""
+from playwright.sync_api import BrowserContext, Request, Response, Route
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_TYPES = ("image", "font", "media")
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "criteo.com",
+    "bat.bing.com",
+    "scorecardresearch.com",
+    "tiktok.com",
+)
+DEFAULT_SIZES_PATH = ".cache/resource_sizes.json"
+# Most recently learned entries kept on disk
+MAX_SIZES = 5000
+
+
+def _matches_domain(host: str, domains: Iterable[str]) -> bool:
+    """Check whether host is one of domains or a subdomain of one"""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+def size_key(url: str) -> str:
+    """
+    Size table key of a URL: scheme, host and path
+
+    Cache busters, tracking ids and signed query strings change on every
+    load, so keying by the full URL would almost never match again.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        URL without query string and fragment
+    """
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+class ResourceFilter:
+    """
+    Request interception layer for one test
+
+    In "block" mode matching requests are aborted and counted. In "observe"
+    mode they pass through and their Content-Length is learned, so later
+    blocked runs can report the bytes they saved. Requests whose size was
+    never learned count as unknown, so blocked_bytes is a lower bound.
+    """
+
+    def __init__(self, block_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+                 block_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allow_domains: Iterable[str] = (), sizes: Optional[Dict[str, int]] = None):
+        """
+        Initialize resource filter
+
+        Args:
+            block_types: Playwright resource types to block (image, font, media, ...)
+            block_domains: Domains (and subdomains) to block regardless of type
+            allow_domains: Domains never blocked, overriding both deny lists
+            sizes: Learned response sizes by size_key(), shared across tests
+        """
+        self.block_types = set(block_types)
+        self.block_domains = tuple(block_domains)
+        self.allow_domains = tuple(allow_domains)
+        self.sizes = sizes if sizes is not None else {}
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.unknown_size_requests = 0
+        self._context: Optional[BrowserContext] = None
+
+    def should_block(self, request: Request) -> bool:
+        """
+        Decide whether a request is blocked
+
+        Args:
+            request: Intercepted request
+
+        Returns:
+            True if the request matches the deny lists and not the allow list
+        """
+        host = urlparse(request.url).hostname or ""
+        if _matches_domain(host, self.allow_domains):
+            return False
+        return request.resource_type in self.block_types or _matches_domain(host, self.block_domains)
+
+    def _handle(self, route: Route) -> None:
+        """Abort blocked requests and let everything else through"""
+        request = route.request
+        if not self.should_block(request):
+            route.fallback()
+            return
+        self.blocked_requests += 1
+        size = self.sizes.get(size_key(request.url))
+        if size is None:
+            self.unknown_size_requests += 1
+        else:
+            self.blocked_bytes += size
+        route.abort("blockedbyclient")
+
+    def _learn(self, response: Response) -> None:
+        """Remember the size of a response the filter would have blocked"""
+        if not self.should_block(response.request):
+            return
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.sizes[size_key(response.url)] = int(length)
+
+    def attach(self, context: BrowserContext, block: bool = True) -> None:
+        """
+        Start filtering or observing a context
+
+        Register after any HAR routing so the filter runs first.
+
+        Args:
+            context: Browser context
+            block: Block matching requests; False only learns their sizes
+        """
+        self._context = context
+        if block:
+            context.route("**/*", self._handle)
+        else:
+            context.on("response", self._learn)
+
+    def detach(self) -> None:
+        """Remove the filter from its context"""
+        if not self._context:
+            return
+        try:
+            self._context.unroute("**/*", self._handle)
+        except Exception:
+            pass
+        self._context.remove_listener("response", self._learn)
+        self._context = None
+
+    def summary(self) -> Dict:
+        """
+        Savings for the test
+
+        Returns:
+            Blocked request count, bytes saved by requests of known size (a lower
+            bound) and blocked requests of unknown size
+        """
+        return {
+            "blocked_requests": self.blocked_requests,
+            "blocked_bytes": self.blocked_bytes,
+            "unknown_size_requests": self.unknown_size_requests,
+        }
+
+
+def load_sizes(path: str = DEFAULT_SIZES_PATH) -> Dict[str, int]:
+    """
+    Load learned response sizes
+
+    Args:
+        path: JSON file of size_key() to byte size
+
+    Returns:
+        Size table, oldest entry first; empty if the file is missing or unreadable
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            sizes = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Tables written before keys dropped the query string
+    return {size_key(url): size for url, size in sizes.items()}
+
+
+def save_sizes(sizes: Dict[str, int], path: str = DEFAULT_SIZES_PATH, max_entries: int = MAX_SIZES) -> None:
+    """
+    Merge learned response sizes into the on-disk table
+
+    Entries learned or confirmed in this session move to the end, and only
+    the newest max_entries are kept, so resources no longer requested age out.
+
+    Args:
+        sizes: Size table learned in this session
+        path: JSON file of size_key() to byte size
+        max_entries: Table size limit
+    """
+    if not sizes:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    merged = load_sizes(path)
+    for key, size in sizes.items():
+        merged.pop(key, None)
+        merged[key] = size
+    merged = dict(list(merged.items())[-max_entries:])
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save resource sizes {path}: {e}")
@@ -0,0 +1,169 @@
+"""
+Route matrix
+Loads origin/destination/date rows for Scenario Outlines and splits them across workers by cost
+"""
+from collections import defaultdict
+from pytest_bdd.feature import get_feature
+from typing import Dict, List, Optional
+import csv
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MATRIX_PATH = "tests/data/route_matrix.csv"
+MATRIX_COLUMNS = ("origin", "destination", "weeks")
+DEFAULT_ROW_COST = 1.0
+
+
+def matrix_path() -> str:
+    """
+    Matrix file for this run
+
+    Read at import time of the step module, so it comes from the
+    environment rather than a command line option.
+
+    Returns:
+        ROUTE_MATRIX if set, DEFAULT_MATRIX_PATH otherwise
+    """
+    return os.getenv("ROUTE_MATRIX", DEFAULT_MATRIX_PATH)
+
+
+def route_key(row: Dict[str, str]) -> str:
+    """
+    Identity of a row, matching pytest-bdd's example id
+
+    Args:
+        row: Matrix row or example parameters
+
+    Returns:
+        Column values joined with "-"
+    """
+    return "-".join(row[column] for column in MATRIX_COLUMNS)
+
+
+def load_routes(path: str = DEFAULT_MATRIX_PATH) -> List[Dict[str, str]]:
+    """
+    Read route rows from a CSV or JSON file
+
+    CSV files need a header row; JSON files hold a list of objects. Both use
+    the MATRIX_COLUMNS keys plus an optional "cost" estimate in seconds.
+
+    Args:
+        path: .csv or .json matrix file
+
+    Returns:
+        Rows with string values, in file order
+
+    Raises:
+        ValueError: If a row misses one of MATRIX_COLUMNS
+    """
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.endswith(".json"):
+            raw_rows = json.load(f)
+        else:
+            raw_rows = list(csv.DictReader(f))
+
+    rows = []
+    for number, raw in enumerate(raw_rows, start=1):
+        missing = [column for column in MATRIX_COLUMNS if str(raw.get(column, "")).strip() == ""]
+        if missing:
+            raise ValueError(f"{path} row {number} misses {', '.join(missing)}")
+        row = {column: str(raw[column]).strip() for column in MATRIX_COLUMNS}
+        if str(raw.get("cost", "")).strip():
+            row["cost"] = str(raw["cost"]).strip()
+        rows.append(row)
+    return rows
+
+
+def add_examples(feature_path: str, rows: List[Dict[str, str]]) -> int:
+    """
+    Append rows to the Examples of every Scenario Outline in a feature
+
+    Must run before scenarios() binds the feature, which then reuses the
+    parsed feature from pytest-bdd's cache. Only columns named in the
+    outline's Examples header are used.
+
+    Args:
+        feature_path: Absolute path of the .feature file
+        rows: Matrix rows
+
+    Returns:
+        Number of example rows added
+    """
+    feature = get_feature(os.path.dirname(feature_path), os.path.basename(feature_path))
+    added = 0
+    for template in feature.scenarios.values():
+        examples = template.examples
+        if not examples.example_params:
+            continue
+        for row in rows:
+            examples.add_example([row[param] for param in examples.example_params])
+            added += 1
+    return added
+
+
+def historical_costs(history: List[Dict]) -> Dict[str, float]:
+    """
+    Mean wall time per test from step timing history
+
+    Args:
+        history: Step records from utils.step_timing.load_history()
+
+    Returns:
+        Seconds per test node id, averaged over recorded runs
+    """
+    per_run: Dict[tuple, float] = defaultdict(float)
+    for record in history:
+        per_run[(record.get("run_started"), record["test"])] += record["wall_ms"] / 1000
+    totals: Dict[str, List[float]] = defaultdict(list)
+    for (_, test), seconds in per_run.items():
+        totals[test].append(seconds)
+    return {test: sum(values) / len(values) for test, values in totals.items()}
+
+
+def estimate_cost(nodeid: str, row_cost: Optional[str], history_costs: Dict[str, float]) -> float:
+    """
+    Cost of one matrix row
+
+    Args:
+        nodeid: pytest node id of the row
+        row_cost: Explicit "cost" column value, if any
+        history_costs: Output of historical_costs()
+
+    Returns:
+        Estimated seconds; history wins over the column, DEFAULT_ROW_COST otherwise
+    """
+    if nodeid in history_costs:
+        return history_costs[nodeid]
+    try:
+        return float(row_cost) if row_cost else DEFAULT_ROW_COST
+    except ValueError:
+        return DEFAULT_ROW_COST
+
+
+def split_by_cost(costs: Dict[str, float], bins: int) -> Dict[str, int]:
+    """
+    Assign items to bins so bin totals stay balanced
+
+    Longest-processing-time-first: the costliest remaining item goes to the
+    currently lightest bin. Ties break on the item key so every xdist worker
+    computes the same split.
+
+    Args:
+        costs: Estimated cost per item key
+        bins: Number of bins (workers)
+
+    Returns:
+        Bin index per item key
+    """
+    bins = max(1, bins)
+    loads = [0.0] * bins
+    assignment = {}
+    for key, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        target = min(range(bins), key=lambda index: (loads[index], index))
+        assignment[key] = target
+        loads[target] += cost
+    logger.info(f"Split into {bins} group(s), estimated loads: {[round(load, 1) for load in loads]}")
+    return assignment
@@ -0,0 +1,296 @@
+"""
+Search API capture
+Decodes the results page's search XHR/GraphQL responses into itineraries, and records or replays them as fixtures
+"""
+from pages.results_page import Itinerary
+from playwright.sync_api import BrowserContext, Request, Route
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+SEARCH_FIXTURE_MODES = ("off", "record", "replay")
+DEFAULT_FIXTURE_DIR = "tests/data/search_responses"
+
+# Local stand-in endpoint and Kiwi.com's GraphQL itinerary queries
+SEARCH_API_PATTERN = re.compile(r"/api/search(\?|$)|/graphql\?featureName=Search\w*Itineraries", re.IGNORECASE)
+
+# Departure dates move with the run date (the matrix searches N weeks ahead), so fixture keys ignore them
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _number(value: Any) -> Optional[float]:
+    """Float from a number, numeric string or {"amount": ...} mapping"""
+    if isinstance(value, dict):
+        value = value.get("amount")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def decode_local(payload: Dict) -> List[Itinerary]:
+    """
+    Itineraries from the local stand-in's /api/search payload
+
+    Args:
+        payload: {"search_id", "itineraries": [...]} as served by utils.local_server
+
+    Returns:
+        Itinerary records in payload order
+    """
+    return [
+        Itinerary(
+            id=str(item["id"]),
+            price=_number(item.get("price")),
+            currency=payload.get("currency", ""),
+            carriers=tuple(item.get("carriers", ())),
+            duration_minutes=item.get("duration_minutes"),
+            stops=item.get("stops"),
+        )
+        for item in payload.get("itineraries", [])
+    ]
+
+
+def decode_graphql(payload: Dict) -> List[Itinerary]:
+    """
+    Itineraries from a Kiwi.com GraphQL search response
+
+    The schema is not public, so this walks data.<query>.itineraries and
+    reads price.amount, duration (seconds) and the carriers of the sector
+    segments, leaving fields it cannot find empty.
+
+    Args:
+        payload: GraphQL response body
+
+    Returns:
+        Itinerary records in payload order
+    """
+    itineraries = []
+    for query in (payload.get("data") or {}).values():
+        if not isinstance(query, dict) or not isinstance(query.get("itineraries"), list):
+            continue
+        for item in query["itineraries"]:
+            segments = [
+                sector_segment.get("segment") or {}
+                for sector in ([item.get("sector")] if item.get("sector") else item.get("sectors", []))
+                for sector_segment in (sector or {}).get("sectorSegments", [])
+            ]
+            names = ((segment.get("carrier") or {}).get("name", "") for segment in segments)
+            carriers = tuple(name for name in dict.fromkeys(names) if name)
+            duration = _number(item.get("duration") or (item.get("sector") or {}).get("duration"))
+            price = item.get("price") or {}
+            itineraries.append(Itinerary(
+                id=str(item.get("id", len(itineraries))),
+                price=_number(price),
+                currency=(price.get("currency") or {}).get("code", "") if isinstance(price, dict) else "",
+                carriers=carriers,
+                duration_minutes=int(duration // 60) if duration is not None else None,
+                stops=len(segments) - 1 if segments else None,
+            ))
+    return itineraries
+
+
+def decode_payload(payload: Dict) -> List[Itinerary]:
+    """
+    Decode either response shape
+
+    Args:
+        payload: Parsed JSON body
+
+    Returns:
+        Itinerary records
+    """
+    if "itineraries" in payload:
+        return decode_local(payload)
+    return decode_graphql(payload)
+
+
+def fixture_path(fixture_dir: str, url: str, post_data: Optional[str] = None) -> str:
+    """
+    Fixture file for a search request
+
+    GraphQL searches share one URL and differ only in their body, so a hash
+    of the body is part of the name. ISO dates in both are replaced by
+    "DATE": a fixture recorded for "4 weeks ahead" keeps matching the same
+    search on later days, and replays the recorded dates.
+
+    Args:
+        fixture_dir: Directory holding recorded payloads
+        url: Request URL
+        post_data: Request body, if any
+
+    Returns:
+        Path named after the URL path and query, plus the body hash
+    """
+    parsed = urlparse(url)
+    slug = re.sub(r"[^\w.-]+", "_", DATE_PATTERN.sub("DATE", f"{parsed.path}_{parsed.query}")).strip("_")
+    if post_data:
+        digest = hashlib.sha1(DATE_PATTERN.sub("DATE", post_data).encode("utf-8")).hexdigest()[:12]
+        slug = f"{slug}_{digest}"
+    return os.path.join(fixture_dir, f"{slug}.json")
+
+
+class SearchResponse:
+    """One captured search API response"""
+
+    __slots__ = ("url", "status", "latency_ms", "size_bytes", "itineraries", "from_fixture", "error")
+
+    def __init__(self, url: str, status: int, latency_ms: Optional[float], size_bytes: int,
+                 itineraries: List[Itinerary], from_fixture: bool = False, error: Optional[str] = None):
+        self.url = url
+        self.status = status
+        self.latency_ms = latency_ms
+        self.size_bytes = size_bytes
+        self.itineraries = itineraries
+        self.from_fixture = from_fixture
+        self.error = error
+
+    @property
+    def result_count(self) -> int:
+        """Number of decoded itineraries"""
+        return len(self.itineraries)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Latency, payload size and result count for reports"""
+        return {
+            "search_api_latency_ms": self.latency_ms,
+            "search_api_bytes": self.size_bytes,
+            "search_api_results": self.result_count,
+        }
+
+
+class SearchCapture:
+    """
+    Listens for search API responses on a context and decodes them as they arrive
+
+    In "record" mode each response body is also written to the fixture
+    directory; in "replay" mode matching requests are fulfilled from it, and
+    requests without a fixture go to the network.
+    """
+
+    def __init__(self, mode: str = "off", fixture_dir: str = DEFAULT_FIXTURE_DIR,
+                 pattern: re.Pattern = SEARCH_API_PATTERN,
+                 decode: Callable[[Dict], List[Itinerary]] = decode_payload):
+        """
+        Initialize search capture
+
+        Args:
+            mode: One of SEARCH_FIXTURE_MODES
+            fixture_dir: Directory of recorded payloads
+            pattern: Regex matched against request URLs
+            decode: Turns a parsed JSON body into itineraries
+        """
+        self.mode = mode
+        self.fixture_dir = fixture_dir
+        self.pattern = pattern
+        self.decode = decode
+        self.responses: List[SearchResponse] = []
+        self._context: Optional[BrowserContext] = None
+        self._fulfilled: Dict[str, float] = {}
+
+    def attach(self, context: BrowserContext) -> None:
+        """
+        Start capturing on a context
+
+        Args:
+            context: Browser context
+        """
+        self._context = context
+        context.on("requestfinished", self._on_finished)
+        context.on("requestfailed", self._on_failed)
+        if self.mode == "replay":
+            context.route(self.pattern, self._replay)
+
+    def detach(self) -> None:
+        """Stop capturing"""
+        if not self._context:
+            return
+        try:
+            self._context.remove_listener("requestfinished", self._on_finished)
+            self._context.remove_listener("requestfailed", self._on_failed)
+            if self.mode == "replay":
+                self._context.unroute(self.pattern, self._replay)
+        except Exception as e:
+            logger.debug(f"Search capture detach: {e}")
+        self._context = None
+
+    def wait_for_search(self, timeout: int = 15000) -> Optional[SearchResponse]:
+        """
+        Latest captured search response, waiting for one if none arrived yet
+
+        Args:
+            timeout: Maximum wait in milliseconds
+
+        Returns:
+            The latest response, or None if none arrived in time
+        """
+        if not self.responses and self._context:
+            try:
+                self._context.wait_for_event(
+                    "requestfinished", predicate=lambda request: bool(self.pattern.search(request.url)), timeout=timeout
+                )
+            except Exception:
+                logger.warning(f"No search API response within {timeout} ms")
+        return self.responses[-1] if self.responses else None
+
+    def _replay(self, route: Route) -> None:
+        """Fulfill a search request from its recorded fixture"""
+        path = fixture_path(self.fixture_dir, route.request.url, route.request.post_data)
+        if not os.path.exists(path):
+            logger.info(f"No search fixture at {path} - sending request to the network")
+            route.fallback()
+            return
+        self._fulfilled[route.request.url] = time.perf_counter()
+        route.fulfill(path=path, content_type="application/json")
+
+    def _on_finished(self, request: Request) -> None:
+        """Decode a finished search response"""
+        if not self.pattern.search(request.url):
+            return
+        response = request.response()
+        if response is None:
+            return
+        try:
+            body = response.body()
+            itineraries = self.decode(json.loads(body))
+            error = None
+        except Exception as e:
+            body, itineraries, error = b"", [], f"{type(e).__name__}: {e}"
+            logger.warning(f"Could not decode search response {request.url}: {error}")
+
+        started = self._fulfilled.pop(request.url, None)
+        response_end = request.timing.get("responseEnd", -1)
+        if response_end is not None and response_end >= 0:
+            latency_ms = round(response_end, 1)
+        elif started is not None:
+            latency_ms = round((time.perf_counter() - started) * 1000, 1)
+        else:
+            latency_ms = None
+
+        captured = SearchResponse(request.url, response.status, latency_ms, len(body), itineraries,
+                                  from_fixture=started is not None, error=error)
+        self.responses.append(captured)
+        logger.info(
+            f"Search API {response.status}: {captured.result_count} itineraries, {len(body)} bytes, "
+            f"{latency_ms} ms{' (fixture)' if captured.from_fixture else ''}"
+        )
+        if self.mode == "record" and body and error is None:
+            path = fixture_path(self.fixture_dir, request.url, request.post_data)
+            os.makedirs(self.fixture_dir, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(body)
+            logger.info(f"Search response recorded to {path}")
+
+    def _on_failed(self, request: Request) -> None:
+        """Record a search request that never got a response"""
+        if not self.pattern.search(request.url):
+            return
+        self.responses.append(SearchResponse(request.url, 0, None, 0, [], error=request.failure))
+        logger.warning(f"Search API request failed: {request.url} ({request.failure})")
@@ -0,0 +1,152 @@
+"""
+Learned selector cache
+Remembers which fallback selector won for each page action across runs
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+import json
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows - atomic replace still prevents torn files
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = ".cache/selector_cache.json"
+DEFAULT_MAX_MISSES = 3
+
+
+class SelectorCache:
+    """
+    On-disk cache of winning selectors keyed by page action
+
+    Entries look like:
+        {"HomePage.click_search_button": {"selector": "...", "hits": 4,
+                                          "misses": 0, "updated": "2024-01-01T10:00:00"}}
+
+    Every update is a locked read-modify-write followed by an atomic
+    replace, so pytest-xdist workers can share one file.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_misses: int = DEFAULT_MAX_MISSES):
+        """
+        Initialize selector cache
+
+        Args:
+            path: JSON file holding the cache
+            max_misses: Evict an entry after this many misses
+        """
+        self.path = path
+        self.max_misses = max_misses
+        self._lock_path = f"{path}.lock"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold a shared or exclusive lock on the sidecar lock file"""
+        with open(self._lock_path, "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, dict]:
+        """Read cache contents, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, dict]) -> None:
+        """Atomically replace the cache file"""
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the learned selector for a page action
+
+        Args:
+            key: Page action key (e.g. 'HomePage.click_search_button')
+
+        Returns:
+            Cached selector or None
+        """
+        with self._locked(exclusive=False):
+            entry = self._read().get(key)
+        return entry["selector"] if entry else None
+
+    def order(self, key: str, selectors: List[str]) -> List[str]:
+        """
+        Reorder fallback selectors so the learned winner is tried first
+
+        Args:
+            key: Page action key
+            selectors: Fallback selectors in their default priority order
+
+        Returns:
+            Selectors with the cached winner promoted to the front
+        """
+        cached = self.get(key)
+        if cached not in selectors:
+            return list(selectors)
+        return [cached] + [selector for selector in selectors if selector != cached]
+
+    def record(self, key: str, winner: Optional[str]) -> None:
+        """
+        Record the outcome of a resolution for a page action
+
+        A win by the cached selector counts as a hit and clears its misses. A
+        win by another selector counts as a miss; after max_misses consecutive
+        misses the entry is evicted and replaced by the current winner. When
+        nothing matched the page was not ready, which says nothing about the
+        cached selector, so the entry is left as is.
+
+        Args:
+            key: Page action key
+            winner: Selector that won, or None if nothing matched
+        """
+        if winner is None:
+            return
+        now = datetime.now().isoformat(timespec="seconds")
+        try:
+            with self._locked(exclusive=True):
+                data = self._read()
+                entry = data.get(key)
+
+                if entry and entry["selector"] == winner:
+                    entry["hits"] += 1
+                    entry["misses"] = 0
+                    entry["updated"] = now
+                elif entry:
+                    entry["misses"] += 1
+                    entry["updated"] = now
+                    if entry["misses"] >= self.max_misses:
+                        logger.info(f"Evicting stale selector for {key}: {entry['selector']}")
+                        data[key] = {"selector": winner, "hits": 1, "misses": 0, "updated": now}
+                else:
+                    data[key] = {"selector": winner, "hits": 1, "misses": 0, "updated": now}
+
+                self._write(data)
+        except OSError as e:
+            logger.warning(f"Could not update selector cache {self.path}: {e}")
@@ -0,0 +1,295 @@
+"""
+Step timing
+Measures wall time, Playwright time and fixed-sleep time for each BDD step
+"""
+from importlib import metadata
+from typing import Dict, List, Optional, Tuple
+import inspect
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMINGS_PATH = "reports/step_timings.json"
+DEFAULT_HISTORY_PATH = ".cache/step_timings_history.jsonl"
+# The history keeps the newest records; it is trimmed once it grows a fifth past this
+MAX_HISTORY_RECORDS = 20000
+
+# Playwright releases whose private SyncBase._sync(self, coro) dispatcher was checked, [min, max)
+SYNC_PATCH_VERSIONS = ((1, 30), (1, 50))
+
+
+def _playwright_version() -> Optional[Tuple[int, int]]:
+    """Installed Playwright major and minor version, or None if unknown"""
+    try:
+        major, minor = metadata.version("playwright").split(".")[:2]
+        return int(major), int(minor)
+    except (metadata.PackageNotFoundError, ValueError):
+        return None
+
+
+def _sync_dispatcher():
+    """
+    Playwright's sync dispatcher class, if this release can be patched
+
+    Returns:
+        SyncBase, or None if the version is outside SYNC_PATCH_VERSIONS or
+        _sync no longer takes a single coroutine
+    """
+    version = _playwright_version()
+    if version is None or not SYNC_PATCH_VERSIONS[0] <= version < SYNC_PATCH_VERSIONS[1]:
+        logger.warning(f"Playwright {version} not verified for step timing - recording wall time only")
+        return None
+    try:
+        from playwright._impl._sync_base import SyncBase
+        parameters = list(inspect.signature(SyncBase._sync).parameters)
+    except (ImportError, AttributeError, TypeError, ValueError) as e:
+        logger.warning(f"Playwright sync dispatcher not found ({e}) - recording wall time only")
+        return None
+    if len(parameters) != 2:
+        logger.warning(f"Unexpected SyncBase._sync{tuple(parameters)} - recording wall time only")
+        return None
+    return SyncBase
+
+
+def percentiles(values: List[float], points=(50, 90, 95, 99)) -> Dict[str, float]:
+    """
+    Nearest-rank percentiles
+
+    Args:
+        values: Samples
+        points: Percentiles to compute
+
+    Returns:
+        Mapping like {"p50": ..., "p95": ...}; empty if there are no samples
+    """
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {}
+    for point in points:
+        rank = max(1, math.ceil(point / 100 * len(ordered)))
+        result[f"p{point}"] = round(ordered[rank - 1], 1)
+    return result
+
+
+class StepTimer:
+    """
+    Collects timings for the steps of the running scenario
+
+    Time inside Playwright is measured at the sync API dispatch point
+    (SyncBase._sync), which every sync call goes through. Only the outermost
+    call is counted, so route handlers running inside a call are not double
+    counted. Page.wait_for_timeout calls are counted as fixed sleeps.
+
+    The dispatcher is private, so it is only patched on verified Playwright
+    releases; elsewhere steps get wall time only (instrumented is False and
+    Playwright/sleep time stay 0).
+    """
+
+    def __init__(self):
+        """Initialize an empty timer"""
+        self.records: List[Dict] = []
+        self._installed = False
+        self.instrumented = False
+        self._depth = 0
+        self._step: Optional[Dict] = None
+        self._step_started = 0.0
+        self.written = False
+
+    def install(self) -> None:
+        """Wrap the Playwright sync dispatcher once per process"""
+        if self._installed:
+            return
+        self._installed = True
+        dispatcher = _sync_dispatcher()
+        if dispatcher is None:
+            return
+        original = dispatcher._sync
+        timer = self
+
+        def timed_sync(sync_base, coro):
+            __tracebackhide__ = True
+            if timer._depth or timer._step is None:
+                return original(sync_base, coro)
+            timer._depth += 1
+            started = time.perf_counter()
+            try:
+                return original(sync_base, coro)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                timer._depth -= 1
+                if timer._step is not None:
+                    timer._step["playwright_ms"] += elapsed
+                    if getattr(coro, "__qualname__", "").endswith("wait_for_timeout"):
+                        timer._step["sleep_ms"] += elapsed
+
+        dispatcher._sync = timed_sync
+        self.instrumented = True
+
+    def start_step(self, test: str, scenario: str, step: str) -> None:
+        """
+        Start timing a step
+
+        Args:
+            test: pytest node id
+            scenario: Scenario name
+            step: Step text including keyword
+        """
+        self._step = {
+            "test": test,
+            "scenario": scenario,
+            "step": step,
+            "wall_ms": 0.0,
+            "playwright_ms": 0.0,
+            "sleep_ms": 0.0,
+            "status": "passed",
+        }
+        self._step_started = time.perf_counter()
+
+    def end_step(self, status: str = "passed") -> Optional[Dict]:
+        """
+        Finish timing the current step
+
+        Args:
+            status: passed or failed
+
+        Returns:
+            Step record, or None if no step was running
+        """
+        if self._step is None:
+            return None
+        record = self._step
+        self._step = None
+        record["wall_ms"] = (time.perf_counter() - self._step_started) * 1000
+        record["status"] = status
+        for key in ("wall_ms", "playwright_ms", "sleep_ms"):
+            record[key] = round(record[key], 1)
+        self.records.append(record)
+        return record
+
+    def records_for(self, test: str) -> List[Dict]:
+        """
+        Step records of one test
+
+        Args:
+            test: pytest node id
+
+        Returns:
+            Records in execution order
+        """
+        return [record for record in self.records if record["test"] == test]
+
+    def write(self, path: str = DEFAULT_TIMINGS_PATH, history_path: str = DEFAULT_HISTORY_PATH) -> None:
+        """
+        Write this run's records and append them to the cross-run history
+
+        The history is trimmed to the newest MAX_HISTORY_RECORDS records.
+
+        Args:
+            path: JSON file for this run
+            history_path: JSON Lines file accumulating every run
+        """
+        if not self.records:
+            return
+        run = {
+            "run_started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "steps": self.records,
+            "summary": summarize(self.records),
+        }
+        for target in (path, history_path):
+            os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(run, f, indent=2)
+        with open(history_path, "a", encoding="utf-8") as f:
+            for record in self.records:
+                f.write(json.dumps({"run_started": run["run_started"], **record}) + "\n")
+        trim_history(history_path)
+        self.written = True
+        logger.info(f"Step timings written to {path}")
+
+
+def trim_history(history_path: str = DEFAULT_HISTORY_PATH, max_records: int = MAX_HISTORY_RECORDS) -> None:
+    """
+    Keep only the newest records of the history file
+
+    Trimming waits until the file is a fifth over max_records, so the
+    rewrite is rare; it replaces the file atomically.
+
+    Args:
+        history_path: JSON Lines history file
+        max_records: Records to keep
+    """
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return
+    if len(lines) <= max_records * 1.2:
+        return
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(history_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.writelines(lines[-max_records:])
+        os.replace(tmp_path, history_path)
+    except OSError as e:
+        logger.warning(f"Could not trim step timing history {history_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    logger.info(f"Trimmed step timing history to the newest {max_records} records")
+
+
+def load_history(history_path: str = DEFAULT_HISTORY_PATH) -> List[Dict]:
+    """
+    Read every step record from previous runs
+
+    Args:
+        history_path: JSON Lines history file
+
+    Returns:
+        Step records, skipping unreadable lines
+    """
+    records = []
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return records
+
+
+def summarize(records: List[Dict]) -> Dict[str, Dict]:
+    """
+    Percentiles per step across records
+
+    Args:
+        records: Step records (one run or the whole history)
+
+    Returns:
+        Mapping of step text to sample count and wall/Playwright/sleep percentiles
+    """
+    by_step: Dict[str, List[Dict]] = {}
+    for record in records:
+        by_step.setdefault(record["step"], []).append(record)
+    return {
+        step: {
+            "samples": len(items),
+            "wall_ms": percentiles([item["wall_ms"] for item in items]),
+            "playwright_ms": percentiles([item["playwright_ms"] for item in items]),
+            "sleep_ms": percentiles([item["sleep_ms"] for item in items]),
+        }
+        for step, items in by_step.items()
+    }
+
+
+# Single timer per process - each xdist worker runs one scenario at a time
+step_timer = StepTimer()
@@ -0,0 +1,84 @@
+"""
+Storage state snapshot helpers
+Decide when a saved Playwright storage_state can be reused
+"""
+from typing import Optional
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_STATE_PATH = ".cache/storage_state.json"
+DEFAULT_MAX_AGE_HOURS = 12.0
+
+
+def is_storage_state_fresh(path: str, max_age_hours: float = DEFAULT_MAX_AGE_HOURS) -> bool:
+    """
+    Check whether a storage state snapshot can be reused
+
+    A snapshot is stale when the file is older than max_age_hours or any of
+    its cookies has already expired.
+
+    Args:
+        path: Storage state JSON file
+        max_age_hours: Maximum snapshot age in hours
+
+    Returns:
+        True if the snapshot exists and is still valid
+    """
+    if not os.path.exists(path):
+        return False
+
+    now = time.time()
+    age_hours = (now - os.path.getmtime(path)) / 3600
+    if age_hours > max_age_hours:
+        logger.info(f"Storage state {path} is {age_hours:.1f} h old - re-recording")
+        return False
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.info(f"Storage state {path} unreadable ({e}) - re-recording")
+        return False
+
+    for cookie in state.get("cookies", []):
+        expires = cookie.get("expires", -1)
+        if 0 < expires < now:
+            logger.info(f"Cookie {cookie.get('name')} in {path} expired - re-recording")
+            return False
+    return True
+
+
+def temp_path_for(path: str) -> str:
+    """
+    Per-process temporary path used before atomically replacing a snapshot
+
+    Args:
+        path: Final snapshot path
+
+    Returns:
+        Temporary path next to the snapshot
+    """
+    return f"{path}.{os.getpid()}.tmp"
+
+
+def publish(tmp_path: str, path: str) -> Optional[str]:
+    """
+    Atomically move a freshly written snapshot into place
+
+    Args:
+        tmp_path: Snapshot written by context.storage_state()
+        path: Final snapshot path
+
+    Returns:
+        Final path, or None if the snapshot could not be published
+    """
+    try:
+        os.replace(tmp_path, path)
+        return path
+    except OSError as e:
+        logger.warning(f"Could not publish storage state {path}: {e}")
+        return None
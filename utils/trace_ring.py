@@ -0,0 +1,148 @@
+"""
+Step trace ring buffer
+Records a Playwright trace chunk per BDD step and keeps only the last N, written out on failure
+"""
+from collections import deque
+from playwright.sync_api import BrowserContext
+from typing import Deque, List, Optional, Tuple
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACE_DIR = "reports/traces"
+DEFAULT_RING_SIZE = 5
+
+
+def _slug(name: str) -> str:
+    """File-name safe version of a step or test name"""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_")[:80]
+
+
+def trace_dir_for(base_dir: str, nodeid: str) -> str:
+    """
+    Directory receiving one test's kept step traces
+
+    Args:
+        base_dir: Trace report directory
+        nodeid: pytest node id
+
+    Returns:
+        Subdirectory named after the test
+    """
+    return os.path.join(base_dir, _slug(nodeid))
+
+
+class StepTraceRing:
+    """
+    Rolling buffer of per-step trace chunks for one test
+
+    Each finished step's chunk is saved to a temporary directory and the
+    oldest is deleted once more than size are held. keep() moves the
+    retained chunks to the report directory; close() stops tracing and
+    discards everything that was not kept.
+    """
+
+    def __init__(self, context: BrowserContext, size: int = DEFAULT_RING_SIZE, screenshots: bool = True):
+        """
+        Initialize step trace ring
+
+        Args:
+            context: Browser context to trace
+            size: Number of step chunks retained
+            screenshots: Include screencast frames in the chunks
+        """
+        self.context = context
+        self.size = max(1, size)
+        self.screenshots = screenshots
+        self._chunks: Deque[Tuple[str, str]] = deque()
+        self._tmp_dir = tempfile.mkdtemp(prefix="trace_ring_")
+        self._current: Optional[str] = None
+        self._index = 0
+        self._tracing = False
+
+    def start(self, step: Optional[str] = None) -> None:
+        """
+        Start tracing the context; the first chunk belongs to step if given
+
+        Args:
+            step: Name of the step already running, if any
+        """
+        self.context.tracing.start(screenshots=self.screenshots, snapshots=True, title=step)
+        self._tracing = True
+        if step:
+            self._index += 1
+            self._current = step
+
+    def start_step(self, step: str) -> None:
+        """
+        Assign the chunk in progress to a step
+
+        A chunk is always recording while tracing - since start() or the
+        last end_step() - so it is kept rather than restarted, and the step's
+        chunk includes the actions between the previous step and this one.
+        A step left open is saved as unfinished first.
+
+        Args:
+            step: Step name, used in the chunk file name
+        """
+        if not self._tracing:
+            return
+        if self._current is not None:
+            self.end_step("unfinished")
+        self._index += 1
+        self._current = step
+
+    def end_step(self, status: str = "passed") -> None:
+        """
+        Save the current step's chunk and evict the oldest beyond size
+
+        Args:
+            status: Step outcome, part of the chunk file name
+        """
+        if not self._tracing or self._current is None:
+            return
+        path = os.path.join(self._tmp_dir, f"{self._index:02d}_{status}_{_slug(self._current)}.zip")
+        self.context.tracing.stop_chunk(path=path)
+        self._chunks.append((self._current, path))
+        self._current = None
+        while len(self._chunks) > self.size:
+            _, evicted = self._chunks.popleft()
+            os.remove(evicted)
+        # Keep recording; start_step() claims this chunk, so actions between steps are kept
+        self.context.tracing.start_chunk()
+
+    def keep(self, target_dir: str) -> List[str]:
+        """
+        Move the retained chunks, including an unfinished step, to target_dir
+
+        Args:
+            target_dir: Directory for this test's traces
+
+        Returns:
+            Paths of the written trace zips, oldest step first
+        """
+        if self._current is not None:
+            self.end_step("unfinished")
+        os.makedirs(target_dir, exist_ok=True)
+        kept = []
+        for _, path in self._chunks:
+            target = os.path.join(target_dir, os.path.basename(path))
+            shutil.move(path, target)
+            kept.append(target)
+        self._chunks.clear()
+        logger.info(f"Kept {len(kept)} step trace(s) in {target_dir}")
+        return kept
+
+    def close(self) -> None:
+        """Stop tracing without saving and delete unkept chunks"""
+        if self._tracing:
+            try:
+                self.context.tracing.stop()
+            except Exception as e:
+                logger.debug(f"Stopping step tracing: {e}")
+            self._tracing = False
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
@@ -0,0 +1,37 @@
+"""
+Wait statistics
+Tracks time lost to waits that timed out during the current test
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStats:
+    """Per-test counter of waits that ended in a timeout"""
+
+    def __init__(self):
+        """Initialize empty counters"""
+        self.timed_out_ms = 0.0
+        self.timed_out_count = 0
+
+    def record_timeout(self, elapsed_ms: float, description: str = "") -> None:
+        """
+        Record a wait that timed out
+
+        Args:
+            elapsed_ms: Time spent in the wait in milliseconds
+            description: What was being waited for
+        """
+        self.timed_out_ms += elapsed_ms
+        self.timed_out_count += 1
+        logger.debug(f"Timed-out wait ({elapsed_ms:.0f} ms): {description}")
+
+    def reset(self) -> None:
+        """Reset counters at the start of a test"""
+        self.timed_out_ms = 0.0
+        self.timed_out_count = 0
+
+
+# Single counter per process - each xdist worker runs one test at a time
+wait_stats = WaitStats()